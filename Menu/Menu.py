@@ -1,6 +1,10 @@
 from collections import Counter
 from tabla_principal import mostrar_tabla_acuerdos
 from common import *
+from sql.repositorio import AcuerdosRepository
+from sql.ejecutor import en_segundo_plano
+from sql.cambios import suscribir
+from rutas import MODO_LOCAL
 import sys
 import ctypes
 from ctypes import wintypes
@@ -8,6 +12,8 @@ from tkinter import font
 import logging
 from sql.db import crear_nueva_minuta
 
+INTERVALO_CONFLICTOS_MS = 30000  # Revisión de conflictos del modo sin conexión
+
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -206,41 +212,27 @@ def show_main_menu(db_path):
         "Arredondo Alegret Rafael"
     ]
 
+    # Datos del menú (métricas, tabla de pendientes y usuarios iniciales) en una sola llamada
+    try:
+        datos_menu = AcuerdosRepository(db_path).datos_menu(usuarios_list)
+    except Exception as e:
+        print(f"Error al cargar datos del menú: {e}")
+        datos_menu = None
+
     # Función para verificar si ya existen usuarios
     def check_existing_users():
-        try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM usuarios WHERE nombre IN ({})".format(
-                ','.join(['?'] * len(usuarios_list))), usuarios_list)
-            count = cursor.fetchone()[0]
-            conn.close()
-            return count > 0
-        except Exception as e:
-            print(f"Error al verificar usuarios: {e}")
-            return True
+        return datos_menu.usuarios_cargados if datos_menu else True
 
     # Función para insertar usuarios
     def insert_users():
         try:
             from datetime import datetime
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-
             # Obtener fecha actual y usuario de Windows
             fecha_actual = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             usuario_actual = os.getenv('USERNAME', 'SYSTEM')
 
             # Insertar todos los usuarios
-            cursor.executemany("""
-                INSERT INTO usuarios 
-                (nombre, fecha_registro, usuario_registra, estatus)
-                VALUES (?, ?, ?, 'Activo')
-            """, [(nombre, fecha_actual, usuario_actual) for nombre in usuarios_list])
-
-            conn.commit()
-            conn.close()
+            AcuerdosRepository(db_path).registrar_usuarios(usuarios_list, usuario_actual, fecha_actual)
             insert_button.config(state=tk.DISABLED)
             messagebox.showinfo("Éxito", "Usuarios insertados correctamente")
         except sqlite3.IntegrityError:
@@ -292,84 +284,48 @@ def show_main_menu(db_path):
             "promedio_dias_compromiso": 0
         }
 
-        try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            # 1. Total de acuerdos por estatus
-            cursor.execute("SELECT estatus, COUNT(*) FROM acuerdos GROUP BY estatus")
-            for estatus, count in cursor.fetchall():
-                if estatus == "Activo":
-                    metrics["total_activos"] = count
-                elif estatus == "Editado":
-                    metrics["total_editados"] = count
-                elif estatus == "Cerrado":
-                    metrics["total_cerrados"] = count
-
-            # 2. Responsable más frecuente
-            from sql.querys import usuarios_frecuentes_card
-            cursor.execute(usuarios_frecuentes_card)
-            all_responsables = []
-
-            for (responsables,) in cursor.fetchall():
-                if responsables:
-                    # Separar por comas y limpiar espacios
-                    names = [name.strip() for name in responsables.split(",")]
-                    # Tomar solo el primer nombre (antes del primer espacio)
-                    first_names = [name.split(' ')[0] for name in names]
-                    all_responsables.extend(first_names)
-
-            if all_responsables:
-                counter = Counter(all_responsables)
-                top_responsable = counter.most_common(1)[0]
-                metrics["top_responsable"]["nombre"] = top_responsable[0]
-                metrics["top_responsable"]["count"] = top_responsable[1]
-
-            # 3. Acuerdo más atrasado con texto y responsables
-                cursor.execute("""
-                    SELECT a.acuerdo, a.responsables, 
-                           julianday('now') - julianday(a.fecha_compromiso) as dias_atraso
-                    FROM acuerdos a
-                    WHERE a.estatus IN ('Activo', 'Editado') 
-                      AND a.fecha_compromiso IS NOT NULL
-                      AND julianday(a.fecha_compromiso) < julianday('now')
-                    ORDER BY dias_atraso DESC 
-                    LIMIT 1
-                """)
-            result = cursor.fetchone()
-
-            if result:
-                acuerdo_texto = result[0]
-                responsables = result[1]
-                dias_atraso = int(result[2])
-
-                # Acortar el texto del acuerdo si es muy largo
-                if len(acuerdo_texto) > 30:
-                    acuerdo_texto = acuerdo_texto[:27] + "..."
-
-                # Acortar responsables (tomar solo los primeros 2)
-                if responsables:
-                    responsables_list = [name.strip() for name in responsables.split(",")]
-                    if len(responsables_list) > 2:
-                        responsables = ", ".join(responsables_list[:2]) + "..."
-
-                metrics["acuerdo_mas_atrasado"]["texto"] = acuerdo_texto
-                metrics["acuerdo_mas_atrasado"]["responsables"] = responsables
-                metrics["acuerdo_mas_atrasado"]["dias_atraso"] = dias_atraso
-
-            # 4. Promedio de días para cumplir compromisos
-            cursor.execute("""
-                SELECT AVG(julianday(fecha_compromiso) - julianday(fecha_estatus))
-                FROM acuerdos
-                WHERE estatus = 'Cerrado'
-            """)
-            result = cursor.fetchone()
-            if result and result[0]:
-                metrics["promedio_dias_compromiso"] = int(result[0])
-
-            conn.close()
-        except Exception as e:
-            print(f"Error al cargar métricas: {e}")
+        if not datos_menu:
+            return metrics
+        datos = datos_menu.metricas
+
+        # 1. Total de acuerdos por estatus
+        metrics["total_activos"] = datos.activos
+        metrics["total_editados"] = datos.editados
+        metrics["total_cerrados"] = datos.cerrados
+
+        # 2. Responsable más frecuente
+        counter = Counter()
+        for carga in datos.frecuentes:
+            # Agrupar por primer nombre (antes del primer espacio)
+            counter[carga.nombre.split(' ')[0]] += carga.abiertos
+
+        if counter:
+            top_responsable = counter.most_common(1)[0]
+            metrics["top_responsable"]["nombre"] = top_responsable[0]
+            metrics["top_responsable"]["count"] = top_responsable[1]
+
+        # 3. Acuerdo más atrasado con texto y responsables
+        if datos.mas_atrasado:
+            acuerdo_texto = datos.mas_atrasado.acuerdo
+            responsables = datos.mas_atrasado.responsables
+
+            # Acortar el texto del acuerdo si es muy largo
+            if len(acuerdo_texto) > 30:
+                acuerdo_texto = acuerdo_texto[:27] + "..."
+
+            # Acortar responsables (tomar solo los primeros 2)
+            if responsables:
+                responsables_list = [name.strip() for name in responsables.split(",")]
+                if len(responsables_list) > 2:
+                    responsables = ", ".join(responsables_list[:2]) + "..."
+
+            metrics["acuerdo_mas_atrasado"]["texto"] = acuerdo_texto
+            metrics["acuerdo_mas_atrasado"]["responsables"] = responsables
+            metrics["acuerdo_mas_atrasado"]["dias_atraso"] = datos.mas_atrasado.dias_atraso
+
+        # 4. Promedio de días para cumplir compromisos
+        if datos.promedio_dias:
+            metrics["promedio_dias_compromiso"] = int(datos.promedio_dias)
 
         return metrics
 
@@ -509,85 +465,123 @@ def show_main_menu(db_path):
     metrics_frame = tk.Frame(main_frame, bg=bg_color)
     metrics_frame.pack(fill="x", pady=(0, 20))
 
-    # Obtener datos para las tarjetas
-    metrics = get_metrics_data()
-
-    # Crear tarjetas de métricas
-    # Fila 1
-    card1 = create_metric_card(
-        metrics_frame,
-        "Acuerdos Activos",
-        metrics["total_activos"],
-        "Total de acuerdos pendientes",
-        card_colors["primary"]
-    )
-    card1.grid(row=0, column=0, padx=10, pady=5, sticky="nsew")
-
-    card2 = create_metric_card(
-        metrics_frame,
-        "Acuerdos Editados",
-        metrics["total_editados"],
-        "Total de acuerdos modificados",
-        card_colors["warning"]
-    )
-    card2.grid(row=0, column=1, padx=10, pady=5, sticky="nsew")
-
-    card3 = create_metric_card(
-        metrics_frame,
-        "Acuerdos Cerrados",
-        metrics["total_cerrados"],
-        "Total de acuerdos completados",
-        card_colors["success"]
-    )
-    card3.grid(row=0, column=2, padx=10, pady=5, sticky="nsew")
-
-    # Fila 2
-    card4 = create_metric_card(
-        metrics_frame,
-        "Responsable Frecuente",
-        metrics["top_responsable"]["nombre"],
-        f"Aparece en {metrics['top_responsable']['count']} acuerdos",
-        card_colors["info"]
-    )
-    card4.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
-
-    # Tarjeta de acuerdo atrasado (multilínea)
-    acuerdo_atrasado = metrics["acuerdo_mas_atrasado"]
-    if acuerdo_atrasado["texto"] != "N/A":
-        value_content = [
-            acuerdo_atrasado["texto"],
-            f"Responsables: {acuerdo_atrasado['responsables']}"
-        ]
-        footer_text = f"{acuerdo_atrasado['dias_atraso']} días de atraso"
-    else:
-        value_content = ["No hay acuerdos atrasados"]
-        footer_text = ""
-
-    card5 = create_metric_card(
-        metrics_frame,
-        "Mayor Atraso",
-        value_content,
-        footer_text,
-        card_colors["danger"],
-        height=140
-    )
-    card5.grid(row=1, column=1, padx=10, pady=5, sticky="nsew")
-
-    card6 = create_metric_card(
-        metrics_frame,
-        "Tiempo Promedio",
-        f"{metrics['promedio_dias_compromiso']} días",
-        "Tiempo promedio para cerrar acuerdos",
-        card_colors["primary"]
-    )
-    card6.grid(row=1, column=2, padx=10, pady=5, sticky="nsew")
+    def pintar_tarjetas():
+        """Dibuja (o vuelve a dibujar) las tarjetas con las métricas de datos_menu"""
+        for tarjeta in metrics_frame.winfo_children():
+            tarjeta.destroy()
+
+        # Obtener datos para las tarjetas
+        metrics = get_metrics_data()
+
+        # Crear tarjetas de métricas
+        # Fila 1
+        card1 = create_metric_card(
+            metrics_frame,
+            "Acuerdos Activos",
+            metrics["total_activos"],
+            "Total de acuerdos pendientes",
+            card_colors["primary"]
+        )
+        card1.grid(row=0, column=0, padx=10, pady=5, sticky="nsew")
+
+        card2 = create_metric_card(
+            metrics_frame,
+            "Acuerdos Editados",
+            metrics["total_editados"],
+            "Total de acuerdos modificados",
+            card_colors["warning"]
+        )
+        card2.grid(row=0, column=1, padx=10, pady=5, sticky="nsew")
+
+        card3 = create_metric_card(
+            metrics_frame,
+            "Acuerdos Cerrados",
+            metrics["total_cerrados"],
+            "Total de acuerdos completados",
+            card_colors["success"]
+        )
+        card3.grid(row=0, column=2, padx=10, pady=5, sticky="nsew")
+
+        # Fila 2
+        card4 = create_metric_card(
+            metrics_frame,
+            "Responsable Frecuente",
+            metrics["top_responsable"]["nombre"],
+            f"Aparece en {metrics['top_responsable']['count']} acuerdos",
+            card_colors["info"]
+        )
+        card4.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
+
+        # Tarjeta de acuerdo atrasado (multilínea)
+        acuerdo_atrasado = metrics["acuerdo_mas_atrasado"]
+        if acuerdo_atrasado["texto"] != "N/A":
+            value_content = [
+                acuerdo_atrasado["texto"],
+                f"Responsables: {acuerdo_atrasado['responsables']}"
+            ]
+            footer_text = f"{acuerdo_atrasado['dias_atraso']} días de atraso"
+        else:
+            value_content = ["No hay acuerdos atrasados"]
+            footer_text = ""
+
+        card5 = create_metric_card(
+            metrics_frame,
+            "Mayor Atraso",
+            value_content,
+            footer_text,
+            card_colors["danger"],
+            height=140
+        )
+        card5.grid(row=1, column=1, padx=10, pady=5, sticky="nsew")
+
+        card6 = create_metric_card(
+            metrics_frame,
+            "Tiempo Promedio",
+            f"{metrics['promedio_dias_compromiso']} días",
+            "Tiempo promedio para cerrar acuerdos",
+            card_colors["primary"]
+        )
+        card6.grid(row=1, column=2, padx=10, pady=5, sticky="nsew")
+
+        # Configurar peso de columnas
+        for i in range(3):
+            metrics_frame.columnconfigure(i, weight=1)
 
-    # Configurar peso de columnas
-    for i in range(3):
-        metrics_frame.columnconfigure(i, weight=1)
+    pintar_tarjetas()
 
     # Mostrar tabla de acuerdos activos
-    mostrar_tabla_acuerdos(main_frame, db_path)
+    refrescar_tabla = mostrar_tabla_acuerdos(main_frame, db_path, datos_menu.pendientes if datos_menu else None)
+
+    def mostrar_datos_menu(datos):
+        """Repinta tarjetas y tabla con los datos releídos tras un cambio en la minuta"""
+        nonlocal datos_menu
+        datos_menu = datos
+        pintar_tarjetas()
+        if refrescar_tabla:
+            refrescar_tabla(datos.pendientes)
+
+    # Cuando alguien más modifica la minuta se releen los datos del menú (sin temporizador ciego)
+    suscribir(metrics_frame, db_path, lambda: en_segundo_plano(
+        metrics_frame, AcuerdosRepository(db_path).datos_menu, usuarios_list, clave=("datos_menu", db_path),
+        indicador=False, al_terminar=mostrar_datos_menu))
+
+    # Modo sin conexión: las ediciones que no se pudieron subir por conflicto se avisan al usuario
+    def avisar_conflictos(conflictos):
+        if conflictos:
+            detalle = "\n".join(f"- {operacion} ({detectado}): {motivo}"
+                                 for operacion, _parametros, detectado, motivo in conflictos)
+            messagebox.showwarning(
+                "Cambios no sincronizados",
+                f"Estos cambios hechos sin conexión no se guardaron en la minuta compartida:\n\n{detalle}")
+
+    def revisar_conflictos():
+        from sql.replica import replica_de
+        en_segundo_plano(metrics_frame, replica_de(db_path).conflictos_sin_avisar,
+                         clave=("conflictos", db_path), indicador=False, al_terminar=avisar_conflictos)
+        metrics_frame.after(INTERVALO_CONFLICTOS_MS, revisar_conflictos)
+
+    if MODO_LOCAL:
+        revisar_conflictos()
 
     # Marco contenedor para los tres botones (centrado)
     buttons_container = tk.Frame(main_frame, bg=bg_color)
@@ -0,0 +1,117 @@
+# acuerdos/bench_formato.py
+"""Benchmark del formato de filas de acuerdos con y sin la caché por (id, versión).
+
+Uso:  python -m acuerdos.bench_formato [--filas 20000] [--repeticiones 5] [--editadas 0.01]
+
+Genera una minuta sintética en un directorio temporal, lee sus acuerdos como los
+lee la lista y mide el costo por fila de formatear_acuerdo sin caché, en la
+primera carga (todo se formatea y se guarda), en una recarga (todo sale de la
+caché) y en una recarga después de editar una fracción de los acuerdos.
+"""
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from acuerdos.formato_filas import formatear_acuerdo
+from sql.repositorio import Acuerdo
+
+PALABRAS = ("revisar", "entregar", "reporte", "mensual", "proveedor", "calidad", "línea", "producción",
+            "mantenimiento", "seguimiento", "auditoría", "inventario", "cliente", "presupuesto", "turno")
+NOMBRES = ("Ana María López Pérez", "Juan Carlos Ramírez Soto", "Luis Fernando Gómez Ruiz",
+           "María José Hernández Díaz", "Pedro Antonio Castillo Vega", "General")
+ESTATUS = ("Activo", "Editado", "Cerrado")
+
+
+def generar_minuta(ruta, num_filas, semilla=7):
+    """Minuta sintética con num_filas acuerdos de texto, responsables y fechas variados"""
+    azar = random.Random(semilla)
+    texto = lambda minimo, maximo: " ".join(azar.choice(PALABRAS) for _ in range(azar.randint(minimo, maximo)))
+    fecha = lambda: f"2024-{azar.randint(1, 12):02d}-{azar.randint(1, 28):02d}"
+    conn = sqlite3.connect(ruta)
+    conn.execute("""
+        CREATE TABLE acuerdos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_acuerdo TEXT, acuerdo TEXT, responsables TEXT, fecha_estatus TEXT, estatus TEXT,
+            fecha_compromiso TEXT, comentarios TEXT, accion TEXT, version INTEGER NOT NULL DEFAULT 0
+        )""")
+    conn.executemany(
+        "INSERT INTO acuerdos (id_acuerdo, acuerdo, responsables, fecha_estatus, estatus, fecha_compromiso,"
+        " comentarios, accion, version) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        ((f"AC-{n:05d}", texto(8, 60), ", ".join(azar.sample(NOMBRES, azar.randint(1, 3))),
+          f"{fecha()} {azar.randint(7, 18):02d}:{azar.randint(0, 59):02d}:00", azar.choice(ESTATUS), fecha(),
+          texto(0, 30) or None, None, n + 1)
+         for n in range(num_filas)))
+    conn.commit()
+    conn.close()
+
+
+def leer(ruta):
+    conn = sqlite3.connect(ruta)
+    try:
+        return [Acuerdo(*fila) for fila in conn.execute(
+            """SELECT id_acuerdo, acuerdo, responsables, fecha_estatus, estatus, fecha_compromiso,
+                      comentarios, accion, version FROM acuerdos ORDER BY id""")]
+    finally:
+        conn.close()
+
+
+def medir(formatear, filas, repeticiones):
+    """Microsegundos por fila (la mejor de las repeticiones)"""
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for fila in filas:
+            formatear(fila)
+        transcurrido = time.perf_counter() - inicio
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    return mejor * 1e6 / len(filas)
+
+
+def main(num_filas=20000, repeticiones=5, editadas=0.01):
+    directorio = tempfile.mkdtemp(prefix="bench_formato_")
+    ruta = os.path.join(directorio, "minuta.db")
+    cache = formatear_acuerdo.cache
+    try:
+        print(f"Generando minuta con {num_filas} acuerdos...", flush=True)
+        generar_minuta(ruta, num_filas)
+        filas = leer(ruta)
+
+        sin_cache = medir(formatear_acuerdo.__wrapped__, filas, repeticiones)
+
+        cache.limpiar()
+        primera = medir(formatear_acuerdo, filas, 1)
+        recarga = medir(formatear_acuerdo, filas, repeticiones)
+
+        # Se editan algunas filas: cambia su versión y solo esas se vuelven a formatear
+        azar = random.Random(11)
+        tope = max(fila.version for fila in filas)
+        for posicion in azar.sample(range(len(filas)), int(len(filas) * editadas)):
+            tope += 1
+            filas[posicion] = filas[posicion]._replace(acuerdo=filas[posicion].acuerdo + " (editado)",
+                                                       version=tope)
+        tras_editar = medir(formatear_acuerdo, filas, 1)
+
+        iguales = all(formatear_acuerdo(fila) == formatear_acuerdo.__wrapped__(fila) for fila in filas)
+
+        print(f"\n{'formato por fila':<36}{'µs/fila':>10}{'total':>12}")
+        for nombre, us in (("sin caché", sin_cache), ("con caché, primera carga", primera),
+                           ("con caché, recarga", recarga),
+                           (f"con caché, tras editar {editadas:.0%}", tras_editar)):
+            print(f"{nombre:<36}{us:>10.2f}{us * num_filas / 1000:>9.1f} ms")
+        print(f"\nFilas en caché: {len(cache)}  aciertos: {cache.aciertos}  fallos: {cache.fallos}")
+        print(f"Formato en caché igual al formato directo: {'sí' if iguales else 'NO'}")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    argumentos = dict(zip(sys.argv[1::2], sys.argv[2::2]))
+    main(
+        int(argumentos.get("--filas", 20000)),
+        int(argumentos.get("--repeticiones", 5)),
+        float(argumentos.get("--editadas", 0.01)),
+    )
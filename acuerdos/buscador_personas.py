@@ -0,0 +1,41 @@
+# acuerdos/buscador_personas.py
+"""Buscadores de responsables sobre el índice de personas de la minuta.
+
+El filtro se aplica cuando se deja de escribir (no en cada tecla) y busca en el
+IndicePersonas ya leído, así que escribir en el buscador no toca la base. Si otro
+usuario modifica la minuta, el índice se vuelve a leer en segundo plano.
+"""
+from sql.cambios import suscribir
+from sql.ejecutor import en_segundo_plano
+from sql.repositorio import AcuerdosRepository, invalidar_indice_personas
+
+ESPERA_MS = 150     # Pausa al escribir antes de filtrar
+
+
+def al_escribir(widget, variable, filtrar, espera_ms=ESPERA_MS):
+    """Llama a filtrar() una vez que se deja de escribir en variable por espera_ms"""
+    pendiente = None
+
+    def ejecutar():
+        nonlocal pendiente
+        pendiente = None
+        if widget.winfo_exists():  # La ventana pudo cerrarse durante la espera
+            filtrar()
+
+    def programar(*args):
+        nonlocal pendiente
+        if pendiente is not None:
+            widget.after_cancel(pendiente)
+        pendiente = widget.after(espera_ms, ejecutar)
+
+    variable.trace_add("write", programar)
+
+
+def vigilar_personas(widget, db_path, al_recargar):
+    """Vuelve a leer el índice cuando otro usuario modifica la minuta y lo pasa a al_recargar"""
+    def recargar():
+        invalidar_indice_personas(db_path)
+        en_segundo_plano(widget, AcuerdosRepository(db_path).indice_personas,
+                         clave=("personas", str(widget)), al_terminar=al_recargar, indicador=False)
+
+    suscribir(widget, db_path, recargar)
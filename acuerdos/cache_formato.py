@@ -0,0 +1,75 @@
+# acuerdos/cache_formato.py
+"""Caché LRU del formato de las filas que se muestran en los Treeview.
+
+Cada página, recarga o cambio vuelve a formatear filas que en su mayoría no
+cambiaron (texto con saltos de línea, nombres abreviados, fechas). Con
+
+    @en_cache(lambda fila: (fila.id_acuerdo, fila.version))
+    def formatear(fila): ...
+
+el resultado se guarda por (id, versión): la versión cambia en cada edición, así
+que una fila editada se vuelve a formatear. Antes de reutilizar se compara la
+fila leída con la guardada, para que dos minutas con el mismo id y versión (o
+valores que dependen del día, como los días restantes) no compartan formato.
+"""
+import functools
+import threading
+from collections import OrderedDict
+
+MAX_FILAS = 20000   # Filas formateadas que conserva cada caché
+
+
+class CacheFormato:
+    """LRU acotado de clave -> (fila, formato); se usa desde el ejecutor y desde Tk"""
+
+    def __init__(self, maximo=MAX_FILAS):
+        self.maximo = maximo
+        self.aciertos = 0
+        self.fallos = 0
+        self._filas = OrderedDict()
+        self._candado = threading.Lock()
+
+    def obtener(self, clave, fila, formatear):
+        """Formato guardado de la fila, o formatear(fila) si no está (o la fila cambió)"""
+        with self._candado:
+            guardada = self._filas.get(clave)
+            if guardada is not None and guardada[0] == fila:
+                self._filas.move_to_end(clave)
+                self.aciertos += 1
+                return guardada[1]
+        formato = formatear(fila)
+        with self._candado:
+            self.fallos += 1
+            self._filas[clave] = (fila, formato)
+            self._filas.move_to_end(clave)
+            if len(self._filas) > self.maximo:
+                self._filas.popitem(last=False)
+        return formato
+
+    def limpiar(self):
+        with self._candado:
+            self._filas.clear()
+            self.aciertos = self.fallos = 0
+
+    def __len__(self):
+        return len(self._filas)
+
+
+def en_cache(clave_de, maximo=MAX_FILAS):
+    """Decorador: guarda el formato de cada fila por clave_de(fila) (None = no guardar).
+
+    La función decorada conserva la original en __wrapped__ y su caché en cache.
+    """
+    def decorador(formatear):
+        cache = CacheFormato(maximo)
+
+        @functools.wraps(formatear)
+        def envoltura(fila):
+            clave = clave_de(fila)
+            if clave is None or None in clave:
+                return formatear(fila)  # Fila sin versión: no hay cómo saber si cambió
+            return cache.obtener(clave, fila, formatear)
+
+        envoltura.cache = cache
+        return envoltura
+    return decorador
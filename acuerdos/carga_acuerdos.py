@@ -1,151 +1,22 @@
 from common import *
-from acuerdos.formato_texto import formatear_texto
+from sql.repositorio import AcuerdosRepository, FiltrosAcuerdos
+from acuerdos.formato_filas import formatear_acuerdo
 from acuerdos.cerrar_2 import cerrar_acuerdo_seleccionado
+from acuerdos.lista_virtual import ListaVirtual, formateada
 
 
-def abreviar_nombres(nombres_completos):
-    """Abrevia los nombres a primer nombre + primera letra del segundo"""
-    if not nombres_completos:
-        return ""
-
-    nombres = nombres_completos.split(',')
-    nombres_abreviados = []
-
-    for nombre in nombres:
-        nombre = nombre.strip()
-        partes = nombre.split()
-
-        if len(partes) == 0:
-            continue
-        elif len(partes) == 1:
-            # Solo tiene un nombre
-            nombres_abreviados.append(partes[0])
-        else:
-            # Primer nombre + primera letra del segundo
-            abreviado = f"{partes[0]} {partes[1][0]}."
-            nombres_abreviados.append(abreviado)
-
-    return ', '.join(nombres_abreviados)
-
 def load_acuerdos(acuerdos_tree, db_path, id_filter, text_filter, resp_filter, date_from, date_to, status_filter):
-    """Carga los acuerdos principales según los filtros aplicados."""
-
-    # Limpiar TreeView
-    acuerdos_tree.delete(*acuerdos_tree.get_children())
-
-    # Consulta base
-    query = """
-        SELECT 
-            id_acuerdo, 
-            acuerdo, 
-            responsables, 
-            fecha_estatus, 
-            estatus,
-            fecha_compromiso,
-            comentarios,
-            accion
-        FROM acuerdos 
-        WHERE 1=1
-    """
-    params = []
-
-    # Filtros dinámicos
-    if id_filter.get():
-        query += " AND id_acuerdo LIKE ?"
-        params.append(f"%{id_filter.get()}%")
-
-    if text_filter.get():
-        query += " AND acuerdo LIKE ?"
-        params.append(f"%{text_filter.get()}%")
-
-    if resp_filter.get():
-        query += " AND responsables LIKE ?"
-        params.append(f"%{resp_filter.get()}%")
-
-    if date_from.get():
-        query += " AND fecha_estatus >= ?"
-        params.append(date_from.get())
-
-    if date_to.get():
-        query += " AND fecha_estatus <= ?"
-        params.append(date_to.get())
-
-    if status_filter.get() != "Todos":
-        query += " AND estatus = ?"
-        params.append(status_filter.get())
+    """Carga los acuerdos principales según los filtros aplicados.
 
-    # Orden por prioridad de estatus y fecha de compromiso
-    query += """
-        ORDER BY 
-            CASE 
-                WHEN estatus = 'Editado' THEN 1 
-                WHEN estatus = 'Activo' THEN 2
-                WHEN estatus = 'Cerrado' THEN 3
-                ELSE 4
-            END ASC,
-            fecha_compromiso ASC
+    La tabla es virtual: las páginas se leen en segundo plano a medida que se
+    desplaza y solo las filas cercanas a las visibles existen en el Treeview.
     """
-
-    try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-
-        for row in cursor.fetchall():
-            # row: [0=id, 1=acuerdo, 2=responsables, 3=fecha_estatus, 4=estatus, 5=fecha_compromiso, 6=comentarios]
-            formatted_row = list(row)
-
-            # Formatear fechas
-            try:
-                if formatted_row[3]:  # fecha_estatus
-                    formatted_row[3] = datetime.strptime(formatted_row[3], "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y %H:%M")
-            except:
-                pass
-
-            try:
-                if formatted_row[5]:  # fecha_compromiso
-                    formatted_row[5] = datetime.strptime(formatted_row[5], "%Y-%m-%d").strftime("%d/%m/%Y")
-            except:
-                pass
-            try:
-                # Determinar el texto y tag para la columna de acción
-                if row[4] == "Cerrado":  # row[4] es el estatus
-                    accion_text = "Cerrado"
-                    tags = ('cerrado',)
-                else:
-                    accion_text = "Cerrar"
-                    tags = ('cerrable',)
-
-                # Insertar fila con los datos
-                tree.insert("", "end", values=row + (accion_text,), tags=tags)
-            except:
-
-                pass
-
-            # Formatear campos largos
-            formatted_row[1] = formatear_texto(formatted_row[1])  # acuerdo
-            #formatted_row[2] = formatear_texto(formatted_row[2])  # responsables
-            formatted_row[2] = abreviar_nombres(formatted_row[2])  # responsables abreviados
-
-            formatted_row[4] = formatear_texto(formatted_row[4])  # accion
-            formatted_row[6] = formatear_texto(formatted_row[6] if formatted_row[6] else "")  # comentarios
-
-            # Determinar texto de acción y tags
-            if row[4] == "Cerrado":  # row[4] es el estatus
-                accion_text = "Cerrado"
-                tags = ('cerrado', 'no_underline')  # Agregamos tag adicional
-            else:
-                accion_text = "Cerrar"
-                tags = ('cerrable', 'no_underline')  # Agregamos tag adicional
-
-            # Añadir la columna de acción al final de los valores
-            values_to_insert = formatted_row + [accion_text]
-
-            # Insertar en el Treeview
-            item_id = acuerdos_tree.insert("", "end", values=values_to_insert, tags=tags)
-            acuerdos_tree.item(item_id, tags=tags + ('wraptext', 'no_underline'))
-
-        conn.close()
-
-    except Exception as e:
-        messagebox.showerror("Error", f"No se pudieron cargar los acuerdos: {e}")
+    filtros = FiltrosAcuerdos(id_filter.get(), text_filter.get(), resp_filter.get(),
+                              date_from.get(), date_to.get(), status_filter.get())
+    repositorio = AcuerdosRepository(db_path)
+
+    ListaVirtual.de(acuerdos_tree).mostrar(
+        formateada(lambda despues, limite: repositorio.pagina_acuerdos(filtros, despues, limite),
+                   formatear_acuerdo),
+        al_fallar=lambda e: messagebox.showerror("Error", f"No se pudieron cargar los acuerdos: {e}"),
+        cambios=formateada(lambda marca: repositorio.cambios_acuerdos(filtros, marca), formatear_acuerdo))
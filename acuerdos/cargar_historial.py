@@ -1,10 +1,71 @@
 from common import *
+from sql.repositorio import AcuerdosRepository
 from acuerdos.formato_texto import formatear_texto
+from acuerdos.formato_fechas import fecha_corta, fecha_hora_corta
+from sql.ejecutor import en_segundo_plano, obtener_ejecutor
+from acuerdos.diff_historial import cambios_desde_mascara, tags_por_version
 
+# Columna de la base que muestra cada columna del historial_tree (para la máscara de cambios)
+CAMPOS_HISTORIAL = (None, None, "estatus", "acuerdo", "responsables", "fecha_compromiso", "comentarios")
+
+
+def filas_historial(db_path, id_acuerdo):
+    """Lee y formatea el historial de un acuerdo (corre en el hilo del ejecutor, sin tocar Tk)"""
+    return formatear_historial(AcuerdosRepository(db_path).historial(id_acuerdo))
+
+
+def formatear_historial(datos):
+    """Filas (values, tags) del historial_tree para un HistorialAcuerdo, ya resaltadas"""
+    filas = []
+    current = datos.actual
+    if current:
+        # Formatear fechas
+        formatted_current = list(current[:7])
+
+        # Formatear fecha de estatus y fecha compromiso
+        formatted_current[0] = fecha_hora_corta(formatted_current[0])
+        formatted_current[5] = fecha_corta(formatted_current[5])
+
+        # Formatear comentarios
+        formatted_current[6] = formatear_texto(formatted_current[6] if formatted_current[6] else "")
+
+        filas.append((formatted_current, ('current',)))
+
+    historial_rows = datos.versiones
+
+    for idx, row in enumerate(historial_rows):
+        formatted_row = list(row[:7])
+
+        # Formatear fecha de modificación y fecha compromiso
+        formatted_row[0] = fecha_hora_corta(formatted_row[0])
+        formatted_row[5] = fecha_corta(formatted_row[5])
+
+        # Formatear texto
+        if formatted_row[3]:
+            formatted_row[3] = formatear_texto(formatted_row[3])  # acuerdo
+        if formatted_row[6]:
+            formatted_row[6] = formatear_texto(formatted_row[6])  # comentarios
+
+        # Si es la última modificación (la más antigua)
+        if idx == len(historial_rows) - 1:
+            formatted_row[1] = datos.usuario_registra  # Usar el usuario_registra del acuerdo
+
+        filas.append((formatted_row, ()))
+
+    if any(row.cambios is None for row in historial_rows):
+        return resaltar_versiones(filas)  # Historial sin máscara: se comparan las versiones
+
+    # Cada fila se marca con lo que cambió la escritura registrada en la siguiente (más antigua)
+    mascaras = ([None] if current else []) + [(row.cambios, row.delta) for row in historial_rows]
+    resaltadas = []
+    for (values, tags), siguiente in zip(filas, mascaras[1:] + [None]):
+        tag = cambios_desde_mascara(*siguiente, CAMPOS_HISTORIAL)[0] if siguiente else None
+        resaltadas.append((values, (tag,) if tag else tags))
+    return resaltadas
 
 
 def load_historial(event, acuerdos_tree, historial_tree, historial_label, db_path):
-    """Carga el historial del acuerdo seleccionado"""
+    """Carga el historial del acuerdo seleccionado (lectura en segundo plano)"""
     selected = acuerdos_tree.focus()
     if not selected:
         return
@@ -19,163 +80,53 @@ def load_historial(event, acuerdos_tree, historial_tree, historial_label, db_pat
     for item in historial_tree.get_children():
         historial_tree.delete(item)
 
-    try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Obtener el usuario_registra del acuerdo
-        cursor.execute(
-            "SELECT usuario_registra FROM acuerdos WHERE id_acuerdo = ?",
-            (id_acuerdo,)
-        )
-        usuario_registra = cursor.fetchone()[0]
-
-        # Obtener versión actual
-        cursor.execute(
-            """SELECT 
-                a.fecha_estatus, 
-                COALESCE(
-                    (SELECT ha.usuario_modifico 
-                     FROM historial_acuerdos ha 
-                     WHERE ha.id_acuerdo = a.id_acuerdo 
-                     ORDER BY ha.fecha_modificacion DESC 
-                     LIMIT 1),
-                    a.usuario_registra
-                ) as ultimo_usuario,
-                a.estatus,
-                a.acuerdo,
-                a.responsables,
-                a.fecha_compromiso,
-                a.comentarios
-               FROM acuerdos a
-               WHERE a.id_acuerdo = ?""",
-            (id_acuerdo,)
-        )
-        current = cursor.fetchone()
-        if current:
-            # Formatear fechas
-            formatted_current = list(current)
-
-            # Formatear fecha de estatus
-            if formatted_current[0]:
-                formatted_current[0] = datetime.strptime(formatted_current[0], "%Y-%m-%d %H:%M:%S").strftime(
-                    "%d/%m/%Y %H:%M")
-
-            # Formatear fecha compromiso
-            if formatted_current[5]:
-                formatted_current[5] = datetime.strptime(formatted_current[5], "%Y-%m-%d").strftime("%d/%m/%Y")
-
-            # Formatear comentarios
-            formatted_current[6] = formatear_texto(formatted_current[6] if formatted_current[6] else "")
-
-            historial_tree.insert("", "end", values=formatted_current, tags=('current',))
-
-        # Obtener historial
-        cursor.execute(
-            """SELECT 
-                fecha_modificacion, 
-                usuario_modifico, 
-                estatus,
-                acuerdo,
-                responsables,
-                fecha_compromiso,
-                comentarios
-               FROM historial_acuerdos 
-               WHERE id_acuerdo = ? 
-               ORDER BY fecha_modificacion DESC""",
-            (id_acuerdo,)
-        )
-
-        historial_rows = cursor.fetchall()
-
-        for idx, row in enumerate(historial_rows):
-            formatted_row = list(row)
-
-            # Formatear fecha de modificación
-            if formatted_row[0]:
-                formatted_row[0] = datetime.strptime(formatted_row[0], "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y %H:%M")
-
-            # Formatear fecha compromiso si existe
-            if formatted_row[5]:
-                formatted_row[5] = datetime.strptime(formatted_row[5], "%Y-%m-%d").strftime("%d/%m/%Y")
-
-            # Formatear texto
-            if formatted_row[3]:
-                formatted_row[3] = formatear_texto(formatted_row[3])  # acuerdo
-            if formatted_row[6]:
-                formatted_row[6] = formatear_texto(formatted_row[6])  # comentarios
-
-            # Si es la última modificación (la más antigua)
-            if idx == len(historial_rows) - 1:
-                formatted_row[1] = usuario_registra  # Usar el usuario_registra del acuerdo
-
-            historial_tree.insert("", "end", values=formatted_row)
-
-        conn.close()
+    def mostrar(filas):
+        # Las filas llegan ya resaltadas (máscara de cambios o comparación de versiones)
+        historial_tree._versiones = filas
+        for values, tags in filas:
+            historial_tree.insert("", "end", values=values, tags=tags)
 
         # Ajustar altura del treeview según el número de registros
         num_items = len(historial_tree.get_children())
         historial_tree.configure(height=min(max(num_items, 5), 10))  # Mínimo 5, máximo 10 filas
 
-        # Resaltar diferencias automáticamente para la primera versión
-        if historial_tree.get_children():
-            highlight_changes(None, historial_tree)
-
-    except Exception as e:
-        messagebox.showerror("Error", f"No se pudo cargar el historial: {e}")
-
+    # Precargado junto con las filas visibles: se muestra sin tocar la base
+    clave = ("historial", str(historial_tree))
+    datos = AcuerdosRepository(db_path).historial_en_cache(id_acuerdo)
+    if datos is not None:
+        obtener_ejecutor().cancelar(clave)  # Una lectura anterior ya no debe reemplazarlo
+        mostrar(formatear_historial(datos))
+        return
 
-def highlight_changes(event, historial_tree):
-    """Resalta los cambios entre versiones en el historial"""
-    # Limpiar tags anteriores
-    for item in historial_tree.get_children():
-        for col in historial_tree["columns"]:
-            historial_tree.set(item, col, historial_tree.set(item, col))
+    # Al recorrer la tabla con el teclado solo se muestra el último acuerdo seleccionado
+    en_segundo_plano(
+        historial_tree, filas_historial, db_path, id_acuerdo,
+        clave=clave, al_terminar=mostrar,
+        al_fallar=lambda e: messagebox.showerror("Error", f"No se pudo cargar el historial: {e}"))
 
-    # No hay nada que comparar si solo hay un item
-    if len(historial_tree.get_children()) <= 1:
-        return
 
-    # Verificar si hay algún cambio en cualquier versión
-    has_changes = False
-    items = historial_tree.get_children()
+def precargar_historial(acuerdos_tree, db_path):
+    """Lee en un solo lote el historial de las filas materializadas que aún no está en caché"""
+    repositorio = AcuerdosRepository(db_path)
+    ids = [acuerdos_tree.item(item, "values")[0] for item in acuerdos_tree.get_children()]
+    faltan = [i for i in ids if repositorio.historial_en_cache(i) is None]
+    if faltan:
+        # Al desplazarse, el lote nuevo reemplaza al que aún no empieza
+        en_segundo_plano(acuerdos_tree, repositorio.historiales, faltan,
+                         clave=("historial_precarga", str(acuerdos_tree)), indicador=False)
 
-    # Primera pasada: verificar si hay algún cambio
-    for i in range(len(items) - 1):
-        current_item = items[i]
-        previous_item = items[i + 1]
 
-        for col in historial_tree["columns"]:
-            current_val = historial_tree.set(current_item, col)
-            previous_val = historial_tree.set(previous_item, col)
+def resaltar_versiones(filas):
+    """(values, tags) con el tag de cambio de cada versión frente a la anterior (sin consultar Tk)"""
+    tags_cambio = tags_por_version([values for values, _ in filas])
+    return [(values, (tag,) if tag else tags) for (values, tags), tag in zip(filas, tags_cambio)]
 
-            if current_val != previous_val:
-                has_changes = True
-                break
-        if has_changes:
-            break
 
-    # Si no hay cambios, salir de la función
-    if not has_changes:
+def highlight_changes(event, historial_tree):
+    """Resalta los cambios entre versiones en el historial (calculados al cargarlo)"""
+    items = historial_tree.get_children()
+    filas = getattr(historial_tree, "_versiones", [])
+    if len(items) != len(filas):
         return
-
-    # Segunda pasada: aplicar el resaltado solo si hay cambios
-    for i in range(len(items) - 1):
-        current_item = items[i]
-        previous_item = items[i + 1]
-
-        for col in historial_tree["columns"]:
-            current_val = historial_tree.set(current_item, col)
-            previous_val = historial_tree.set(previous_item, col)
-
-            if current_val != previous_val:
-                # Determinar tipo de cambio
-                if not previous_val and current_val:
-                    # Nuevo valor (adición)
-                    historial_tree.item(current_item, tags=('added',))
-                elif previous_val and not current_val:
-                    # Valor eliminado
-                    historial_tree.item(current_item, tags=('removed',))
-                else:
-                    # Valor modificado
-                    historial_tree.item(current_item, tags=('changed',))
\ No newline at end of file
+    for item, (values, tags) in zip(items, filas):
+        historial_tree.item(item, tags=tags)
@@ -1,37 +1,26 @@
 from common import *
+from sql.repositorio import AcuerdosRepository, MasterRepository
 from acuerdos.center_window import center_window
-import sqlite3
+from acuerdos.lista_virtual import actualizar_lista
 import os
 import shutil
 import getpass
 from datetime import datetime
 from tkinter import filedialog, messagebox
 import tkinter as tk
-from rutas import MASTER
 
 
 
 def obtener_info_db(db_path):
     """Obtiene información de la base de datos desde MASTER"""
     try:
-        conn = sqlite3.connect(MASTER)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """SELECT usuario_windows, objetivo, asuntos 
-               FROM dbs 
-               WHERE direccion = ? 
-               LIMIT 1""",
-            (db_path,)
-        )
-        resultado = cursor.fetchone()
-        conn.close()
+        info = MasterRepository().info_db(db_path)
 
-        if resultado:
+        if info:
             from nombre_windows import obtener_nombre_completo_en_dominio
             import win32api
 
-            usuario_windows = resultado[0]
+            usuario_windows = info.usuario_windows
             dominio = win32api.GetDomainName()
             nombre_completo = obtener_nombre_completo_en_dominio(usuario_windows, dominio)
             print(nombre_completo)
@@ -39,8 +28,8 @@ def obtener_info_db(db_path):
             return {
                 'usuario_windows': usuario_windows,
                 'nombre_completo': nombre_completo,
-                'objetivo': resultado[1],
-                'asuntos': resultado[2]
+                'objetivo': info.objetivo,
+                'asuntos': info.asuntos
             }
         return None
     except Exception as e:
@@ -50,21 +39,10 @@ def obtener_info_db(db_path):
 def obtener_db_name(db_path):
     """Obtiene información de la base de datos desde MASTER y formatea el nombre"""
     try:
-        conn = sqlite3.connect(MASTER)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """SELECT db_name
-               FROM dbs 
-               WHERE direccion = ? 
-               LIMIT 1""",
-            (db_path,)
-        )
-        resultado = cursor.fetchone()
-        conn.close()
+        info = MasterRepository().info_db(db_path)
 
-        if resultado:
-            nombre_db = resultado[0]
+        if info:
+            nombre_db = info.db_name
             print("Nombre original:", nombre_db)
 
             # Formatear el nombre:
@@ -255,16 +233,10 @@ def cerrar_acuerdo_seleccionado(id_acuerdo, tree=None, db_path=None):
                 return
 
         try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
+            repositorio = AcuerdosRepository(db_path)
 
             # Obtener información del acuerdo
-            cursor.execute(
-                """SELECT acuerdo, responsables, fecha_compromiso, fecha_registro 
-                   FROM acuerdos WHERE id_acuerdo = ?""",
-                (id_acuerdo,)
-            )
-            acuerdo_data = cursor.fetchone()
+            acuerdo_data = repositorio.datos_cierre(id_acuerdo)
 
             if not acuerdo_data:
                 raise Exception("No se encontró el acuerdo")
@@ -311,53 +283,18 @@ def cerrar_acuerdo_seleccionado(id_acuerdo, tree=None, db_path=None):
                 comentarios, files_to_upload, base_path, db_path
             )
 
-            # 1. Guardar en historial
-            cursor.execute(
-                """INSERT INTO historial_acuerdos 
-                (id_acuerdo, acuerdo, responsables, fecha_compromiso, 
-                 fecha_modificacion, usuario_modifico, estatus, comentarios_cierre, ruta_pdf)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    id_acuerdo,
-                    acuerdo_text,
-                    responsables,
-                    fecha_comp,
-                    fecha_cierre.strftime("%Y-%m-%d %H:%M:%S"),
-                    getpass.getuser(),
-                    "Cerrado",
-                    comentarios,
-                    pdf_path
-                )
+            # Guardar en historial y actualizar estatus a "Cerrado"
+            repositorio.cerrar_acuerdo(
+                id_acuerdo=id_acuerdo,
+                fecha_cierre=fecha_cierre.strftime("%Y-%m-%d %H:%M:%S"),
+                usuario=getpass.getuser(),
+                comentarios=comentarios,
+                ruta_pdf=pdf_path
             )
 
-            # 2. Actualizar estatus a "Cerrado"
-            cursor.execute(
-                """UPDATE acuerdos 
-                SET estatus = 'Cerrado',
-                    fecha_estatus = ?,
-                    usuario_registra = ?,
-                    comentarios_cierre = ?
-                WHERE id_acuerdo = ?""",
-                (
-                    fecha_cierre.strftime("%Y-%m-%d %H:%M:%S"),
-                    getpass.getuser(),
-                    comentarios,
-                    id_acuerdo
-                )
-            )
-
-            conn.commit()
-            conn.close()
-
-            # Actualizar el Treeview si se proporcionó
+            # Actualizar el Treeview si se proporcionó (solo las filas que cambiaron)
             if tree:
-                for item in tree.get_children():
-                    if tree.item(item, "values")[0] == str(id_acuerdo):
-                        values = list(tree.item(item, "values"))
-                        values[4] = "Cerrado"  # Actualizar estatus
-                        tree.item(item, values=values)
-                        tree.item(item, tags=('cerrado',))
-                        break
+                actualizar_lista(tree)
 
             details_window.destroy()
             #messagebox.showinfo("Éxito", f"Acuerdo {id_acuerdo} cerrado correctamente")
@@ -0,0 +1,108 @@
+# acuerdos/diff_historial.py
+"""Diferencias entre versiones del historial, calculadas en Python sobre las filas leídas.
+
+Las pantallas de historial comparaban celda por celda con Treeview.set() (una
+llamada a Tk por columna y por item) y el texto carácter por carácter. Aquí se
+compara cada versión con la anterior a partir de sus valores y el texto se
+compara por palabras: se recortan el inicio y el final comunes y, si lo que queda
+sigue siendo muy largo, se marca como un solo reemplazo. El resultado de cada par
+de textos se guarda, así que volver a seleccionar una versión no lo recalcula.
+
+Las filas escritas con la máscara cambios (y su delta) ni siquiera se comparan:
+cambios_desde_mascara indica qué columnas marcar a partir de esos datos.
+"""
+import json
+import re
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from sql.migraciones import CAMBIOS_HISTORIAL
+
+MAX_PALABRAS = 300      # Palabras (por lado) que se comparan con SequenceMatcher
+MAX_PARES = 1024        # Pares de textos cuyo diff se conserva
+
+AGREGADO, ELIMINADO, MODIFICADO = "added", "removed", "changed"
+
+_PALABRAS = re.compile(r"\s+|\S+")
+
+
+def _texto(valor):
+    """Valor de una celda tal como lo muestra el Treeview"""
+    return "" if valor is None else str(valor)
+
+
+def tipo_cambio(anterior, actual):
+    """AGREGADO, ELIMINADO o MODIFICADO entre dos valores (None si son iguales)"""
+    anterior, actual = _texto(anterior), _texto(actual)
+    if anterior == actual:
+        return None
+    if not anterior:
+        return AGREGADO
+    if not actual:
+        return ELIMINADO
+    return MODIFICADO
+
+
+def comparar_versiones(actual, anterior):
+    """(tag, {columna: tipo de cambio}) de una versión frente a la anterior.
+
+    Como antes, el tag es el de la última columna que cambió (None si ninguna).
+    """
+    tag, cambios = None, {}
+    for columna, (nuevo, viejo) in enumerate(zip(actual, anterior)):
+        tipo = tipo_cambio(viejo, nuevo)
+        if tipo is not None:
+            tag = cambios[columna] = tipo
+    return tag, cambios
+
+
+def cambios_desde_mascara(cambios, delta, campos):
+    """(tag, {posición: tipo}) de una escritura del historial a partir de su máscara y delta.
+
+    campos es la columna de la base que se muestra en cada posición (None si ninguna).
+    """
+    anteriores = json.loads(delta) if delta else {}
+    tag, tipos = None, {}
+    for posicion, campo in enumerate(campos):
+        if campo is None or not cambios & CAMBIOS_HISTORIAL[campo]:
+            continue
+        antes, despues = anteriores.get(campo, ("?", "?"))  # Sin delta: se marca como modificado
+        tag = tipos[posicion] = tipo_cambio(antes, despues) or MODIFICADO
+    return tag, tipos
+
+
+def tags_por_version(filas):
+    """Tag de cada fila comparada con la siguiente (más antigua); None si no cambió"""
+    return [comparar_versiones(fila, siguiente)[0] for fila, siguiente in zip(filas, filas[1:])] + [None]
+
+
+@lru_cache(maxsize=MAX_PARES)
+def diferencia_texto(anterior, nuevo):
+    """Texto nuevo con [-borrado][+agregado] por palabras respecto al anterior"""
+    viejas, nuevas = _PALABRAS.findall(anterior), _PALABRAS.findall(nuevo)
+
+    # Inicio y final comunes: lo usual es que solo cambie una parte del acuerdo
+    inicio = 0
+    while inicio < len(viejas) and inicio < len(nuevas) and viejas[inicio] == nuevas[inicio]:
+        inicio += 1
+    fin = 0
+    while fin < len(viejas) - inicio and fin < len(nuevas) - inicio and viejas[-1 - fin] == nuevas[-1 - fin]:
+        fin += 1
+    medio_viejo, medio_nuevo = viejas[inicio:len(viejas) - fin], nuevas[inicio:len(nuevas) - fin]
+
+    partes = ["".join(nuevas[:inicio])]
+    if len(medio_viejo) > MAX_PALABRAS or len(medio_nuevo) > MAX_PALABRAS:
+        operaciones = [("replace", 0, len(medio_viejo), 0, len(medio_nuevo))]
+    else:
+        operaciones = SequenceMatcher(None, medio_viejo, medio_nuevo, autojunk=False).get_opcodes()
+    for operacion, i1, i2, j1, j2 in operaciones:
+        borrado, agregado = "".join(medio_viejo[i1:i2]), "".join(medio_nuevo[j1:j2])
+        if operacion == "equal":
+            partes.append(agregado)
+            continue
+        if borrado:
+            partes.append(f"[-{borrado}]")
+        if agregado:
+            partes.append(f"[+{agregado}]")
+    partes.append("".join(nuevas[len(nuevas) - fin:]))
+    return "".join(partes)
@@ -1,41 +1,13 @@
 from common import *
+from sql.repositorio import AcuerdosRepository
 
 def exportar_excel(db_path):
     """Función para exportar los acuerdos a un archivo Excel"""
     def perform_export():
         try:
-            # Conectar a la base de datos
-            conn = sqlite3.connect(db_path)
-
-            # Consulta para acuerdos con información de historial
-            query = """
-                SELECT 
-                a.id_acuerdo,
-                a.acuerdo,
-                a.responsables,
-                a.fecha_compromiso,
-                a.fecha_registro,
-                a.usuario_registra,
-                a.estatus,
-                a.fecha_estatus,
-                a.comentarios_cierre,
-                GROUP_CONCAT(h.fecha_modificacion || ' - ' || h.estatus, '\n') AS historial,
-                CAST((JULIANDAY(a.fecha_estatus) - JULIANDAY(a.fecha_compromiso)) AS INTEGER) AS diferencia_dias
-            FROM 
-                acuerdos a
-            LEFT JOIN 
-                historial_acuerdos h ON a.id_acuerdo = h.id_acuerdo
-            GROUP BY 
-                a.id_acuerdo
-            ORDER BY 
-                a.id_acuerdo;
-            """
-
-            # Leer datos en un DataFrame
-            df = pd.read_sql_query(query, conn)
-
-            # Cerrar conexión
-            conn.close()
+            # Acuerdos con su historial resumido
+            columnas, filas = AcuerdosRepository(db_path).exportacion()
+            df = pd.DataFrame(filas, columns=columnas)
 
             # Verificar si hay datos
             if df.empty:
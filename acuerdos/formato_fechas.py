@@ -0,0 +1,41 @@
+# acuerdos/formato_fechas.py
+"""Conversión y formato de fechas de las minutas.
+
+Las fechas se repiten mucho entre filas (mismo día de compromiso, mismo cierre),
+así que cada valor distinto se formatea una sola vez y se reutiliza.
+"""
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from sql.fechas import EPOCA
+
+
+@lru_cache(maxsize=4096)
+def fecha_corta(texto):
+    """'2025-03-14' -> '14/03/2025' (si no tiene ese formato se devuelve igual)"""
+    if not texto:
+        return texto
+    try:
+        return datetime.strptime(texto, "%Y-%m-%d").strftime("%d/%m/%Y")
+    except ValueError:
+        return texto
+
+
+@lru_cache(maxsize=4096)
+def fecha_hora_corta(texto):
+    """'2025-03-14 09:30:00' -> '14/03/2025 09:30' (si no tiene ese formato se devuelve igual)"""
+    if not texto:
+        return texto
+    try:
+        return datetime.strptime(texto, "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y %H:%M")
+    except ValueError:
+        return texto
+
+
+@lru_cache(maxsize=4096)
+def dia_a_texto(dia):
+    """Número de día (días desde 1970-01-01, como compromiso_dia) -> 'dd/mm/aaaa'"""
+    if dia is None:
+        return ""
+    return (EPOCA + timedelta(days=dia)).strftime("%d/%m/%Y")
+
@@ -0,0 +1,63 @@
+# acuerdos/formato_filas.py
+"""Formato de las filas de acuerdos para el Treeview (sin Tk: corre en el ejecutor).
+
+formatear_acuerdo guarda su resultado por (id_acuerdo, versión) en un CacheFormato,
+así que recargar, paginar o aplicar cambios solo formatea las filas nuevas o editadas.
+"""
+from acuerdos.cache_formato import en_cache
+from acuerdos.formato_texto import formatear_texto
+from acuerdos.formato_fechas import fecha_corta, fecha_hora_corta
+
+
+def abreviar_nombres(nombres_completos):
+    """Abrevia los nombres a primer nombre + primera letra del segundo"""
+    if not nombres_completos:
+        return ""
+
+    nombres = nombres_completos.split(',')
+    nombres_abreviados = []
+
+    for nombre in nombres:
+        nombre = nombre.strip()
+        partes = nombre.split()
+
+        if len(partes) == 0:
+            continue
+        elif len(partes) == 1:
+            # Solo tiene un nombre
+            nombres_abreviados.append(partes[0])
+        else:
+            # Primer nombre + primera letra del segundo
+            abreviado = f"{partes[0]} {partes[1][0]}."
+            nombres_abreviados.append(abreviado)
+
+    return ', '.join(nombres_abreviados)
+
+
+@en_cache(lambda row: (row.id_acuerdo, row.version))
+def formatear_acuerdo(row):
+    """(values, tags) de un acuerdo para el Treeview (corre en el hilo del ejecutor)"""
+    # row: [0=id, 1=acuerdo, 2=responsables, 3=fecha_estatus, 4=estatus, 5=fecha_compromiso, 6=comentarios,
+    #       7=accion, 8=version]; la versión solo sirve de clave de la caché
+    formatted_row = list(row[:8])
+
+    # Formatear fechas (cada valor distinto se formatea una sola vez)
+    formatted_row[3] = fecha_hora_corta(formatted_row[3])  # fecha_estatus
+    formatted_row[5] = fecha_corta(formatted_row[5])  # fecha_compromiso
+
+    # Formatear campos largos
+    formatted_row[1] = formatear_texto(formatted_row[1])  # acuerdo
+    formatted_row[2] = abreviar_nombres(formatted_row[2])  # responsables abreviados
+    formatted_row[4] = formatear_texto(formatted_row[4])  # accion
+    formatted_row[6] = formatear_texto(formatted_row[6] if formatted_row[6] else "")  # comentarios
+
+    # Determinar texto de acción y tags
+    if row[4] == "Cerrado":  # row[4] es el estatus
+        accion_text = "Cerrado"
+        tags = ('cerrado', 'no_underline')  # Agregamos tag adicional
+    else:
+        accion_text = "Cerrar"
+        tags = ('cerrable', 'no_underline')  # Agregamos tag adicional
+
+    # Añadir la columna de acción al final de los valores (tupla: el formato se comparte desde la caché)
+    return tuple(formatted_row) + (accion_text,), tags + ('wraptext', 'no_underline')
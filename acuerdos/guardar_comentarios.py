@@ -1,5 +1,7 @@
 from common import *
+from sql.repositorio import AcuerdosRepository
 from acuerdos.cargar_historial import load_historial
+from acuerdos.lista_virtual import actualizar_lista
 def save_comments(item, new_comments, edit_window, acuerdos_tree, historial_tree, historial_label, db_path):
     """Guarda los comentarios editados del acuerdo"""
     old_comments = acuerdos_tree.item(item, "values")[6]
@@ -11,34 +13,19 @@ def save_comments(item, new_comments, edit_window, acuerdos_tree, historial_tree
     id_acuerdo = acuerdos_tree.item(item, "values")[0]
 
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         # Obtener el usuario actual de Windows
         usuario_actual = os.getlogin()
 
-        # Registrar en historial antes de actualizar
-        cursor.execute(
-            """INSERT INTO historial_acuerdos 
-            (id_acuerdo, acuerdo, responsables, fecha_compromiso, comentarios, fecha_modificacion, usuario_modifico, estatus)
-            SELECT id_acuerdo, acuerdo, responsables, fecha_compromiso, comentarios, datetime('now'), ?, estatus 
-            FROM acuerdos WHERE id_acuerdo = ?""",
-            (usuario_actual, id_acuerdo)
-        )
-
-        # Actualizar acuerdo (nota: asumiendo que tu tabla tiene una columna 'comentarios')
-        cursor.execute(
-            "UPDATE acuerdos SET comentarios = ?, fecha_estatus = datetime('now'), estatus = 'Editado' WHERE id_acuerdo = ?",
-            (new_comments if new_comments.strip() else None, id_acuerdo)  # Guardar NULL si está vacío
+        # Registrar en historial y actualizar el acuerdo
+        AcuerdosRepository(db_path).editar_acuerdo(
+            id_acuerdo=id_acuerdo,
+            campo="comentarios",
+            valor=new_comments if new_comments.strip() else None,  # Guardar NULL si está vacío
+            usuario=usuario_actual
         )
 
-        conn.commit()
-        conn.close()
-
-        # Actualizar interfaz
-        values = list(acuerdos_tree.item(item, "values"))
-        values[6] = new_comments if new_comments.strip() else ""
-        acuerdos_tree.item(item, values=values)
+        # Actualizar interfaz (solo las filas que cambiaron en la base)
+        actualizar_lista(acuerdos_tree)
 
         # Recargar historial si este acuerdo está seleccionado
         if acuerdos_tree.focus() == item:
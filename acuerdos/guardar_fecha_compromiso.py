@@ -1,5 +1,7 @@
 from common import *
+from sql.repositorio import AcuerdosRepository
 from acuerdos.cargar_historial import load_historial
+from acuerdos.lista_virtual import actualizar_lista
 def save_commitment_date(item, new_date_str, edit_window, acuerdos_tree, historial_tree, historial_label, db_path):
     """Guarda la fecha de compromiso editada"""
     current_date_str = acuerdos_tree.item(item, "values")[5]
@@ -12,9 +14,6 @@ def save_commitment_date(item, new_date_str, edit_window, acuerdos_tree, histori
     id_acuerdo = acuerdos_tree.item(item, "values")[0]
 
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         # Formatear fecha para la base de datos
         db_date = None
         if new_date_str:
@@ -28,28 +27,16 @@ def save_commitment_date(item, new_date_str, edit_window, acuerdos_tree, histori
         # Obtener el usuario actual de Windows
         usuario_actual = os.getlogin()
 
-        # Registrar en historial antes de actualizar
-        cursor.execute(
-            """INSERT INTO historial_acuerdos 
-            (id_acuerdo, acuerdo, responsables, fecha_compromiso, fecha_modificacion, usuario_modifico, estatus)
-            SELECT id_acuerdo, acuerdo, responsables, fecha_compromiso, datetime('now'), ?, estatus 
-            FROM acuerdos WHERE id_acuerdo = ?""",
-            (usuario_actual, id_acuerdo)
-        )
-
-        # Actualizar acuerdo
-        cursor.execute(
-            "UPDATE acuerdos SET fecha_compromiso = ?, fecha_estatus = datetime('now'), estatus = 'Editado' WHERE id_acuerdo = ?",
-            (db_date, id_acuerdo)
+        # Registrar en historial y actualizar el acuerdo
+        AcuerdosRepository(db_path).editar_acuerdo(
+            id_acuerdo=id_acuerdo,
+            campo="fecha_compromiso",
+            valor=db_date,
+            usuario=usuario_actual
         )
 
-        conn.commit()
-        conn.close()
-
-        # Actualizar interfaz
-        values = list(acuerdos_tree.item(item, "values"))
-        values[5] = new_date_str if new_date_str else ""
-        acuerdos_tree.item(item, values=values)
+        # Actualizar interfaz (solo las filas que cambiaron en la base)
+        actualizar_lista(acuerdos_tree)
 
         # Recargar historial si este acuerdo está seleccionado
         if acuerdos_tree.focus() == item:
@@ -1,5 +1,7 @@
 from common import *
+from sql.repositorio import AcuerdosRepository
 from acuerdos.cargar_historial import load_historial
+from acuerdos.lista_virtual import actualizar_lista
 
 
 def save_responsables(item, new_responsables, edit_window, acuerdos_tree, historial_tree, historial_label, db_path):
@@ -14,14 +16,12 @@ def save_responsables(item, new_responsables, edit_window, acuerdos_tree, histor
     has_commas = False
 
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        repositorio = AcuerdosRepository(db_path)
 
         # Obtener todos los usuarios existentes con sus versiones formateadas
-        cursor.execute("SELECT nombre FROM usuarios")
         existing_users = {}
-        for row in cursor.fetchall():
-            nombre_completo = row[0].strip()
+        for nombre in repositorio.nombres_usuarios(incluir_eliminados=True):
+            nombre_completo = nombre.strip()
             # Generar versión formateada para comparación
             partes = nombre_completo.split()
             if len(partes) >= 2:
@@ -55,48 +55,30 @@ def save_responsables(item, new_responsables, edit_window, acuerdos_tree, histor
 
         if set(new_normalized) == set(old_normalized):
             edit_window.destroy()
-            conn.close()
             return
 
         new_responsables_str = ", ".join(processed_responsables)
         id_acuerdo = acuerdos_tree.item(item, "values")[0]
         usuario_actual = os.getlogin()
 
-        # Registrar en historial y actualizar acuerdo (igual que antes)
-        estatus = "Eliminado" if has_commas else "Editado"
-        cursor.execute(
-            """INSERT INTO historial_acuerdos 
-            (id_acuerdo, acuerdo, responsables, fecha_compromiso, fecha_modificacion, usuario_modifico, estatus)
-            SELECT id_acuerdo, acuerdo, responsables, fecha_compromiso, datetime('now'), ?, estatus 
-            FROM acuerdos WHERE id_acuerdo = ?""",
-            (usuario_actual, id_acuerdo)
-        )
-
-        cursor.execute(
-            "UPDATE acuerdos SET responsables = ?, fecha_estatus = datetime('now'), estatus = ? WHERE id_acuerdo = ?",
-            (new_responsables_str, estatus, id_acuerdo)
-        )
-
         # Registrar SOLO usuarios realmente nuevos
         new_users_to_add = [
             name for name in processed_responsables
             if name.lower() not in [n.lower() for n in existing_users.values()]
         ]
 
-        for responsable in new_users_to_add:
-            cursor.execute(
-                """INSERT INTO usuarios 
-                (nombre, fecha_registro, usuario_registra, estatus) 
-                VALUES (?, datetime('now'), ?, 'Activo')""",
-                (responsable, usuario_actual)
-            )
-
-        conn.commit()
+        # Usuarios nuevos, historial y acuerdo en una sola transacción (igual que antes)
+        estatus = "Eliminado" if has_commas else "Editado"
+        repositorio.editar_responsables(
+            id_acuerdo=id_acuerdo,
+            responsables=new_responsables_str,
+            nuevos=new_users_to_add,
+            usuario=usuario_actual,
+            estatus=estatus
+        )
 
-        # Actualizar interfaz
-        values = list(acuerdos_tree.item(item, "values"))
-        values[2] = new_responsables_str
-        acuerdos_tree.item(item, values=values)
+        # Actualizar interfaz (solo las filas que cambiaron en la base)
+        actualizar_lista(acuerdos_tree)
 
         if acuerdos_tree.focus() == item:
             load_historial(None, acuerdos_tree, historial_tree, historial_label, db_path)
@@ -105,7 +87,4 @@ def save_responsables(item, new_responsables, edit_window, acuerdos_tree, histor
         edit_window.destroy()
 
     except Exception as e:
-        messagebox.showerror("Error", f"Error al guardar: {str(e)}")
-    finally:
-        if 'conn' in locals():
-            conn.close()
\ No newline at end of file
+        messagebox.showerror("Error", f"Error al guardar: {str(e)}")
\ No newline at end of file
@@ -1,4 +1,5 @@
 from common import *
+from sql.repositorio import AcuerdosRepository
 from acuerdos.cerrar_2 import cerrar_acuerdo_seleccionado
 from acuerdos.children_window import center_child_window
 from acuerdos.editar_comentarios_date import edit_commitment_date
@@ -371,6 +372,13 @@ def word_acuerdos(root, db_path):
     # Cargar datos iniciales
     load_acuerdos(acuerdos_tree, db_path, id_filter, text_filter, resp_filter, date_from, date_to, status_filter)
 
+    # El historial de las filas visibles se precarga: recorrerlas con las flechas no consulta la base
+    ListaVirtual.de(acuerdos_tree).al_materializar = lambda: precargar_historial(acuerdos_tree, db_path)
+
+    # Los cambios de otros usuarios se parchan en la lista sin recargarla
+    suscribir(acuerdos_tree, db_path, lambda: [invalidar_cache_historial(db_path),
+                                               actualizar_lista(acuerdos_tree)])
+
     # Configurar estilo para saltos de línea
     style.configure("Treeview", rowheight=30)
 
@@ -384,7 +392,11 @@ def word_acuerdos(root, db_path):
 
 from acuerdos.center_window import center_window
 from acuerdos.carga_acuerdos import load_acuerdos
-from acuerdos.cargar_historial import load_historial, highlight_changes
+from acuerdos.lista_virtual import ListaVirtual, actualizar_lista
+from sql.cambios import suscribir
+from acuerdos.buscador_personas import al_escribir, vigilar_personas
+from sql.repositorio import invalidar_cache_historial
+from acuerdos.cargar_historial import load_historial, highlight_changes, precargar_historial
 
 
 def on_double_click(event, acuerdos_tree, historial_tree, historial_label, db_path):
@@ -398,22 +410,10 @@ def on_double_click(event, acuerdos_tree, historial_tree, historial_label, db_pa
         # Verificar si el acuerdo está cerrado
         if values and len(values) > 4 and values[4] == "Cerrado":
             try:
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-
                 # Obtener la ruta del PDF más reciente para este acuerdo
-                cursor.execute(
-                    """SELECT ruta_pdf FROM historial_acuerdos 
-                    WHERE id_acuerdo = ? AND estatus = 'Cerrado'
-                    ORDER BY fecha_modificacion DESC LIMIT 1""",
-                    (values[0],)  # values[0] es el id_acuerdo
-                )
-
-                result = cursor.fetchone()
-                conn.close()
-
-                if result and result[0]:
-                    pdf_path = result[0]
+                pdf_path = AcuerdosRepository(db_path).ruta_pdf_cierre(values[0])  # values[0] es el id_acuerdo
+
+                if pdf_path:
                     # Obtener el directorio contenedor del PDF
                     folder_path = os.path.dirname(pdf_path)
 
@@ -450,9 +450,8 @@ def on_double_click(event, acuerdos_tree, historial_tree, historial_label, db_pa
                 id_acuerdo = values[0]
                 # Si sale bien cerrar_acuerdo_seleccionado, se debe de actualizar la tabla de acuerdos.
                 if cerrar_acuerdo_seleccionado(id_acuerdo, acuerdos_tree, db_path):
-                    # If closing was successful, refresh the agreements table
-                    load_acuerdos(acuerdos_tree, db_path, id_filter, text_filter,
-                                  resp_filter, date_from, date_to, status_filter)
+                    # If closing was successful, refresh only the changed rows
+                    actualizar_lista(acuerdos_tree)
 
 def edit_agreement_text(item, acuerdos_tree, historial_tree, historial_label, db_path):
     """Permite editar el texto del acuerdo con doble clic"""
@@ -526,34 +525,19 @@ def save_agreement_text(item, new_text, edit_window, acuerdos_tree, historial_tr
     id_acuerdo = acuerdos_tree.item(item, "values")[0]
 
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         # Obtener el usuario actual de Windows
         usuario_actual = os.getlogin()
 
-        # Registrar en historial antes de actualizar
-        cursor.execute(
-            """INSERT INTO historial_acuerdos 
-            (id_acuerdo, acuerdo, responsables, fecha_compromiso, fecha_modificacion, usuario_modifico, estatus)
-            SELECT id_acuerdo, acuerdo, responsables, fecha_compromiso, datetime('now'), ?, estatus 
-            FROM acuerdos WHERE id_acuerdo = ?""",
-            (usuario_actual, id_acuerdo)
-        )
-
-        # Actualizar acuerdo
-        cursor.execute(
-            "UPDATE acuerdos SET acuerdo = ?, fecha_estatus = datetime('now'), estatus = 'Editado' WHERE id_acuerdo = ?",
-            (new_text, id_acuerdo)
+        # Registrar en historial y actualizar el acuerdo
+        AcuerdosRepository(db_path).editar_acuerdo(
+            id_acuerdo=id_acuerdo,
+            campo="acuerdo",
+            valor=new_text,
+            usuario=usuario_actual
         )
 
-        conn.commit()
-        conn.close()
-
-        # Actualizar interfaz
-        values = list(acuerdos_tree.item(item, "values"))
-        values[1] = new_text
-        acuerdos_tree.item(item, values=values)
+        # Actualizar interfaz (solo las filas que cambiaron en la base)
+        actualizar_lista(acuerdos_tree)
 
         # Recargar historial si este acuerdo está seleccionado
         if acuerdos_tree.focus() == item:
@@ -595,40 +579,14 @@ def edit_responsables(item, acuerdos_tree, historial_tree, historial_label, db_p
 
     # Obtener responsables COMPLETOS de la base de datos
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Obtener nombres completos de usuarios activos
-        cursor.execute("SELECT DISTINCT nombre FROM usuarios WHERE nombre != '' AND estatus != 'Eliminado'")
-        all_responsables_completos = [row[0] for row in cursor.fetchall()]
-
-        # Obtener los responsables actuales del acuerdo (en formato abreviado)
-        current_selection_abreviados = current_responsables.split(", ") if current_responsables else []
-
-        # Mapear nombres abreviados a completos
-        nombres_completos = []
-        for abreviado in current_selection_abreviados:
-            # Buscar coincidencia insensible a mayúsculas/minúsculas
-            for completo in all_responsables_completos:
-                partes = completo.split()
-                if len(partes) >= 2:
-                    formato_abreviado = f"{partes[0]} {partes[1][0]}."
-                    if formato_abreviado.lower() == abreviado.lower():
-                        nombres_completos.append(completo)
-                        break
-            else:
-                # Si no encuentra coincidencia, usar el nombre tal cual
-                nombres_completos.append(abreviado)
-
-        conn.close()
+        datos = AcuerdosRepository(db_path).datos_responsables(id_acuerdo)
     except Exception as e:
         messagebox.showerror("Error", f"No se pudieron cargar los responsables: {e}")
         return
 
-    # Preparar listas
-    all_responsables_completos = sorted(all_responsables_completos)
-    current_selection = nombres_completos  # Usamos los nombres completos
-    disponibles = [r for r in all_responsables_completos if r not in current_selection]
+    # Preparar listas (los disponibles salen del índice de personas, sin volver a la base)
+    personas = {"indice": datos.personas}
+    current_selection = datos.actuales  # Usamos los nombres completos
 
     # Frame principal
     main_frame = ttk.Frame(resp_window)
@@ -708,26 +666,15 @@ def edit_responsables(item, acuerdos_tree, historial_tree, historial_label, db_p
             nuevo_nombre = nuevo_nombre_entry.get().strip()
             if nuevo_nombre and nuevo_nombre != nombre_actual:
                 try:
-                    conn = sqlite3.connect(db_path)
-                    cursor = conn.cursor()
-
                     # Actualizar en la tabla usuarios
-                    cursor.execute("UPDATE usuarios SET nombre = ? WHERE nombre = ?",
-                                   (nuevo_nombre, nombre_actual))
+                    AcuerdosRepository(db_path).renombrar_usuario(nombre_actual, nuevo_nombre)
 
                     # Actualizar en el listbox
                     active_listbox.delete(index)
                     active_listbox.insert(index, nuevo_nombre)
 
-                    # Actualizar la lista de disponibles si es necesario
-                    if active_listbox == disponibles_listbox:
-                        if nombre_actual in disponibles:
-                            disponibles.remove(nombre_actual)
-                            disponibles.append(nuevo_nombre)
-                            disponibles.sort()
-
-                    conn.commit()
-                    conn.close()
+                    # El renombre invalidó el índice: se vuelve a leer con el nombre nuevo
+                    personas["indice"] = AcuerdosRepository(db_path).indice_personas()
 
                     edit_window.destroy()
                     #messagebox.showinfo("Éxito", "Nombre actualizado correctamente")
@@ -751,21 +698,14 @@ def edit_responsables(item, acuerdos_tree, historial_tree, historial_label, db_p
 
         if messagebox.askyesno("Confirmar", f"¿Está seguro de marcar como eliminado a {nombre}?"):
             try:
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-
                 # Actualizar el estatus en lugar de eliminar
-                cursor.execute("UPDATE usuarios SET estatus = 'Eliminado' WHERE nombre = ?", (nombre,))
+                AcuerdosRepository(db_path).eliminar_usuario(nombre)
 
                 # Eliminar del listbox (opcional, depende de si quieres seguir mostrándolo)
                 active_listbox.delete(index)
 
-                # Actualizar la lista de disponibles si es necesario
-                if active_listbox == disponibles_listbox and nombre in disponibles:
-                    disponibles.remove(nombre)
-
-                conn.commit()
-                conn.close()
+                # El índice ya no debe ofrecerlo como disponible
+                personas["indice"] = AcuerdosRepository(db_path).indice_personas()
 
                 #messagebox.showinfo("Éxito", "Usuario marcado como eliminado correctamente")
             except Exception as e:
@@ -778,20 +718,22 @@ def edit_responsables(item, acuerdos_tree, historial_tree, historial_label, db_p
     ttk.Button(btns_frame, text="←", command=lambda: mover_seleccion(seleccionados_listbox, disponibles_listbox)).pack(pady=2)
 
     # Llenar listas iniciales
-    for r in disponibles:
-        disponibles_listbox.insert("end", r)
     for r in current_selection:
         seleccionados_listbox.insert("end", r)
 
-    # Buscador dinámico
+    # Buscador dinámico: filtra el índice en memoria al dejar de escribir
     def update_disponibles(*args):
-        term = search_var.get().lower()
         disponibles_listbox.delete(0, "end")
-        for r in disponibles:
-            if term in r.lower():
-                disponibles_listbox.insert("end", r)
+        for r in personas["indice"].buscar(search_var.get(), seleccionados_listbox.get(0, "end")):
+            disponibles_listbox.insert("end", r)
+
+    def recargar_personas(indice):
+        personas["indice"] = indice
+        update_disponibles()
 
-    search_var.trace_add("write", update_disponibles)
+    update_disponibles()
+    al_escribir(search_entry, search_var, update_disponibles)
+    vigilar_personas(resp_window, db_path, recargar_personas)
 
     # ===== Nuevo responsable =====
     new_frame = ttk.Frame(resp_window)
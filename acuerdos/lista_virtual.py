@@ -0,0 +1,325 @@
+# acuerdos/lista_virtual.py
+"""Treeview virtual: solo materializa las filas visibles más una reserva.
+
+Las filas se piden por páginas (keyset) a una función cargar(despues, limite)
+que corre en el ejecutor y devuelve una Pagina cuyas filas son (values, tags,
+clave) ya formateadas (ver formateada). Lo leído se guarda en una lista de
+Python; el Treeview solo contiene la ventana alrededor de lo que se ve y, al
+desplazarse, se insertan las filas que entran y se borran las que salen.
+
+El iid de cada item es el id de su fila (último valor de la clave), así que
+focus(), item() e identify_row() siguen funcionando para las interacciones
+existentes. Después de guardar un cambio, actualizar_lista(tree) pide solo las
+filas modificadas desde la última lectura y parcha, inserta o quita esos items.
+"""
+from bisect import bisect_right
+from functools import cmp_to_key
+
+from sql.ejecutor import en_segundo_plano
+from sql.repositorio import PAGINA_ACUERDOS
+
+RESERVA = 40   # Filas materializadas por encima y por debajo de las visibles
+
+
+def formateada(leer, formatear):
+    """Envuelve leer(*args) para que sus filas sean (values, tags, clave).
+
+    Sirve para Pagina y para Cambios; formatear(fila) devuelve (values, tags) y
+    corre en el hilo del ejecutor junto con la lectura.
+    """
+    def cargar(*args):
+        resultado = leer(*args)
+        if resultado is None:
+            return None
+        return resultado._replace(filas=[(*formatear(fila), clave)
+                                         for fila, clave in zip(resultado.filas, resultado.claves)])
+    return cargar
+
+
+def actualizar_lista(tree):
+    """Aplica a la lista virtual del Treeview los cambios guardados en la base"""
+    lista = getattr(tree, "_lista_virtual", None)
+    if lista is not None:
+        lista.actualizar()
+
+
+def _comparar(direcciones):
+    """Comparación de claves de orden con direcciones ASC/DESC mezcladas"""
+    def comparar(a, b):
+        for x, y, direccion in zip(a, b, direcciones):
+            if x != y:
+                return (1 if x > y else -1) * (1 if direccion == "ASC" else -1)
+        return 0
+    return cmp_to_key(comparar)
+
+
+class ListaVirtual:
+    """Ventana de filas de un Treeview sobre una fuente paginada"""
+
+    def __init__(self, tree, scrollbar=None, pagina=PAGINA_ACUERDOS, reserva=RESERVA):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.pagina = pagina
+        self.reserva = reserva
+        self.cargar = None
+        self.cambios = None
+        self.al_fallar = None
+        self.marca = None        # Versión de la base con la que se leyó la lista
+        self.filas = []          # (values, tags, clave) leídas hasta ahora
+        self.siguiente = None    # Clave keyset de la próxima página; None = no hay más
+        self.total = 0
+        self.inicio = 0          # Posición de la primera fila materializada
+        self.fin = 0             # Posición siguiente a la última materializada
+        self.visibles = int(tree.cget("height") or 10)
+        self.destino = 0         # Primera fila que se quiere ver
+        self.leyendo = False
+        self.al_materializar = None  # Se llama (en idle) cuando cambian los items del Treeview
+        self._revision_pendiente = False
+        self._aviso_pendiente = False
+
+        tree.configure(yscrollcommand=self._al_desplazar)
+        if scrollbar is not None:
+            scrollbar.configure(command=self._mover)
+
+    @classmethod
+    def de(cls, tree, **opciones):
+        """Lista virtual del Treeview (se crea la primera vez que se pide)"""
+        lista = getattr(tree, "_lista_virtual", None)
+        if lista is None:
+            lista = tree._lista_virtual = cls(tree, **opciones)
+        return lista
+
+    # ------------------------------------------------------------ fuente de datos
+
+    def mostrar(self, cargar, al_fallar=None, primera=None, cambios=None):
+        """Muestra desde el inicio las filas de cargar.
+
+        primera es una Pagina ya leída (p. ej. junto con otros datos de la
+        pantalla); si no se da, se lee en segundo plano. cambios(marca) devuelve
+        los Cambios desde la marca de la primera página (None = recargar).
+        """
+        self.cargar = cargar
+        self.cambios = cambios
+        self.al_fallar = al_fallar
+        if primera is not None:
+            self._primera_pagina(primera)
+        else:
+            self._leer(None, self.pagina, self._primera_pagina)
+
+    def recargar(self):
+        """Vuelve a leer la fuente actual desde el inicio"""
+        if self.cargar is not None:
+            self.mostrar(self.cargar, self.al_fallar, cambios=self.cambios)
+
+    def actualizar(self):
+        """Pide las filas modificadas desde la marca y parcha solo esos items"""
+        if self.cambios is None or self.marca is None:
+            self.recargar()
+            return
+        en_segundo_plano(self.tree, self.cambios, self.marca,
+                         clave=("lista_virtual_cambios", str(self.tree)),
+                         al_terminar=self._aplicar, al_fallar=self._fallo)
+
+    def _leer(self, despues, limite, al_terminar):
+        self.leyendo = True
+        # Una lectura nueva (otro filtro) reemplaza a la que esté en curso
+        en_segundo_plano(self.tree, self.cargar, despues, limite,
+                         clave=("lista_virtual", str(self.tree)),
+                         al_terminar=al_terminar, al_fallar=self._fallo)
+
+    def _fallo(self, error):
+        self.leyendo = False
+        if self.al_fallar:
+            self.al_fallar(error)
+        else:
+            print(f"Error al leer las filas de la lista: {error}")
+
+    def _primera_pagina(self, pagina):
+        self.leyendo = False
+        self.tree.delete(*self.tree.get_children())
+        self.filas = list(pagina.filas)
+        self.siguiente = pagina.siguiente
+        self.total = pagina.total if pagina.total is not None else len(self.filas)
+        self.marca = pagina.marca
+        self.inicio = self.fin = self.destino = 0
+        self._materializar(0)
+
+    def _agregar(self, pagina):
+        self.leyendo = False
+        self.filas.extend(pagina.filas)
+        self.siguiente = pagina.siguiente
+        if self.siguiente is None:
+            self.total = len(self.filas)  # Pudieron borrarse o agregarse filas desde el conteo
+        self._ir_a(self.destino)
+
+    def _total(self):
+        return max(self.total, len(self.filas))
+
+    # ------------------------------------------------------------ ventana materializada
+
+    def _ir_a(self, primera):
+        """Materializa la ventana que empieza en primera, leyendo lo que falte"""
+        self.destino = primera
+        faltan = primera + self.visibles + self.reserva - len(self.filas)
+        if faltan > 0 and self.siguiente is not None:
+            if not self.leyendo:
+                self._leer(self.siguiente, max(faltan, self.pagina), self._agregar)
+            primera = min(primera, max(len(self.filas) - self.visibles, 0))
+        self._materializar(primera)
+
+    def _materializar(self, primera):
+        primera = max(0, min(primera, len(self.filas) - 1))
+        desde = max(0, primera - self.reserva)
+        hasta = min(len(self.filas), primera + self.visibles + self.reserva)
+
+        if hasta <= self.inicio or desde >= self.fin:
+            self._quitar(self.inicio, self.fin)  # Salto sin traslape: se reemplaza todo
+            self.inicio = self.fin = desde
+        else:
+            # Se conservan los items que siguen en la ventana (y su selección)
+            self._quitar(self.inicio, desde)
+            self._quitar(hasta, self.fin)
+            self.inicio, self.fin = max(self.inicio, desde), min(self.fin, hasta)
+
+        for posicion in range(desde, self.inicio):
+            values, tags, clave = self.filas[posicion]
+            self.tree.insert("", posicion - desde, iid=str(clave[-1]), values=values, tags=tags)
+        for posicion in range(self.fin, hasta):
+            values, tags, clave = self.filas[posicion]
+            self.tree.insert("", "end", iid=str(clave[-1]), values=values, tags=tags)
+        self.inicio, self.fin = desde, hasta
+        self._ver(primera)
+        self._avisar()
+
+    def _avisar(self):
+        """Programa al_materializar una sola vez aunque la ventana cambie varias veces seguidas"""
+        if self.al_materializar is None or self._aviso_pendiente:
+            return
+        self._aviso_pendiente = True
+
+        def avisar():
+            self._aviso_pendiente = False
+            self.al_materializar()
+        self.tree.after_idle(avisar)
+
+    def _quitar(self, desde, hasta):
+        """Borra los items [desde, hasta) guardando antes sus valores actuales"""
+        if desde >= hasta:
+            return
+        iids = []
+        for posicion in range(desde, hasta):
+            clave = self.filas[posicion][2]
+            iid = str(clave[-1])
+            self.filas[posicion] = (self.tree.item(iid, "values"), self.tree.item(iid, "tags"), clave)
+            iids.append(iid)
+        self.tree.delete(*iids)
+
+    def _ver(self, primera):
+        materializadas = self.fin - self.inicio
+        if materializadas:
+            # +0.01 evita que el redondeo de Tk muestre la fila anterior
+            self.tree.yview_moveto((primera - self.inicio + 0.01) / materializadas)
+
+    # ------------------------------------------------------------ cambios incrementales
+
+    def _aplicar(self, cambios):
+        if cambios is None:
+            self.recargar()  # Demasiados cambios (o minuta sin versión): se lee de nuevo
+            return
+        orden = _comparar(cambios.direcciones)
+        for identidad in cambios.quitar:
+            self._parchar(identidad, None, orden)
+        for fila in cambios.filas:
+            self._parchar(fila[2][-1], fila, orden)
+        self.marca = cambios.marca
+        self._avisar()
+
+    def _posicion_de(self, identidad):
+        return next((i for i, fila in enumerate(self.filas) if fila[2][-1] == identidad), None)
+
+    def _parchar(self, identidad, fila, orden):
+        """Quita la fila con ese id y, si sigue en la lista, la pone en su nueva posición"""
+        iid = str(identidad)
+        anterior = self._posicion_de(identidad)
+        estaba_visible = anterior is not None and self.inicio <= anterior < self.fin
+        if anterior is not None:
+            del self.filas[anterior]
+            self.total -= 1
+            if anterior < self.inicio:
+                self.inicio -= 1
+            if anterior < self.fin:
+                self.fin -= 1
+
+        nueva = None
+        if fila is not None:
+            claves = [orden(f[2]) for f in self.filas]
+            nueva = bisect_right(claves, orden(fila[2]))
+            # Después de la última fila leída: llegará con las páginas siguientes
+            if nueva == len(self.filas) and self.siguiente is not None and \
+                    orden(fila[2]) > orden(self.siguiente):
+                nueva = None
+        if nueva is not None:
+            self.filas.insert(nueva, fila)
+            self.total += 1
+            if nueva < self.inicio:
+                self.inicio += 1
+                self.fin += 1
+                nueva = None  # Fuera de la ventana, arriba
+            elif nueva <= self.fin:
+                self.fin += 1
+            else:
+                nueva = None  # Fuera de la ventana, abajo
+
+        values, tags = (fila[0], fila[1]) if fila is not None else (None, None)
+        if estaba_visible and nueva is not None:
+            self.tree.item(iid, values=values, tags=tags)
+            self.tree.move(iid, "", nueva - self.inicio)
+        elif estaba_visible:
+            self.tree.delete(iid)
+        elif nueva is not None:
+            self.tree.insert("", nueva - self.inicio, iid=iid, values=values, tags=tags)
+
+    # ------------------------------------------------------------ desplazamiento
+
+    def _al_desplazar(self, primero, ultimo):
+        """yscrollcommand del Treeview: actualiza la barra y mueve la ventana si hace falta"""
+        materializadas = self.fin - self.inicio
+        if not materializadas:
+            if self.scrollbar is not None:
+                self.scrollbar.set(0, 1)
+            return
+        primero, ultimo = float(primero), float(ultimo)
+        primera = self.inicio + int(primero * materializadas + 0.5)
+        self.visibles = max(1, int((ultimo - primero) * materializadas + 0.5))
+
+        if self.scrollbar is not None:
+            total = self._total()
+            self.scrollbar.set(primera / total, min(1.0, (primera + self.visibles) / total))
+
+        margen = self.reserva // 2
+        cerca_del_inicio = self.inicio > 0 and primera - self.inicio < margen
+        cerca_del_fin = (self.fin - primera - self.visibles < margen
+                         and (self.fin < len(self.filas) or self.siguiente is not None))
+        if (cerca_del_inicio or cerca_del_fin) and not self._revision_pendiente:
+            # No se modifica el Treeview dentro de su propio callback de desplazamiento
+            self._revision_pendiente = True
+            self.tree.after_idle(self._revisar)
+
+    def _revisar(self):
+        self._revision_pendiente = False
+        materializadas = self.fin - self.inicio
+        if materializadas:
+            primero = float(self.tree.yview()[0])
+            self._ir_a(self.inicio + int(primero * materializadas + 0.5))
+
+    def _mover(self, *args):
+        """command de la barra vertical: posiciones relativas al total de filas"""
+        if args[0] != "moveto":
+            self.tree.yview(*args)  # Flechas y página: el Treeview se desplaza y avisa
+            return
+        total = self._total()
+        primera = max(0, min(int(float(args[1]) * total), total - self.visibles))
+        if self.inicio <= primera and primera + self.visibles <= self.fin:
+            self._ver(primera)
+        else:
+            self._ir_a(primera)
@@ -1,5 +1,8 @@
 from common import *
+from sql.repositorio import AcuerdosRepository
+from sql.personas import IndicePersonas
 from acuerdos.center_window import center_window
+from acuerdos.buscador_personas import al_escribir, vigilar_personas
 from Menu.Menu import get_system_scaling
 import pytz
 
@@ -192,26 +195,14 @@ def registrar_acuerdo(parent_window, db_path):
             return
 
         try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            # Verificar si ya existe en la tabla usuarios (insensible a mayúsculas)
-            cursor.execute("SELECT nombre FROM usuarios WHERE LOWER(nombre) = LOWER(?)", (nuevo,))
-            if not cursor.fetchone():
-                # Obtener fecha y hora actual en México
-                tz_mexico = pytz.timezone('America/Mexico_City')
-                fecha_actual = datetime.now(tz_mexico).strftime("%Y-%m-%d %H:%M:%S")
-                usuario_actual = getpass.getuser()
-
-                cursor.execute(
-                    """INSERT INTO usuarios 
-                    (nombre, fecha_registro, usuario_registra, estatus) 
-                    VALUES (?, ?, ?, 'Activo')""",
-                    (nuevo, fecha_actual, usuario_actual)
-                )
-                conn.commit()
-
-            conn.close()
+            # Obtener fecha y hora actual en México
+            tz_mexico = pytz.timezone('America/Mexico_City')
+            fecha_actual = datetime.now(tz_mexico).strftime("%Y-%m-%d %H:%M:%S")
+
+            # Solo se registra si no existe en usuarios (insensible a mayúsculas)
+            repositorio = AcuerdosRepository(db_path)
+            repositorio.registrar_usuarios([nuevo], getpass.getuser(), fecha_actual)
+            personas["indice"] = repositorio.indice_personas()  # Ya incluye al nuevo responsable
 
             # Agregar a la lista de disponibles y seleccionarlo
             disponibles_listbox.insert("end", nuevo)
@@ -317,39 +308,31 @@ def registrar_acuerdo(parent_window, db_path):
     )
     seleccionados_listbox.pack(fill="both", expand=True)
 
+    # Índice de personas de la minuta: se lee una vez y el buscador filtra en memoria
+    try:
+        personas = {"indice": AcuerdosRepository(db_path).indice_personas()}
+    except sqlite3.Error as e:
+        print(f"Error en consulta SQL: {e}")
+        personas = {"indice": IndicePersonas(())}
+
     # Función para filtrar responsables
     def filtrar_responsables(*args):
-        filtro = search_var.get().lower()
         disponibles_listbox.delete(0, "end")
 
-        # Obtener responsables ya seleccionados para evitar duplicados
-        seleccionados = [seleccionados_listbox.get(i) for i in range(seleccionados_listbox.size())]
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        try:
-            from sql.querys import usuarios_prioridad_sin_eliminados
-            cursor.execute(usuarios_prioridad_sin_eliminados)
-
-            # Procesar resultados para eliminar duplicados y filtrar
-            unique_names = set()
-            for resp in cursor.fetchall():
-                nombre = resp[0].strip()
-                if nombre and nombre.lower() not in unique_names:
-                    unique_names.add(nombre.lower())
+        # Responsables ya seleccionados para evitar duplicados
+        seleccionados = seleccionados_listbox.get(0, "end")
 
-                    # Mostrar solo si coincide con el filtro y no está ya seleccionado
-                    if filtro in nombre.lower() and nombre not in seleccionados:
-                        disponibles_listbox.insert("end", nombre)
+        # Sin acentos, primero los inicios de palabra y los más asignados
+        for nombre in personas["indice"].buscar(search_var.get(), seleccionados, solo_prioridad=True):
+            disponibles_listbox.insert("end", nombre)
 
-        except sqlite3.Error as e:
-            print(f"Error en consulta SQL: {e}")
-        finally:
-            conn.close()
+    def recargar_personas(indice):
+        personas["indice"] = indice
+        filtrar_responsables()
 
-    # Configurar el trace
-    search_var.trace("w", lambda *args: filtrar_responsables())
+    # Filtrar al dejar de escribir, y recargar el índice si otro usuario cambia la minuta
+    al_escribir(search_entry, search_var, filtrar_responsables)
+    vigilar_personas(reg_window, db_path, recargar_personas)
 
     # Llamada inicial para cargar datos
     filtrar_responsables()
@@ -391,34 +374,21 @@ def registrar_acuerdo(parent_window, db_path):
         responsables_str = ", ".join(selected_responsables)
 
         try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-
             # Generar ID de acuerdo único
             id_acuerdo = f"AC-{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
             # Obtener fecha y hora actual
             fecha_actual = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            cursor.execute(
-                """INSERT INTO acuerdos 
-                (id_acuerdo, acuerdo, responsables, fecha_compromiso, 
-                 fecha_registro, usuario_registra, estatus, fecha_estatus, comentarios)
-                VALUES (?, ?, ?, ?, ?, ?, 'Activo', ?, ?)""",
-                (
-                    id_acuerdo,
-                    acuerdo,
-                    responsables_str,
-                    fecha_calendario,  # Siempre la fecha del calendario
-                    fecha_actual,
-                    getpass.getuser(),
-                    fecha_actual,
-                    comentarios  # "Sin fecha compromiso" o vacío
-                )
+            AcuerdosRepository(db_path).registrar_acuerdo(
+                id_acuerdo=id_acuerdo,
+                acuerdo=acuerdo,
+                responsables=responsables_str,
+                fecha_compromiso=fecha_calendario,  # Siempre la fecha del calendario
+                fecha_registro=fecha_actual,
+                usuario=getpass.getuser(),
+                comentarios=comentarios  # "Sin fecha compromiso" o vacío
             )
-            conn.commit()
-            conn.close()
 
             #messagebox.showinfo("Éxito", "Acuerdo registrado correctamente")
             reg_window.destroy()
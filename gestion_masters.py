@@ -1,6 +1,9 @@
 # gestion_masters.py
 from common import *
 from rutas import MASTER
+from sql.repositorio import MasterRepository, PAGINA_OTROS_HOSTS, invalidar_cache_master
+from sql.ejecutor import en_segundo_plano
+from sql.cambios import suscribir
 from acuerdos.ventana_names import move_to_largest_monitor
 from tkinter import Menu
 
@@ -8,24 +11,14 @@ def host(db_path):
     """Función principal para gestionar hosts y solicitudes"""
     try:
         usuario_actual = os.getlogin()
-        conn = sqlite3.connect(MASTER)
-        cursor = conn.cursor()
-
-        # Verificar si es propietario de alguna base de datos
-        cursor.execute("SELECT COUNT(*) FROM dbs WHERE usuario_windows = ?", (usuario_actual,))
-        if cursor.fetchone()[0] == 0:
-            # Si no es propietario, usar la base de datos "Master" para pruebas
-            respuesta = True
-
-            if respuesta:
-                usuario_actual = "Master"
-            else:
-                return
+        repositorio = MasterRepository()
 
         def on_close(event=None):
             """Cerrar la ventana cuando se intenta cerrar o se pierde el foco"""
             if host_window.winfo_exists():  # Evitar errores si ya fue destruida
                 host_window.destroy()
+            # Lo revisado aquí (solicitudes, permisos) no debe leerse viejo desde la caché
+            invalidar_cache_master()
 
         # Crear ventana principal
         host_window = tk.Tk()
@@ -67,20 +60,15 @@ def host(db_path):
 
         move_to_largest_monitor(host_window)
 
-        def cargar_solicitudes():
-            """Cargar las solicitudes pendientes"""
+        def cargar_solicitudes(solicitudes=None):
+            """Cargar las solicitudes pendientes (sin datos, se leen en segundo plano)"""
+            if solicitudes is None:
+                en_segundo_plano(solicitudes_tree, repositorio.solicitudes, usuario_actual,
+                                 clave="host_solicitudes", al_terminar=cargar_solicitudes)
+                return
+
             solicitudes_tree.delete(*solicitudes_tree.get_children())
-            cursor.execute("""
-                SELECT s.id, s.usuario_solicitante, d.db_name, s.fecha_solicitud
-                FROM solicitudes_acceso s
-                JOIN dbs d ON s.db_id = d.id
-                WHERE s.estatus = 'pendiente'
-                AND d.usuario_windows = ?
-                AND s.usuario_solicitante != ?
-                ORDER BY s.fecha_solicitud DESC
-            """, (usuario_actual, usuario_actual))
-
-            for solicitud in cursor.fetchall():
+            for solicitud in solicitudes:
                 solicitudes_tree.insert('', tk.END, values=solicitud)
 
         import datetime
@@ -91,12 +79,7 @@ def host(db_path):
             if seleccion:
                 solicitud_id = solicitudes_tree.item(seleccion[0])['values'][0]
                 fecha_respuesta = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                cursor.execute("""
-                    UPDATE solicitudes_acceso 
-                    SET estatus = 'aprobado', fecha_respuesta = ? 
-                    WHERE id = ?
-                """, (fecha_respuesta, solicitud_id))
-                conn.commit()
+                repositorio.responder_solicitud(solicitud_id, True, fecha_respuesta)
                 cargar_solicitudes()
 
 
@@ -105,12 +88,7 @@ def host(db_path):
             seleccion = solicitudes_tree.selection()
             if seleccion:
                 solicitud_id = solicitudes_tree.item(seleccion[0])['values'][0]
-                cursor.execute("""
-                    UPDATE solicitudes_acceso 
-                    SET estatus = 'rechazado' 
-                    WHERE id = ?
-                """, (solicitud_id,))
-                conn.commit()
+                repositorio.responder_solicitud(solicitud_id, False)
                 cargar_solicitudes()
 
 
@@ -171,18 +149,7 @@ def host(db_path):
 
             if respuesta:
                 try:
-                    # Ejecutar con parámetros seguros
-                    cursor.execute("""
-                        UPDATE dbs
-                        SET estatus = 'Eliminada'
-                        WHERE db_name COLLATE NOCASE = ?
-                        AND usuario_windows COLLATE NOCASE = ?
-
-                    """, (db_name, usuario_actual))
-
-                    conn.commit()
-
-                    if cursor.rowcount > 0:
+                    if repositorio.eliminar_host(db_name, usuario_actual) > 0:
                         messagebox.showinfo("Éxito",
                                             f"La base de datos {db_name} ha sido marcada como eliminada.",
                                             parent=hosts_frame
@@ -223,16 +190,8 @@ def host(db_path):
                 db_name = hosts_tree.item(seleccion[0])['values'][0]
 
                 # Consultar la dirección completa desde la base de datos
-                cursor.execute("""
-                    SELECT direccion 
-                    FROM dbs 
-                    WHERE db_name = ? 
-                    AND usuario_windows = ?
-                """, (db_name, usuario_actual))
-
-                resultado = cursor.fetchone()
-                if resultado:
-                    direccion = resultado[0]
+                direccion = repositorio.direccion_de_host(db_name, usuario_actual)
+                if direccion:
                     messagebox.showinfo("Conectar", f"Conectando a: {direccion}", parent=hosts_frame)
                     print(f'Aqui es host personal: {direccion}')
                     from test_consulta_ordenada import registrar_ingreso
@@ -241,17 +200,15 @@ def host(db_path):
                     messagebox.showerror("Error", "No se pudo encontrar la dirección de la base de datos",
                                          parent=hosts_frame)
 
-        def cargar_hosts():
-            """Cargar los hosts del usuario"""
+        def cargar_hosts(hosts=None):
+            """Cargar los hosts del usuario (sin datos, se leen en segundo plano)"""
+            if hosts is None:
+                en_segundo_plano(hosts_tree, repositorio.hosts, usuario_actual,
+                                 clave="host_hosts", al_terminar=cargar_hosts)
+                return
+
             hosts_tree.delete(*hosts_tree.get_children())
-            cursor.execute("""
-                SELECT db_name, fecha_de_ultimo_acceso, objetivo, asuntos, direccion
-                FROM dbs
-                WHERE usuario_windows = ? AND estatus == 'Activa'
-                ORDER BY fecha_de_ultimo_acceso DESC
-            """, (usuario_actual,))
-
-            for host in cursor.fetchall():
+            for host in hosts:
                 # Insertamos todos los valores pero solo mostramos los primeros 4
                 hosts_tree.insert('', tk.END, values=host[:4] + ('',) + host[4:])
 
@@ -288,6 +245,14 @@ def host(db_path):
         otros_hosts_frame = ttk.Frame(notebook)
         notebook.add(otros_hosts_frame, text="Otros Host")
 
+        # Búsqueda en el servidor por nombre, propietario u objetivo
+        busqueda_frame = ttk.Frame(otros_hosts_frame)
+        busqueda_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+        ttk.Label(busqueda_frame, text="Buscar:").pack(side=tk.LEFT)
+        busqueda_var = tk.StringVar(master=host_window)
+        busqueda_entry = ttk.Entry(busqueda_frame, textvariable=busqueda_var, width=40)
+        busqueda_entry.pack(side=tk.LEFT, padx=5)
+
         # Treeview para otros hosts con columna adicional para el estado
         otros_hosts_tree = ttk.Treeview(
             otros_hosts_frame,
@@ -335,47 +300,33 @@ def host(db_path):
         )
         btn_ver_direccion.pack(pady=10)
 
-        def cargar_otros_hosts():
-            """Cargar otros hosts disponibles con su estado actual"""
-            otros_hosts_tree.delete(*otros_hosts_tree.get_children())
-
-            cursor.execute("""
-                SELECT 
-                    d.db_name, 
-                    d.usuario_windows, 
-                    d.objetivo, 
-                    d.asuntos, 
-                    d.fecha_creacion,
-                    d.direccion, 
-                    d.id,
-                    CASE 
-                        WHEN EXISTS (
-                            SELECT 1 FROM solicitudes_acceso 
-                            WHERE db_id = d.id 
-                            AND usuario_solicitante = ? 
-                            AND estatus = 'pendiente'
-                        ) THEN 'pendiente'
-                        WHEN EXISTS (
-                            SELECT 1 FROM solicitudes_acceso 
-                            WHERE db_id = d.id 
-                            AND usuario_solicitante = ? 
-                            AND estatus = 'aprobado'
-                        ) THEN 'aprobado'
-                        WHEN EXISTS (
-                            SELECT 1 FROM solicitudes_acceso 
-                            WHERE db_id = d.id 
-                            AND usuario_solicitante = ? 
-                            AND estatus = 'rechazado'
-                        ) THEN 'rechazado'
-                        ELSE 'disponible'
-                    END as estado
-                FROM dbs d
-                WHERE d.estatus = 'Activa' 
-                AND usuario_windows != 'Master'
-                AND d.usuario_windows COLLATE NOCASE != ?
-            """, (usuario_actual, usuario_actual, usuario_actual, usuario_actual))
-
-            for db in cursor.fetchall():
+        # Paginación por llave: se guarda el db_name de la última fila mostrada
+        pagina_otros = {'busqueda': '', 'ultimo': None, 'espera': None}
+
+        btn_cargar_mas = ttk.Button(otros_hosts_frame, text="Cargar más")
+
+        def cargar_otros_hosts(otros_hosts=None, continuar=False):
+            """Cargar otros hosts disponibles con su estado actual (una página)"""
+            if otros_hosts is None:
+                # La búsqueda o página nueva reemplaza a la que aún no llega
+                en_segundo_plano(
+                    otros_hosts_tree, repositorio.otros_hosts, usuario_actual,
+                    pagina_otros['busqueda'], pagina_otros['ultimo'] if continuar else None,
+                    clave="host_otros", al_terminar=lambda filas: cargar_otros_hosts(filas, continuar))
+                return
+
+            if not continuar:
+                otros_hosts_tree.delete(*otros_hosts_tree.get_children())
+                pagina_otros['ultimo'] = None
+            if otros_hosts:
+                pagina_otros['ultimo'] = otros_hosts[-1].db_name
+            # Una página incompleta es la última
+            if len(otros_hosts) >= PAGINA_OTROS_HOSTS:
+                btn_cargar_mas.pack(pady=(0, 10))
+            else:
+                btn_cargar_mas.pack_forget()
+
+            for db in otros_hosts:
                 db_id = db[6]
                 estado = db[7].lower()  # Convertir a minúsculas para los tags
 
@@ -397,6 +348,21 @@ def host(db_path):
                     tags=(estado,)
                 )
 
+        def buscar_otros_hosts(event=None):
+            """Aplica la búsqueda unos instantes después de dejar de escribir"""
+            if pagina_otros['espera']:
+                host_window.after_cancel(pagina_otros['espera'])
+
+            def aplicar():
+                pagina_otros['espera'] = None
+                pagina_otros['busqueda'] = busqueda_var.get().strip()
+                cargar_otros_hosts()
+
+            pagina_otros['espera'] = host_window.after(300, aplicar)
+
+        busqueda_entry.bind('<KeyRelease>', buscar_otros_hosts)
+        btn_cargar_mas.config(command=lambda: cargar_otros_hosts(continuar=True))
+
         def ver_direccion(tree):
             """Mostrar la dirección del host seleccionado"""
             seleccion = tree.selection()
@@ -450,19 +416,16 @@ def host(db_path):
                     solicitante = getpass.getuser()  # Obtener usuario de Windows si es "Master"
 
                 # Insertar nueva solicitud
-                cursor.execute("""
-                    INSERT INTO solicitudes_acceso 
-                    (db_id, usuario_solicitante, fecha_solicitud, estatus)
-                    VALUES (?, ?, ?, 'pendiente')
-                """, (db_id, solicitante, datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
-
-                conn.commit()
+                repositorio.solicitar_acceso(db_id, solicitante,
+                                             datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
                 messagebox.showinfo("Éxito",
                                     f"Solicitud enviada para: {db_name}",
                                     parent=otros_hosts_frame)
 
-                # Actualizar la vista
-                cargar_otros_hosts()
+                # Actualizar solo la fila (sin recargar el catálogo)
+                valores = list(otros_hosts_tree.item(db_id, 'values'))
+                valores[6] = '🟠 Pendiente'
+                otros_hosts_tree.item(db_id, values=valores, tags=('pendiente',))
                 btn_solicitar.config(state=tk.DISABLED)
 
             except sqlite3.IntegrityError:
@@ -478,31 +441,15 @@ def host(db_path):
         btn_solicitar.config(command=solicitar_acceso)
         otros_hosts_tree.bind('<<TreeviewSelect>>', on_select_otros_hosts)
 
-        # Cargar datos iniciales
-        cargar_otros_hosts()
-
-
-        # Configurar eventos
-        btn_solicitar.config(command=solicitar_acceso)
-        otros_hosts_tree.bind('<<TreeviewSelect>>', on_select_otros_hosts)
-
-        # Cargar datos iniciales
-        cargar_otros_hosts()
+        def cargar_hosts_compartidos(compartidos=None):
+            """Cargar los hosts compartidos (sin datos, se leen en segundo plano)"""
+            if compartidos is None:
+                en_segundo_plano(compartidos_tree, repositorio.compartidos, usuario_actual,
+                                 clave="host_compartidos", al_terminar=cargar_hosts_compartidos)
+                return
 
-        def cargar_hosts_compartidos():
-            """Cargar los hosts compartidos"""
             compartidos_tree.delete(*compartidos_tree.get_children())
-            cursor.execute("""
-                       SELECT d.db_name, s.usuario_solicitante, s.fecha_respuesta
-                       FROM solicitudes_acceso s
-                       JOIN dbs d ON s.db_id = d.id
-                       WHERE s.estatus = 'aprobado'
-                       AND d.usuario_windows = ?
-                       AND d.estatus = 'Activa'
-                       ORDER BY s.fecha_respuesta DESC
-                   """, (usuario_actual,))
-
-            for registro in cursor.fetchall():
+            for registro in compartidos:
                 compartidos_tree.insert('', tk.END, values=registro)
 
         def mostrar_menu_contextual(event):
@@ -519,76 +466,53 @@ def host(db_path):
                 db_name = compartidos_tree.item(seleccion[0])['values'][0]
                 usuario = compartidos_tree.item(seleccion[0])['values'][1]
 
-                cursor.execute("""
-                           UPDATE solicitudes_acceso 
-                           SET estatus = 'rechazado' 
-                           WHERE id = (
-                               SELECT s.id 
-                               FROM solicitudes_acceso s
-                               JOIN dbs d ON s.db_id = d.id
-                               WHERE d.db_name = ?
-                               AND s.usuario_solicitante = ?
-                               AND s.estatus = 'aprobado'
-                           )
-                       """, (db_name, usuario))
-                conn.commit()
+                repositorio.retirar_permiso(db_name, usuario)
                 cargar_hosts_compartidos()
 
 
         # Vincular evento de clic derecho
         compartidos_tree.bind("<Button-3>", mostrar_menu_contextual)
 
-        # Cargar datos de hosts compartidos
-        cargar_hosts_compartidos()
-
-        # Cargar datos iniciales
-        cargar_solicitudes()
-        cargar_hosts()
-        cargar_hosts_compartidos()  # Nueva línea
+        def mostrar_datos_iniciales(datos):
+            """Llena las cuatro pestañas con lo leído en datos_host"""
+            nonlocal usuario_actual
+            # Si no es propietario de alguna base de datos, se usa "Master" para pruebas
+            if not datos.es_propietario:
+                usuario_actual = "Master"
+            cargar_solicitudes(datos.solicitudes)
+            cargar_hosts(datos.hosts)
+            cargar_hosts_compartidos(datos.compartidos)
+            cargar_otros_hosts(datos.otros_hosts)
+
+        # Datos de las cuatro pestañas en una sola llamada, sin congelar la ventana
+        en_segundo_plano(
+            host_window, repositorio.datos_host, usuario_actual,
+            clave="host_datos", al_terminar=mostrar_datos_iniciales,
+            al_fallar=lambda e: messagebox.showerror("Error", f"Ocurrió un error: {str(e)}",
+                                                     parent=host_window))
+
+        def recargar_tras_cambio():
+            """Relee las cuatro pestañas cuando MASTER.db cambió (otro usuario aprobó, solicitó...)"""
+            invalidar_cache_master(MASTER)
+            cargar_solicitudes()
+            cargar_hosts()
+            cargar_hosts_compartidos()
+            cargar_otros_hosts()  # Conserva la búsqueda actual
+
+        suscribir(host_window, MASTER, recargar_tras_cambio)
         move_to_largest_monitor(host_window)
         # Iniciar el bucle principal de la GUI
         host_window.mainloop()  # ¡Añadir esta línea!
 
     except Exception as e:
         messagebox.showerror("Error", f"Ocurrió un error: {str(e)}")
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 
 def get_pending_requests_count(db_path):
     """Obtener el número de solicitudes pendientes para una base de datos específica"""
     try:
-        usuario_actual = os.getlogin()
-        conn = sqlite3.connect(MASTER)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT id, usuario_windows 
-            FROM dbs 
-            WHERE direccion = ?
-        """, (db_path,))
-
-        db_info = cursor.fetchone()
-
-        if db_info:
-            db_id, usuario_db = db_info[0], db_info[1]
-
-            # Solo contar si el usuario es el propietario
-            if usuario_actual.lower() == usuario_db.lower():
-                cursor.execute("""
-                            SELECT COUNT(*) 
-                            FROM solicitudes_acceso s
-                            JOIN dbs d ON s.db_id = d.id
-                            WHERE s.estatus = 'pendiente'
-                            AND d.usuario_windows = ?
-                        """, (usuario_actual,))
-
-                return cursor.fetchone()[0]
-        return 0
+        # Solo cuenta si el usuario actual es el propietario de la base de datos
+        return MasterRepository().solicitudes_pendientes(db_path, os.getlogin())
     except Exception as e:
         print(f"Error obteniendo solicitudes pendientes: {str(e)}")
         return 0
-    finally:
-        if conn:  # Cerrar la conexión si existe
-            conn.close()
\ No newline at end of file
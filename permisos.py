@@ -1,5 +1,5 @@
 from common import *
-from rutas import MASTER
+from sql.repositorio import MasterRepository
 
 def verificar_permisos(db_path):
     """
@@ -8,16 +8,7 @@ def verificar_permisos(db_path):
     """
     try:
         usuario_actual = os.getlogin()
-        conn = sqlite3.connect(MASTER)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT id, usuario_windows 
-            FROM dbs 
-            WHERE direccion LIKE ? 
-        """, (db_path + '%',))
-
-        db_info = cursor.fetchone()
+        db_info = MasterRepository().dueno_de(db_path)
 
         if db_info:
             db_id, usuario_db = db_info[0], db_info[1]
@@ -28,9 +19,6 @@ def verificar_permisos(db_path):
     except Exception as e:
         print(f"Error verificando permisos: {str(e)}")
         return (False, None, None)
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 
 def obtener_solicitudes_pendientes(db_id):
@@ -38,20 +26,7 @@ def obtener_solicitudes_pendientes(db_id):
     Obtiene el número de solicitudes pendientes para una base de datos
     """
     try:
-        conn = sqlite3.connect(MASTER)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT COUNT(*) 
-            FROM solicitudes_acceso 
-            WHERE db_id = ? 
-            AND estatus = 'pendiente'
-        """, (db_id,))
-
-        return cursor.fetchone()[0]
+        return MasterRepository().pendientes_de_db(db_id)
     except Exception as e:
         print(f"Error obteniendo solicitudes: {str(e)}")
         return 0
-    finally:
-        if 'conn' in locals():
-            conn.close()
\ No newline at end of file
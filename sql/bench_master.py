@@ -0,0 +1,192 @@
+# sql/bench_master.py
+"""Benchmark de las consultas frecuentes de MASTER.db antes y después de sus índices.
+
+Uso:  python -m sql.bench_master [--dbs 5000] [--ingresos 300000] [--repeticiones 50]
+
+Genera un MASTER sintético en un directorio temporal, mide cada consulta sin las
+migraciones de MIGRACIONES_MASTER, las aplica y vuelve a medir. Incluye la consulta
+original con OR de db_mas_reciente, la versión UNION ALL y la tabla ultimo_ingreso.
+"""
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from sql.migraciones import MIGRACIONES_MASTER, TABLA_INGRESOS, migrar
+from sql.repositorio import INGRESO_RECIENTE
+
+ESTATUS_SOLICITUD = ("pendiente", "aprobado", "rechazado")
+LIMITE_POR_CONSULTA = 3.0   # Segundos máximos midiendo una consulta (las lentas se cortan antes)
+
+# Versión original de db_mas_reciente, como referencia
+INGRESO_RECIENTE_OR = """
+    SELECT i.direccion
+      FROM ingresos AS i
+      JOIN dbs      AS d
+        ON i.direccion = d.direccion
+       AND d.estatus   <> 'Eliminada'
+     WHERE i.administrador = :usuario
+        OR i.esclavo       = :usuario
+     ORDER BY i.fecha_de_ultimo_acceso DESC
+     LIMIT 1"""
+
+INGRESO_RECIENTE_UNION = f"""
+    SELECT direccion FROM (
+        SELECT * FROM ({INGRESO_RECIENTE.format(rol="administrador")})
+        UNION ALL
+        SELECT * FROM ({INGRESO_RECIENTE.format(rol="esclavo")})
+    )
+    ORDER BY fecha DESC
+    LIMIT 1"""
+
+CONSULTAS = {
+    "db_mas_reciente (OR)": INGRESO_RECIENTE_OR,
+    "db_mas_reciente (UNION ALL)": INGRESO_RECIENTE_UNION,
+    "db_mas_reciente (ultimo_ingreso)": """
+        SELECT u.direccion FROM ultimo_ingreso u
+        JOIN dbs d ON u.direccion = d.direccion AND d.estatus <> 'Eliminada'
+        WHERE u.usuario = :usuario ORDER BY u.fecha DESC LIMIT 1""",
+    "usuario_tiene_dbs": "SELECT 1 FROM dbs WHERE usuario_windows = :usuario LIMIT 1",
+    "hosts": """SELECT db_name, fecha_de_ultimo_acceso FROM dbs
+                WHERE usuario_windows = :usuario AND estatus = 'Activa'
+                ORDER BY fecha_de_ultimo_acceso DESC""",
+    "solicitudes pendientes": """SELECT COUNT(*) FROM solicitudes_acceso s
+                                 JOIN dbs p ON s.db_id = p.id
+                                 WHERE s.estatus = 'pendiente' AND p.usuario_windows = :usuario""",
+    "estado en otros hosts": """SELECT COUNT(*) FROM dbs d WHERE EXISTS (
+                                    SELECT 1 FROM solicitudes_acceso
+                                    WHERE db_id = d.id AND usuario_solicitante = :usuario
+                                    AND estatus = 'aprobado')""",
+}
+
+
+def generar_master(ruta, num_dbs, num_ingresos, semilla=7):
+    """MASTER sintético: num_dbs minutas de num_dbs // 5 usuarios y sus ingresos"""
+    azar = random.Random(semilla)
+    usuarios = [f"usuario{n:04d}" for n in range(max(num_dbs // 5, 1))]
+    conn = sqlite3.connect(ruta)
+    conn.executescript(f"""
+        CREATE TABLE dbs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            usuario_windows TEXT NOT NULL,
+            db_name TEXT NOT NULL UNIQUE,
+            objetivo TEXT,
+            asuntos TEXT,
+            fecha_creacion DATETIME,
+            estatus TEXT DEFAULT 'Activa',
+            direccion TEXT UNIQUE,
+            fecha_de_ultimo_acceso DATETIME
+        );
+        CREATE TABLE solicitudes_acceso (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            db_id INTEGER,
+            usuario_solicitante TEXT,
+            fecha_solicitud TEXT,
+            estatus TEXT,
+            fecha_respuesta TEXT,
+            FOREIGN KEY(db_id) REFERENCES dbs(id)
+        );
+        {TABLA_INGRESOS};
+    """)
+
+    fecha = lambda: f"2024-{azar.randint(1, 12):02d}-{azar.randint(1, 28):02d} {azar.randint(0, 23):02d}:00:00"
+    minutas = []
+    for n in range(num_dbs):
+        dueno = azar.choice(usuarios)
+        direccion = f"\\\\servidor\\minutas\\{dueno}\\minuta_{n}.db"
+        estatus = "Eliminada" if azar.random() < 0.1 else "Activa"
+        minutas.append((n + 1, dueno, f"minuta_{n}", direccion))
+        conn.execute(
+            "INSERT INTO dbs (usuario_windows, db_name, objetivo, asuntos, fecha_creacion, estatus, direccion,"
+            " fecha_de_ultimo_acceso) VALUES (?, ?, 'o', 'a', ?, ?, ?, ?)",
+            (dueno, f"minuta_{n}", fecha(), estatus, direccion, fecha()))
+
+    conn.executemany(
+        "INSERT INTO solicitudes_acceso (db_id, usuario_solicitante, fecha_solicitud, estatus)"
+        " VALUES (?, ?, ?, ?)",
+        [(azar.randint(1, num_dbs), azar.choice(usuarios), fecha(), azar.choice(ESTATUS_SOLICITUD))
+         for _ in range(num_dbs * 2)])
+
+    def ingreso():
+        db_id, dueno, nombre, direccion = azar.choice(minutas)
+        esclavo = azar.choice(usuarios) if azar.random() < 0.3 else None
+        return (db_id, dueno, esclavo, nombre, direccion, fecha(), "solicitudes_acceso" if esclavo else "dbs")
+
+    conn.executemany(
+        "INSERT INTO ingresos (db_id, administrador, esclavo, db_name, direccion, fecha_de_ultimo_acceso,"
+        " tabla_origen) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (ingreso() for _ in range(num_ingresos)))
+    conn.commit()
+    conn.close()
+    return usuarios
+
+
+def medir(conn, usuarios, repeticiones):
+    """Milisegundos promedio por consulta, con un usuario distinto en cada repetición"""
+    tiempos = {}
+    for nombre, sql in CONSULTAS.items():
+        inicio = time.perf_counter()
+        hechas = 0
+        try:
+            while hechas < repeticiones and time.perf_counter() - inicio < LIMITE_POR_CONSULTA:
+                conn.execute(sql, {"usuario": usuarios[hechas % len(usuarios)]}).fetchall()
+                hechas += 1
+        except sqlite3.OperationalError:
+            tiempos[nombre] = None   # La tabla aún no existe (p. ej. antes de migrar)
+            continue
+        tiempos[nombre] = (time.perf_counter() - inicio) * 1000 / hechas
+    return tiempos
+
+
+def comprobar_resultados(conn, usuarios):
+    """UNION ALL y ultimo_ingreso encuentran el mismo último ingreso que la consulta con OR"""
+    # Se compara la fecha: con empates cada versión puede elegir otra minuta
+    con_fecha_or = INGRESO_RECIENTE_OR.replace(
+        "SELECT i.direccion", "SELECT i.direccion, i.fecha_de_ultimo_acceso", 1)
+    con_fecha_union = INGRESO_RECIENTE_UNION.replace("SELECT direccion FROM", "SELECT direccion, fecha FROM", 1)
+    con_fecha_resumen = CONSULTAS["db_mas_reciente (ultimo_ingreso)"].replace(
+        "SELECT u.direccion", "SELECT u.direccion, u.fecha", 1)
+    for usuario in usuarios[:200]:
+        antes = conn.execute(con_fecha_or, {"usuario": usuario}).fetchone()
+        for consulta in (con_fecha_union, con_fecha_resumen):
+            despues = conn.execute(consulta, {"usuario": usuario}).fetchone()
+            if (antes and antes[1]) != (despues and despues[1]):
+                return False
+    return True
+
+
+def main(num_dbs=5000, num_ingresos=300000, repeticiones=50):
+    directorio = tempfile.mkdtemp(prefix="bench_master_")
+    ruta = os.path.join(directorio, "MASTER.db")
+    try:
+        print(f"Generando MASTER con {num_dbs} dbs y {num_ingresos} ingresos...", flush=True)
+        usuarios = generar_master(ruta, num_dbs, num_ingresos)
+
+        conn = sqlite3.connect(ruta)
+        antes = medir(conn, usuarios, repeticiones)
+        inicio = time.perf_counter()
+        migrar(conn, MIGRACIONES_MASTER)
+        print(f"Migración de índices: {(time.perf_counter() - inicio) * 1000:.0f} ms")
+        despues = medir(conn, usuarios, repeticiones)
+        iguales = comprobar_resultados(conn, usuarios)
+        conn.close()
+
+        print(f"\n{'consulta':<34}{'sin índices':>14}{'con índices':>14}")
+        formato = lambda ms: f"{'-':>14}" if ms is None else f"{ms:>11.3f} ms"
+        for nombre in CONSULTAS:
+            print(f"{nombre:<34}{formato(antes[nombre])}{formato(despues[nombre])}")
+        print(f"\nUNION ALL y ultimo_ingreso equivalentes a OR: {'sí' if iguales else 'NO'}")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    argumentos = dict(zip(sys.argv[1::2], sys.argv[2::2]))
+    main(
+        int(argumentos.get("--dbs", 5000)),
+        int(argumentos.get("--ingresos", 300000)),
+        int(argumentos.get("--repeticiones", 50)),
+    )
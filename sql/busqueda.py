@@ -0,0 +1,41 @@
+# sql/busqueda.py
+"""Búsqueda de texto en acuerdos: FTS5 (bm25) con respaldo en LIKE."""
+import re
+
+# Peso de cada columna de acuerdos_fts en bm25: acuerdo, comentarios, comentarios_cierre
+PESOS_BM25 = (10.0, 3.0, 1.0)
+
+
+def expresion_fts(texto):
+    """Convierte lo escrito por el usuario en una consulta MATCH por prefijos.
+
+    'reunion prod' -> '"reunion"* "prod"*' (todas las palabras, cada una como prefijo)
+    """
+    palabras = re.findall(r"\w+", texto or "", re.UNICODE)
+    return " ".join(f'"{palabra}"*' for palabra in palabras)
+
+
+def fts_disponible(conn):
+    """Indica si la minuta ya tiene el índice acuerdos_fts"""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'acuerdos_fts'"
+    ).fetchone() is not None
+
+
+def filtro_texto(conn, texto):
+    """Piezas SQL para filtrar la tabla acuerdos por texto.
+
+    Devuelve (join, condicion, orden, params); orden es la expresión bm25 para
+    ordenar por relevancia, o None cuando se usa el respaldo con LIKE.
+    """
+    expresion = expresion_fts(texto)
+    if expresion and fts_disponible(conn):
+        pesos = ", ".join(str(p) for p in PESOS_BM25)
+        return (
+            "JOIN acuerdos_fts ON acuerdos_fts.rowid = acuerdos.id",
+            "acuerdos_fts MATCH ?",
+            f"bm25(acuerdos_fts, {pesos})",
+            [expresion],
+        )
+    return "", "acuerdos.acuerdo LIKE ?", None, [f"%{texto}%"]
+
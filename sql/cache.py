@@ -0,0 +1,63 @@
+# sql/cache.py
+"""Caché en memoria con vencimiento (TTL) para lecturas que casi nunca cambian.
+
+Las entradas se agrupan por archivo de base de datos para poder invalidar todo lo
+leído de un archivo cuando el propio proceso escribe en él.
+"""
+import threading
+import time
+
+_SIN_VALOR = object()
+
+
+class CacheTTL:
+    """Valores por (base de datos, clave) que vencen a los ttl segundos"""
+
+    def __init__(self):
+        self._entradas = {}
+        self._generacion = {}   # Cambia con cada invalidación de la base de datos
+        self._candado = threading.Lock()
+
+    def obtener(self, db_path, clave, ttl, cargar):
+        """Valor en caché, o el resultado de cargar() si no existe o ya venció"""
+        ahora = time.monotonic()
+        with self._candado:
+            vence, valor = self._entradas.get(db_path, {}).get(clave, (0.0, _SIN_VALOR))
+            generacion = self._generacion.get(db_path, 0)
+        if valor is not _SIN_VALOR and ahora < vence:
+            return valor
+
+        valor = cargar()  # Fuera del candado: la lectura puede tardar en la red
+        with self._candado:
+            # Si hubo una escritura mientras se leía, el valor ya puede estar viejo
+            if self._generacion.get(db_path, 0) == generacion:
+                self._entradas.setdefault(db_path, {})[clave] = (ahora + ttl, valor)
+        return valor
+
+    def buscar(self, db_path, clave):
+        """Valor vigente en caché, o None si no existe o ya venció (no lee la base)"""
+        with self._candado:
+            vence, valor = self._entradas.get(db_path, {}).get(clave, (0.0, None))
+        return valor if time.monotonic() < vence else None
+
+    def generacion(self, db_path):
+        """Marca a tomar antes de leer; guardar() descarta lo leído si hubo una escritura"""
+        with self._candado:
+            return self._generacion.get(db_path, 0)
+
+    def guardar(self, db_path, valores, ttl, generacion):
+        """Guarda varios valores {clave: valor} leídos juntos desde la generación indicada"""
+        vence = time.monotonic() + ttl
+        with self._candado:
+            if self._generacion.get(db_path, 0) == generacion:
+                entradas = self._entradas.setdefault(db_path, {})
+                for clave, valor in valores.items():
+                    entradas[clave] = (vence, valor)
+
+    def invalidar(self, db_path=None):
+        """Descarta lo leído de db_path (o todo si no se indica)"""
+        with self._candado:
+            rutas = set(self._entradas) | set(self._generacion) if db_path is None else [db_path]
+            for ruta in rutas:
+                self._entradas.pop(ruta, None)
+                self._generacion[ruta] = self._generacion.get(ruta, 0) + 1
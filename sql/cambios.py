@@ -0,0 +1,155 @@
+# sql/cambios.py
+"""Detección de cambios en las bases compartidas y aviso a las ventanas abiertas.
+
+Cada INTERVALO_MS se revisa, en el hilo del ejecutor, la firma del archivo (mtime
+y tamaño de la .db y de su -wal): es solo un stat y no abre la base. Si la firma
+cambió (o cada CONFIRMAR_CADA revisiones, por si el recurso compartido no
+actualiza el mtime a tiempo) se confirma con PRAGMA data_version, que cambia
+solo cuando otra conexión hizo commit. Únicamente entonces se publica el cambio
+a las ventanas suscritas, que vuelven a leer sus datos:
+
+    suscribir(arbol, db_path, lambda: actualizar_lista(arbol))
+
+La suscripción dura lo que viva el widget; cuando no queda ninguno vivo para una
+base se deja de revisar y se cierra su conexión.
+"""
+import os
+import sqlite3
+
+from sql.conexion import BUSY_TIMEOUT_MS
+from sql.ejecutor import en_segundo_plano
+
+INTERVALO_MS = 2000      # Frecuencia de revisión de la firma del archivo
+CONFIRMAR_CADA = 5       # Revisiones entre confirmaciones con data_version aunque la firma no cambie
+
+
+def firma_archivo(db_path):
+    """(mtime_ns, tamaño) de la base y de su -wal; None donde el archivo no existe"""
+    firma = []
+    for ruta in (db_path, db_path + "-wal"):
+        try:
+            estado = os.stat(ruta)
+            firma.append((estado.st_mtime_ns, estado.st_size))
+        except OSError:
+            firma.append(None)
+    return tuple(firma)
+
+
+class Vigilante:
+    """Estado de revisión de una base; sus métodos corren en el hilo del ejecutor"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.firma = None
+        self.version = None
+        self.revisiones = 0
+        self._conn = None        # Conexión propia: data_version no cambia con los commits de la misma conexión
+
+    def revisar(self):
+        """Indica si la base cambió desde la revisión anterior"""
+        firma = firma_archivo(self.db_path)
+        cambio_firma = self.firma is not None and firma != self.firma
+        self.firma = firma
+        self.revisiones += 1
+        if not cambio_firma and self.version is not None and self.revisiones % CONFIRMAR_CADA:
+            return False
+
+        version = self._data_version()
+        if version is None:
+            return cambio_firma
+        anterior, self.version = self.version, version
+        if anterior is None:
+            return cambio_firma
+        return version != anterior
+
+    def _data_version(self):
+        if firma_archivo(self.db_path)[0] is None:
+            self.cerrar()
+            return None  # Recurso sin acceso: no se crea un archivo vacío al conectar
+        try:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000,
+                                             check_same_thread=False)
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Error al revisar cambios en {self.db_path}: {e}")
+            self.cerrar()
+            return None
+
+    def cerrar(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+        self.version = None
+
+
+_suscriptores = {}   # db_path -> [(widget, al_cambiar)]
+_vigilantes = {}     # db_path -> Vigilante
+_programadas = {}    # db_path -> ventana raíz con la próxima revisión programada
+_en_curso = {}       # db_path -> Tarea de la revisión que aún no termina
+
+
+def _vivo(widget):
+    if widget is None:
+        return False
+    try:
+        return bool(widget.winfo_exists())
+    except Exception:
+        return False
+
+
+def _vivos(db_path):
+    """Depura y devuelve los suscriptores cuyo widget sigue existiendo"""
+    vivos = [(w, f) for w, f in _suscriptores.get(db_path, []) if _vivo(w)]
+    _suscriptores[db_path] = vivos
+    return vivos
+
+
+def suscribir(widget, db_path, al_cambiar):
+    """Llama a al_cambiar() (hilo de Tk) cada vez que otra conexión modifique db_path"""
+    _suscriptores.setdefault(db_path, []).append((widget, al_cambiar))
+    if db_path not in _vigilantes:
+        _vigilantes[db_path] = Vigilante(db_path)
+    if not _vivo(_programadas.get(db_path)):
+        _revisar(db_path)
+
+
+def publicar(db_path):
+    """Avisa a los suscriptores vivos de db_path que sus datos cambiaron"""
+    for _widget, al_cambiar in _vivos(db_path):
+        try:
+            al_cambiar()
+        except Exception as e:
+            print(f"Error al refrescar tras un cambio en {db_path}: {e}")
+
+
+def _revisar(db_path):
+    """Envía una revisión al ejecutor y programa la siguiente desde un suscriptor vivo"""
+    _programadas.pop(db_path, None)
+    vivos = _vivos(db_path)
+    vigilante = _vigilantes.get(db_path)
+    if not vivos or vigilante is None:
+        _suscriptores.pop(db_path, None)
+        vigilante = _vigilantes.pop(db_path, None)
+        _en_curso.pop(db_path, None)
+        if vigilante is not None:
+            en_segundo_plano(None, vigilante.cerrar)  # La conexión es del hilo del ejecutor
+        return
+
+    try:
+        # En la raíz, para que cerrar la ventana que suscribió no corte las revisiones
+        raiz = vivos[0][0].nametowidget(".")
+    except Exception:
+        return  # La siguiente suscripción vuelve a programar la revisión
+
+    tarea = _en_curso.get(db_path)
+    if tarea is None or tarea.futuro.done():
+        # Sin reemplazar una revisión lenta (SMB): su resultado no debe perderse
+        _en_curso[db_path] = en_segundo_plano(
+            raiz, vigilante.revisar, indicador=False,
+            al_terminar=lambda cambio: publicar(db_path) if cambio else None)
+    raiz.after(INTERVALO_MS, lambda: _revisar(db_path))
+    _programadas[db_path] = raiz
@@ -0,0 +1,149 @@
+# sql/carga.py
+"""Carga de trabajo por responsable (acuerdos abiertos, atrasados y cerrados) mantenida por triggers.
+
+Uso:  python -m sql.carga minuta.db [--reconstruir]
+
+La tarjeta "Responsable Frecuente" y el orden de los selectores contaban los
+acuerdos de cada persona en cada lectura. carga_responsables guarda esos totales
+y los triggers los recalculan solo para las personas afectadas por cada alta,
+edición o cierre (una búsqueda por índice en acuerdo_responsables). Recalcular
+por persona, en lugar de sumar y restar, hace que el resultado no dependa del
+orden en que SQLite dispara los triggers de una misma sentencia.
+
+"Atrasado" depende del día: los triggers cuentan los acuerdos abiertos con
+compromiso anterior al día de corte (carga_corte). Al leer se suman los que
+vencieron desde el corte (rango del índice de compromiso_dia) y la primera
+escritura de cada día avanza el corte (avanzar_corte).
+
+Sin --reconstruir el módulo solo verifica la tabla contra los acuerdos.
+"""
+import sqlite3
+import sys
+
+# Día local de hoy con la misma escala que acuerdos.compromiso_dia
+HOY = "CAST(julianday('now', 'localtime') - 2440587.5 AS INTEGER)"
+
+ABIERTO = "a.estatus IS NOT 'Cerrado'"
+
+# Totales de las personas de {usuarios} (subconsulta de usuario_id) calculados desde los acuerdos
+TOTALES = f"""
+    SELECT ar.usuario_id,
+           SUM({ABIERTO}),
+           SUM({ABIERTO} AND a.compromiso_dia < (SELECT dia FROM carga_corte WHERE id = 1)),
+           SUM(a.estatus = 'Cerrado')
+    FROM acuerdo_responsables ar
+    JOIN acuerdos a ON a.id = ar.acuerdo_id
+    WHERE ar.usuario_id IN ({{usuarios}})
+    GROUP BY ar.usuario_id"""
+
+
+def recalculo(usuarios):
+    """Sentencias que rehacen las filas de las personas de la subconsulta usuarios"""
+    return (f"DELETE FROM carga_responsables WHERE usuario_id IN ({usuarios});"
+            f"INSERT INTO carga_responsables (usuario_id, abiertos, atrasados, cerrados)"
+            f"{TOTALES.format(usuarios=usuarios)};")
+
+
+def crear_carga(conn):
+    """Tablas carga_responsables y carga_corte, sus triggers y el llenado inicial"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS carga_responsables (
+            usuario_id INTEGER PRIMARY KEY REFERENCES usuarios(id),
+            abiertos INTEGER NOT NULL DEFAULT 0,
+            atrasados INTEGER NOT NULL DEFAULT 0,
+            cerrados INTEGER NOT NULL DEFAULT 0
+        )""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_carga_abiertos ON carga_responsables(abiertos)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS carga_corte (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            dia INTEGER NOT NULL
+        )""")
+    conn.execute(f"INSERT OR IGNORE INTO carga_corte (id, dia) VALUES (1, {HOY})")
+
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_carga_responsable_insert
+        AFTER INSERT ON acuerdo_responsables
+        BEGIN
+            {recalculo("NEW.usuario_id")}
+        END""")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_carga_responsable_delete
+        AFTER DELETE ON acuerdo_responsables
+        BEGIN
+            {recalculo("OLD.usuario_id")}
+        END""")
+    # Altas y cambios de responsables pasan por acuerdo_responsables; aquí, cierres y fechas
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_carga_acuerdo_update
+        AFTER UPDATE OF estatus, compromiso_dia ON acuerdos
+        WHEN NEW.estatus IS NOT OLD.estatus OR NEW.compromiso_dia IS NOT OLD.compromiso_dia
+        BEGIN
+            {recalculo("SELECT usuario_id FROM acuerdo_responsables WHERE acuerdo_id = NEW.id")}
+        END""")
+
+    recalcular_carga(conn)
+
+
+def recalcular_carga(conn):
+    """Reconstruye carga_responsables desde cero (sin confirmar la transacción)"""
+    conn.execute("DELETE FROM carga_responsables")
+    conn.execute(f"INSERT INTO carga_responsables (usuario_id, abiertos, atrasados, cerrados)"
+                 f"{TOTALES.format(usuarios='SELECT usuario_id FROM acuerdo_responsables')}")
+
+
+def avanzar_corte(conn):
+    """Lleva el día de corte a hoy y recalcula los atrasados de quienes tienen acuerdos vencidos entre ambos"""
+    corte, hoy = conn.execute(f"SELECT dia, {HOY} FROM carga_corte WHERE id = 1").fetchone()
+    if corte == hoy:
+        return
+    conn.execute("UPDATE carga_corte SET dia = ? WHERE id = 1", (hoy,))
+    afectados = f"""
+        SELECT ar.usuario_id FROM acuerdos a
+        JOIN acuerdo_responsables ar ON ar.acuerdo_id = a.id
+        WHERE {ABIERTO} AND a.compromiso_dia >= {min(corte, hoy)} AND a.compromiso_dia < {max(corte, hoy)}"""
+    for sentencia in recalculo(afectados).split(";"):
+        if sentencia.strip():
+            conn.execute(sentencia)
+
+
+def atrasados_al_dia(conn, hoy):
+    """(expresión SQL, parámetros) de los atrasados de la fila c de carga_responsables al día hoy"""
+    corte = conn.execute("SELECT dia FROM carga_corte WHERE id = 1").fetchone()[0]
+    if corte == hoy:
+        return "c.atrasados", []
+    # Los acuerdos que vencieron entre el corte y hoy (o al revés, si el reloj va atrás)
+    signo = 1 if hoy > corte else -1
+    return f"""c.atrasados + {signo} * (
+        SELECT COUNT(*) FROM acuerdo_responsables ar
+        JOIN acuerdos a ON a.id = ar.acuerdo_id
+        WHERE ar.usuario_id = c.usuario_id AND {ABIERTO}
+          AND a.compromiso_dia >= ? AND a.compromiso_dia < ?)""", [min(corte, hoy), max(corte, hoy)]
+
+
+def verificar_carga(conn):
+    """[(usuario_id, guardado, calculado)] de las personas cuya carga no coincide con los acuerdos"""
+    guardada = {fila[0]: tuple(fila[1:]) for fila in conn.execute(
+        "SELECT usuario_id, abiertos, atrasados, cerrados FROM carga_responsables")}
+    calculada = {fila[0]: tuple(fila[1:]) for fila in conn.execute(
+        TOTALES.format(usuarios="SELECT usuario_id FROM acuerdo_responsables"))}
+    return [(usuario_id, guardada.get(usuario_id), calculada.get(usuario_id))
+            for usuario_id in sorted(guardada.keys() | calculada.keys())
+            if guardada.get(usuario_id) != calculada.get(usuario_id)]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    conn = sqlite3.connect(sys.argv[1], isolation_level=None)
+    diferencias = verificar_carga(conn)
+    for usuario_id, guardado, calculado in diferencias:
+        print(f"usuario {usuario_id}: guardado {guardado}, calculado {calculado}")
+    print(f"{len(diferencias)} personas con carga distinta")
+    if diferencias and "--reconstruir" in sys.argv:
+        conn.execute("BEGIN IMMEDIATE")
+        recalcular_carga(conn)
+        conn.execute("COMMIT")
+        print("carga_responsables reconstruida")
+    conn.close()
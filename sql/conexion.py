@@ -0,0 +1,195 @@
+# sql/conexion.py
+"""Administrador de conexiones reutilizables para las minutas (.db) en la red.
+
+Cada hilo conserva una conexión abierta por ruta de base de datos, configurada
+siempre con los mismos PRAGMAs y con caché de sentencias. Así las pantallas no
+pagan la apertura/lectura del esquema sobre SMB en cada consulta.
+"""
+import sqlite3
+import threading
+import time
+
+from rutas import MODO_LOCAL
+from sql import traza
+
+BUSY_TIMEOUT_MS = 10000          # Espera máxima ante bloqueos de otros usuarios
+CACHE_SIZE_KIB = 16384           # Caché de páginas por conexión (16 MiB)
+SENTENCIAS_EN_CACHE = 256        # Sentencias preparadas que conserva sqlite3
+INTERVALO_VERIFICACION = 30      # Segundos sin uso antes de comprobar la conexión
+
+# Mensajes de SQLite que indican que el recurso compartido se cayó
+ERRORES_DE_RED = (
+    "disk i/o error",
+    "unable to open database file",
+    "cannot operate on a closed database",
+)
+
+_local = threading.local()
+
+
+def es_error_de_red(error):
+    """Indica si el error de SQLite corresponde a una caída del recurso compartido"""
+    mensaje = str(error).lower()
+    return any(texto in mensaje for texto in ERRORES_DE_RED)
+
+
+def _claves_foraneas_validas(conn):
+    """Verifica que cada FOREIGN KEY del esquema apunte a una columna única.
+
+    SQLite lanza 'foreign key mismatch' en cada INSERT si la columna padre no es
+    PRIMARY KEY ni tiene índice UNIQUE, así que en ese caso no se activan.
+    """
+    tablas = [fila[0] for fila in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+    for tabla in tablas:
+        for fk in conn.execute(f"PRAGMA foreign_key_list('{tabla}')").fetchall():
+            padre, columna = fk[2], fk[4]
+            if columna is None:
+                continue  # Referencia a la PRIMARY KEY implícita
+            pk = [c[1] for c in conn.execute(f"PRAGMA table_info('{padre}')") if c[5]]
+            if pk == [columna]:
+                continue
+            unicos = [
+                idx[1] for idx in conn.execute(f"PRAGMA index_list('{padre}')")
+                if idx[2] and not (len(idx) > 4 and idx[4])  # único y no parcial
+            ]
+            if not any(
+                [c[2] for c in conn.execute(f"PRAGMA index_info('{idx}')")] == [columna]
+                for idx in unicos
+            ):
+                return False
+    return True
+
+
+class ConexionMinuta:
+    """Conexión del pool: close() la devuelve al pool en lugar de cerrarla"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conexion = None
+        self.ultimo_uso = 0.0
+        self.sentencias = 0          # Viajes a la base de datos (ver sentencias_ejecutadas)
+        self.abrir()
+
+    def abrir(self):
+        """Abre la conexión física y aplica los PRAGMAs comunes"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            cached_statements=SENTENCIAS_EN_CACHE,
+        )
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        activar_fk = _claves_foraneas_validas(conn)
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if activar_fk else 'OFF'}")
+        self.page_size = conn.execute("PRAGMA page_size").fetchone()[0] if traza.ACTIVA else None
+        self.conexion = conn
+        self.ultimo_uso = time.monotonic()
+
+    def reconectar(self):
+        """Descarta la conexión actual y abre una nueva"""
+        try:
+            self.conexion.close()
+        except sqlite3.Error:
+            pass
+        self.abrir()
+
+    def verificar(self):
+        """Comprueba la conexión si estuvo inactiva y la reabre si el recurso se cayó"""
+        if time.monotonic() - self.ultimo_uso < INTERVALO_VERIFICACION:
+            return
+        try:
+            # Lee el encabezado del archivo: falla si el recurso compartido ya no responde
+            self.conexion.execute("PRAGMA schema_version").fetchone()
+        except sqlite3.Error as e:
+            print(f"Reconectando a {self.db_path}: {e}")
+            self.reconectar()
+
+    def execute(self, sql, params=()):
+        """Ejecuta una sentencia reintentando una vez si se perdió la conexión"""
+        self.sentencias += 1
+        try:
+            return self.cursor().execute(sql, params)
+        except (sqlite3.OperationalError, sqlite3.ProgrammingError) as e:
+            if not es_error_de_red(e) or self.conexion.in_transaction:
+                raise
+            self.reconectar()
+            return self.cursor().execute(sql, params)
+
+    def executemany(self, sql, params):
+        self.sentencias += 1
+        return self.cursor().executemany(sql, params)
+
+    def cursor(self):
+        """Cursor de la conexión (medido si la traza SQL está activa)"""
+        cursor = self.conexion.cursor()
+        if traza.ACTIVA:
+            return traza.CursorTrazado(cursor, self.db_path, self.page_size)
+        return cursor
+
+    def commit(self):
+        if traza.ACTIVA and self.conexion.in_transaction:
+            traza.medir_commit(self.db_path, self.conexion.commit)
+        else:
+            self.conexion.commit()
+
+    def rollback(self):
+        self.conexion.rollback()
+
+    def close(self):
+        """Devuelve la conexión al pool descartando cualquier transacción pendiente"""
+        if self.conexion.in_transaction:
+            self.conexion.rollback()
+
+    def __enter__(self):
+        self.conexion.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        if traza.ACTIVA and exc[0] is None and self.conexion.in_transaction:
+            return traza.medir_commit(self.db_path, lambda: self.conexion.__exit__(*exc))
+        return self.conexion.__exit__(*exc)
+
+    def __getattr__(self, nombre):
+        return getattr(self.conexion, nombre)
+
+
+def conectar(db_path, lectura=False):
+    """Obtiene la conexión reutilizable del hilo actual para la base de datos indicada.
+
+    Con lectura=True y el modo sin conexión activo, la conexión apunta a la réplica local.
+    """
+    if lectura and MODO_LOCAL:
+        from sql.replica import replica_de
+        db_path = replica_de(db_path).ruta_lectura()
+
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = _local.pool = {}
+
+    conexion = pool.get(db_path)
+    if conexion is None:
+        conexion = pool[db_path] = ConexionMinuta(db_path)
+    else:
+        conexion.verificar()
+    conexion.ultimo_uso = time.monotonic()
+    return conexion
+
+
+def cerrar_conexiones(db_path=None):
+    """Cierra físicamente las conexiones del hilo actual (todas o solo las de db_path)"""
+    pool = getattr(_local, "pool", None)
+    if not pool:
+        return
+    for ruta in [r for r in pool if db_path is None or r == db_path]:
+        try:
+            pool.pop(ruta).conexion.close()
+        except sqlite3.Error:
+            pass
+
+
+def sentencias_ejecutadas(db_path):
+    """Sentencias que la conexión del hilo actual ha enviado a db_path (0 si no hay conexión)"""
+    conexion = (getattr(_local, "pool", None) or {}).get(db_path)
+    return conexion.sentencias if conexion else 0
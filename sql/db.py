@@ -1,111 +1,113 @@
-from rutas import DB_PATH
+from rutas import DB_PATH, MASTER, RAIZ
 from common import *
 from acuerdos.ventana_names import move_to_largest_monitor
 from sql.nombre import sanitizar_nombre
+from sql.conexion import conectar, cerrar_conexiones, sentencias_ejecutadas
+from sql.repositorio import MasterRepository
+from sql.migraciones import migrar, version_de, MIGRACIONES_MASTER
+
+# MASTER.db cuyo esquema ya se verificó en este proceso
+_masters_verificados = set()
 
 
 class MasterDBManager:
     """Clase para manejar la conexión con la base de datos maestra"""
 
     def __init__(self):
-        self.master_db_path = r"\\mercury\Producción\Minutas Produccion\Program Files\dbs_rutas\master.db"
+        self.master_db_path = MASTER
+        self.repositorio = MasterRepository(MASTER)
         self.current_user = getpass.getuser()
         self.ensure_master_table()  # Crear tabla si no existe
 
     def user_exists(self):
         try:
-            conn = sqlite3.connect(self.master_db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM dbs WHERE usuario_windows = ? LIMIT 1", (self.current_user,))
-            return cursor.fetchone() is not None
+            return self.repositorio.usuario_tiene_dbs(self.current_user)
         except sqlite3.Error as e:
             print(f"Error checking if user exists: {e}")
             return False
-        finally:
-            conn.close()
 
     def get_default_db(self):
         try:
-            conn = sqlite3.connect(self.master_db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT direccion FROM dbs WHERE db_name = 'Default' LIMIT 1")
-            result = cursor.fetchone()
-            return result[0] if result else None
+            return self.repositorio.db_default()
         except sqlite3.Error as e:
             print(f"Error retrieving default DB: {e}")
             return None
-        finally:
-            conn.close()
 
     def ensure_master_table(self):
-        """Crea la estructura de la tabla maestra si no existe"""
+        """Crea/actualiza la estructura de la base maestra una sola vez por proceso"""
+        if self.master_db_path in _masters_verificados:
+            return
         try:
-            conn = sqlite3.connect(self.master_db_path)
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS dbs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    usuario_windows TEXT NOT NULL,
-                    db_name TEXT NOT NULL UNIQUE,
-                    objetivo TEXT,
-                    asuntos TEXT,
-                    fecha_creacion DATETIME,
-                    estatus TEXT DEFAULT 'Activa',
-                    direccion TEXT UNIQUE,
-                    fecha_de_ultimo_acceso DATETIME
-                )
-            """)
-            conn.commit()
-            conn.close()
+            conn = conectar(self.master_db_path)
+            try:
+                # Solo se escribe en el archivo compartido si su esquema está atrasado
+                if version_de(conn) < len(MIGRACIONES_MASTER):
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS dbs (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            usuario_windows TEXT NOT NULL,
+                            db_name TEXT NOT NULL UNIQUE,
+                            objetivo TEXT,
+                            asuntos TEXT,
+                            fecha_creacion DATETIME,
+                            estatus TEXT DEFAULT 'Activa',
+                            direccion TEXT UNIQUE,
+                            fecha_de_ultimo_acceso DATETIME
+                        )
+                    """)
+                    conn.commit()
+                    # Índices y resúmenes de las consultas frecuentes de MASTER.db
+                    migrar(conn, MIGRACIONES_MASTER)
+            finally:
+                conn.close()
         except sqlite3.Error as e:
             print(f"Error al crear tabla maestra: {str(e)}")
             raise
 
+        # Retención de la bitácora de ingresos (solo trabaja si hay ingresos viejos)
+        try:
+            compactados = self.repositorio.compactar_ingresos()
+            if compactados:
+                print(f"Ingresos compactados en ingresos_diarios: {compactados}")
+        except sqlite3.Error as e:
+            print(f"No se pudo compactar ingresos: {str(e)}")
+
+        _masters_verificados.add(self.master_db_path)
+
+    def resolver_db_inicial(self):
+        """Ruta de la minuta con la que arranca el usuario (una consulta a MASTER.db).
+
+        Devuelve (ruta, es_default); ruta es None si el usuario existe pero no tiene
+        ingresos ni hay minuta 'Default'.
+        """
+        inicio = self.repositorio.inicio(self.current_user)
+        if not inicio.usuario_existe:
+            if not inicio.default:
+                raise Exception("No se encontró la base de datos predeterminada 'Default'.")
+            return inicio.default, True
+
+        if not inicio.reciente:
+            print("No se encontró ingreso reciente, buscando base de datos 'Default' en dbs...")
+        return inicio.reciente or inicio.default, False
+
     def get_most_recent_db(self):
         """Obtiene la ruta de la base de datos más reciente del usuario actual,
         o la base de datos 'Default' si no hay ingresos registrados."""
-        conn = None
         try:
-            conn = sqlite3.connect(self.master_db_path)
-            cursor = conn.cursor()
-
             # Primera consulta: buscar en ingresos por usuario actual
-            cursor.execute("""
-                SELECT i.direccion
-                  FROM ingresos AS i
-                  JOIN dbs      AS d
-                    ON i.direccion = d.direccion
-                   AND d.estatus   <> 'Eliminada'
-                 WHERE i.administrador = ?
-                    OR i.esclavo       = ?
-                 ORDER
-                    BY i.fecha_de_ultimo_acceso DESC
-                 LIMIT 1;
-
-            """, (self.current_user, self.current_user))
-            result = cursor.fetchone()
+            direccion = self.repositorio.db_mas_reciente(self.current_user)
 
             # Si no hay resultado, buscar en dbs por nombre 'Default'
-            if not result:
+            if not direccion:
                 print("No se encontró ingreso reciente, buscando base de datos 'Default' en dbs...")
-                cursor.execute("""
-                    SELECT direccion 
-                    FROM dbs 
-                    WHERE db_name = 'Default'
-                    LIMIT 1
-                """)
-                result = cursor.fetchone()
+                direccion = self.repositorio.db_default()
 
-            return result[0] if result else None
+            return direccion
 
         except sqlite3.Error as e:
             print(f"Error al consultar master.db: {str(e)}")
             return None
 
-        finally:
-            if conn:
-                conn.close()
-
 
 class MinutasDB:
     def __init__(self, root=None, db_path=None, is_default=True):  # Nuevo parámetro
@@ -114,29 +116,20 @@ class MinutasDB:
         self.db_created = False
         self.is_default = is_default  # Nuevo atributo
 
-        master_manager = MasterDBManager()
-        # Paso 1: Verificar si el usuario actual existe en la tabla dbs
-        if not master_manager.user_exists():
-            # Paso 2: Obtener la DB por defecto
-            default_db_path = master_manager.get_default_db()
+        self.master_manager = MasterDBManager()
+        # Usuario existente, su DB más reciente y la DB por defecto en una sola consulta
+        try:
+            ruta_inicial, self.is_default = self.master_manager.resolver_db_inicial()
+        except sqlite3.Error as e:
+            print(f"Error al consultar master.db: {str(e)}")
+            raise Exception("No se encontró la base de datos predeterminada 'Default'.")
 
-            if default_db_path:
-                self.db_path = default_db_path
-                self.is_default = True  # Flag opcional para saber que se usó la default
-            else:
-                raise Exception("No se encontró la base de datos predeterminada 'Default'.")
+        if ruta_inicial:
+            self.db_path = ruta_inicial
         else:
-            # El usuario existe, obtener su DB más reciente
-            most_recent_db = master_manager.get_most_recent_db()
-
-            if most_recent_db:
-                self.db_path = most_recent_db
-                self.is_default = False
-            else:
-                # Usuario existe pero no tiene DBs aún. Se genera una nueva.
-                default_dir = fr"\\mercury\Producción\Minutas Produccion\Program Files\{self.current_user}"
-                self.db_path = self.generate_unique_db_path(default_dir)
-                self.is_default = False
+            # Usuario existe pero no tiene DBs aún. Se genera una nueva.
+            default_dir = os.path.join(RAIZ, self.current_user)
+            self.db_path = self.generate_unique_db_path(default_dir)
 
 
         if not self.try_create_db():
@@ -175,9 +168,17 @@ class MinutasDB:
             if not os.path.exists(self.db_path):
                 self.create_database()
 
-            # Verificar integridad de la DB
-            with sqlite3.connect(self.db_path) as test_conn:
-                test_conn.execute("SELECT name FROM sqlite_master WHERE type='table';")
+            # Verificar integridad de la DB y actualizar su esquema
+            conn = conectar(self.db_path)
+            try:
+                conn.execute("SELECT name FROM sqlite_master WHERE type='table';")
+                aplicadas = migrar(conn)
+            finally:
+                conn.close()
+
+            if aplicadas:
+                # Reabrir para que los PRAGMAs (foreign_keys) vean los nuevos índices
+                cerrar_conexiones(self.db_path)
 
             return True
 
@@ -207,46 +208,17 @@ class MinutasDB:
         try:
             if not self.is_default:
                 return  # No registrar si no es default
-            master_manager = MasterDBManager()
-            conn = sqlite3.connect(master_manager.master_db_path)
-            cursor = conn.cursor()
+            repositorio = self.master_manager.repositorio
 
-            # Verificar si ya existe el registro
-            cursor.execute("SELECT id FROM dbs WHERE direccion = ?", (self.db_path,))
-            exists = cursor.fetchone()
-
-            if exists:
-                update_query = """
-                UPDATE dbs 
-                SET fecha_de_ultimo_acceso = datetime('now') 
-                WHERE direccion = ?
-                """
-                cursor.execute(update_query, (self.db_path,))
-            else:
-                insert_query = """
-                INSERT INTO dbs (
-                    usuario_windows, 
-                    db_name, 
-                    objetivo, 
-                    asuntos, 
-                    fecha_creacion, 
-                    estatus, 
-                    direccion, 
-                    fecha_de_ultimo_acceso
-                ) VALUES (?, ?, ?, ?, datetime('now'), ?, ?, datetime('now'))
-                """
-                db_name = os.path.basename(self.db_path)
-                cursor.execute(insert_query, (
+            # Actualizar el último acceso, o registrar la minuta si aún no existe
+            if not repositorio.tocar_db(self.db_path):
+                repositorio.registrar_db(
                     self.current_user,
-                    db_name,
+                    os.path.basename(self.db_path),
                     "Minuta principal",
                     "Seguimiento de acuerdos generales",
-                    "Activa",
                     self.db_path
-                ))
-
-            conn.commit()
-            conn.close()
+                )
         except sqlite3.Error as e:
             print(f"Error al actualizar/insertar en master.db: {str(e)}")
             raise
@@ -257,7 +229,10 @@ def db_create():
     root.withdraw()
 
     try:
+        consultas_previas = sentencias_ejecutadas(MASTER)
         minutas = MinutasDB(root)
+        # Viajes a MASTER.db durante el arranque, para notar regresiones
+        print(f"Arranque: {sentencias_ejecutadas(MASTER) - consultas_previas} consultas a MASTER.db")
         root.destroy()
         return minutas.db_path
     except Exception as e:
@@ -340,31 +315,15 @@ def crear_nueva_minuta():
         """Registra en la base de datos maestra"""
         try:
             master_manager = MasterDBManager()
-            conn = sqlite3.connect(master_manager.master_db_path)
-            cursor = conn.cursor()
 
             # Guardamos el nombre sin extensión para db_name
             if nombre.lower().endswith('.db'):
                 nombre = nombre[:-3]
             print(f'NOMBRE LIMPIO: {nombre}')
-            insert_query = """
-            INSERT INTO dbs (
-                usuario_windows, db_name, objetivo, asuntos, 
-                fecha_creacion, estatus, direccion, fecha_de_ultimo_acceso
-            ) VALUES (?, ?, ?, ?, datetime('now'), ?, ?, datetime('now'))
-            """
-
-            cursor.execute(insert_query, (
-                master_manager.current_user,
-                nombre,
-                objetivo,
-                asuntos,
-                "Activa",
-                ruta
-            ))
 
-            conn.commit()
-            conn.close()
+            master_manager.repositorio.registrar_db(
+                master_manager.current_user, nombre, objetivo, asuntos, ruta
+            )
         except sqlite3.Error as e:
             print(f"Error al registrar en master.db: {str(e)}")
 
@@ -378,7 +337,7 @@ def crear_nueva_minuta():
         asuntos = entries[2][0].get().strip()
 
         usuario = getpass.getuser()
-        directorio_base = fr"\\mercury\Producción\Minutas Produccion\Program Files\{usuario}"
+        directorio_base = os.path.join(RAIZ, usuario)
 
         try:
             os.makedirs(directorio_base, exist_ok=True)
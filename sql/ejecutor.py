@@ -0,0 +1,196 @@
+# sql/ejecutor.py
+"""Ejecutor de consultas en segundo plano integrado con el ciclo de eventos de Tk.
+
+Un hilo de trabajo ejecuta las lecturas (con sus propias conexiones del pool, que
+es por hilo) y deja los resultados en una cola. El hilo de Tk los recoge con
+after() y llama a los callbacks, de modo que la ventana no se congela mientras el
+recurso compartido responde. Tk no es seguro entre hilos: los callbacks siempre
+corren en el hilo principal.
+
+    en_segundo_plano(arbol, repositorio.pagina_acuerdos, filtros,
+                     clave="acuerdos", al_terminar=mostrar)
+
+Una tarea con la misma clave que otra aún pendiente la reemplaza: la anterior se
+cancela si no empezó, o su resultado se descarta si ya estaba corriendo. Con
+indicador=False la ventana no muestra el cursor de ocupado (revisiones de fondo).
+"""
+import queue
+import threading
+from concurrent.futures import Future
+
+INTERVALO_MS = 30            # Frecuencia con la que Tk revisa resultados listos
+CURSOR_OCUPADO = "watch"
+
+
+class Tarea:
+    """Trabajo enviado al ejecutor; futuro expone el concurrent.futures.Future"""
+
+    def __init__(self, funcion, args, kwargs, clave, widget, al_terminar, al_fallar, indicador=True):
+        self.funcion = funcion
+        self.args = args
+        self.kwargs = kwargs
+        self.clave = clave
+        self.widget = widget
+        self.al_terminar = al_terminar
+        self.al_fallar = al_fallar
+        self.futuro = Future()
+        self.indicador = indicador
+        self.reemplazada = False
+        self.ventana = None          # Toplevel que revisa el resultado (y muestra el indicador)
+
+    def cancelar(self):
+        """Cancela la tarea; si ya está corriendo, su resultado no se entrega"""
+        self.reemplazada = True
+        self.futuro.cancel()
+
+
+class Ejecutor:
+    """Un hilo de trabajo para consultas y entrega de resultados vía after()"""
+
+    def __init__(self):
+        self._pendientes = queue.Queue()
+        self._listas = queue.Queue()
+        self._por_clave = {}
+        self._en_curso = {}          # toplevel -> tareas en curso
+        self._ocupados = {}          # toplevel -> tareas en curso con indicador de ocupado
+        self._sondeando = set()      # toplevels con un after() programado
+        self._hilo = threading.Thread(target=self._trabajar, name="ejecutor-sql", daemon=True)
+        self._hilo.start()
+
+    # ------------------------------------------------------------ hilo de trabajo
+
+    def _trabajar(self):
+        while True:
+            tarea = self._pendientes.get()
+            if not tarea.futuro.set_running_or_notify_cancel():
+                self._listas.put(tarea)  # Cancelada antes de empezar: solo se libera el indicador
+                continue
+            try:
+                tarea.futuro.set_result(tarea.funcion(*tarea.args, **tarea.kwargs))
+            except BaseException as e:
+                tarea.futuro.set_exception(e)
+            self._listas.put(tarea)
+
+    # ------------------------------------------------------------ hilo de Tk
+
+    def enviar(self, widget, funcion, *args, clave=None, al_terminar=None, al_fallar=None, indicador=True,
+               **kwargs):
+        """Ejecuta funcion(*args, **kwargs) en segundo plano y devuelve la Tarea.
+
+        Debe llamarse desde el hilo de Tk. al_terminar(resultado) o al_fallar(error)
+        se llaman en ese hilo, siempre que widget siga existiendo.
+        """
+        tarea = Tarea(funcion, args, kwargs, clave, widget, al_terminar, al_fallar, indicador)
+        if clave is not None:
+            anterior = self._por_clave.get(clave)
+            if anterior is not None:
+                anterior.cancelar()
+            self._por_clave[clave] = tarea
+
+        ventana = tarea.ventana = self._ventana(widget)
+        if ventana is not None:
+            self._en_curso[ventana] = self._en_curso.get(ventana, 0) + 1
+            if indicador:
+                self._ocupados[ventana] = self._ocupados.get(ventana, 0) + 1
+                if self._ocupados[ventana] == 1:
+                    self._cambiar_cursor(ventana, CURSOR_OCUPADO)
+            self._sondear(ventana)
+
+        self._pendientes.put(tarea)
+        return tarea
+
+    def cancelar(self, clave):
+        """Descarta la tarea pendiente con esa clave (p. ej. si el dato ya salió de la caché)"""
+        tarea = self._por_clave.get(clave)
+        if tarea is not None:
+            tarea.cancelar()
+
+    def _ventana(self, widget):
+        try:
+            return widget.winfo_toplevel() if widget is not None and widget.winfo_exists() else None
+        except Exception:
+            return None  # Widget ya destruido
+
+    def _cambiar_cursor(self, ventana, cursor):
+        try:
+            ventana.config(cursor=cursor)
+        except Exception:
+            pass
+
+    def _sondear(self, ventana):
+        if ventana in self._sondeando:
+            return
+        self._sondeando.add(ventana)
+        try:
+            ventana.after(INTERVALO_MS, lambda: self._despachar(ventana))
+        except Exception:
+            self._sondeando.discard(ventana)
+
+    def _despachar(self, ventana):
+        """Entrega los resultados listos (corre en el hilo de Tk)"""
+        self._sondeando.discard(ventana)
+        while True:
+            try:
+                tarea = self._listas.get_nowait()
+            except queue.Empty:
+                break
+            self._entregar(tarea)
+
+        if any(self._en_curso.values()):
+            # Siguen tareas en curso: se sigue revisando desde cualquier ventana viva
+            for ventana_ocupada in [v for v, n in self._en_curso.items() if n]:
+                if self._ventana(ventana_ocupada) is not None:
+                    self._sondear(ventana_ocupada)
+                    break
+
+    def _entregar(self, tarea):
+        if self._por_clave.get(tarea.clave) is tarea:
+            del self._por_clave[tarea.clave]
+        self._liberar(tarea)
+
+        if tarea.reemplazada or tarea.futuro.cancelled() or self._ventana(tarea.widget) is None:
+            return
+        nombre = getattr(tarea.funcion, "__name__", tarea.funcion)
+        error = tarea.futuro.exception()
+        try:
+            if error is None:
+                if tarea.al_terminar:
+                    tarea.al_terminar(tarea.futuro.result())
+            elif tarea.al_fallar:
+                tarea.al_fallar(error)
+            else:
+                print(f"Error en consulta en segundo plano ({nombre}): {error}")
+        except Exception as e:
+            print(f"Error al mostrar el resultado de {nombre}: {e}")
+
+    def _liberar(self, tarea):
+        """Descuenta la tarea de su ventana (y de su indicador de ocupado)"""
+        ventana = tarea.ventana
+        if ventana is None or ventana not in self._en_curso:
+            return
+        self._en_curso[ventana] -= 1
+        if self._en_curso[ventana] <= 0:
+            del self._en_curso[ventana]
+        if tarea.indicador and ventana in self._ocupados:
+            self._ocupados[ventana] -= 1
+            if self._ocupados[ventana] <= 0:
+                del self._ocupados[ventana]
+                self._cambiar_cursor(ventana, "")
+
+
+_ejecutor = None
+_candado_global = threading.Lock()
+
+
+def obtener_ejecutor():
+    """Ejecutor compartido del proceso (se crea al primer uso)"""
+    global _ejecutor
+    with _candado_global:
+        if _ejecutor is None:
+            _ejecutor = Ejecutor()
+        return _ejecutor
+
+
+def en_segundo_plano(widget, funcion, *args, **kwargs):
+    """Atajo de obtener_ejecutor().enviar(...)"""
+    return obtener_ejecutor().enviar(widget, funcion, *args, **kwargs)
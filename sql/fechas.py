@@ -0,0 +1,55 @@
+# sql/fechas.py
+"""Días y rangos de fechas con la escala de las columnas numéricas de acuerdos.
+
+compromiso_dia cuenta días desde 1970-01-01 y estatus_epoch segundos desde la
+misma fecha (ver migraciones.fechas_numericas). Aquí se convierten las fechas de
+la ventana a esas escalas para que las consultas usen los índices.
+"""
+from datetime import date, datetime
+
+EPOCA = date(1970, 1, 1)
+SEGUNDOS_DIA = 86400
+
+
+def numero_de_dia(fecha):
+    """date -> número de día comparable con la columna compromiso_dia"""
+    return (fecha - EPOCA).days
+
+
+def hoy_dia():
+    """Número de día de hoy (fecha local)"""
+    return numero_de_dia(date.today())
+
+
+def inicio_dia_epoch(texto):
+    """'2025-03-14' -> segundos epoch del inicio de ese día (None si no es una fecha válida)"""
+    try:
+        return numero_de_dia(datetime.strptime(texto.strip(), "%Y-%m-%d").date()) * SEGUNDOS_DIA
+    except ValueError:
+        return None
+
+
+def filtro_rango_estatus(desde, hasta):
+    """Condiciones SQL (y parámetros) para filtrar por fecha_estatus entre dos días.
+
+    Usa el índice de estatus_epoch e incluye el día final completo; si el texto no
+    es una fecha válida se compara como texto, igual que antes.
+    """
+    condiciones, params = [], []
+    if desde:
+        inicio = inicio_dia_epoch(desde)
+        if inicio is None:
+            condiciones.append("acuerdos.fecha_estatus >= ?")
+            params.append(desde)
+        else:
+            condiciones.append("acuerdos.estatus_epoch >= ?")
+            params.append(inicio)
+    if hasta:
+        fin = inicio_dia_epoch(hasta)
+        if fin is None:
+            condiciones.append("acuerdos.fecha_estatus <= ?")
+            params.append(hasta)
+        else:
+            condiciones.append("acuerdos.estatus_epoch < ?")
+            params.append(fin + SEGUNDOS_DIA)
+    return condiciones, params
@@ -0,0 +1,106 @@
+# sql/metricas.py
+"""Totales de la minuta para las tarjetas del menú, en una fila mantenida por triggers.
+
+Uso:  python -m sql.metricas minuta.db [--reconstruir]
+
+El menú contaba los acuerdos por estatus, los pendientes y promediaba los días de
+cierre recorriendo toda la tabla antes de pintarse. La fila única de metricas guarda
+esos totales (y la suma de días con la que se saca el promedio) y cada alta,
+cambio o borrado de un acuerdo resta lo que aportaba la fila antes (OLD) y suma
+lo que aporta después (NEW). Los triggers de fechas_numericas y version_acuerdos
+actualizan el mismo acuerdo después del alta; cada una de esas actualizaciones
+vuelve a restar y sumar, así que el total no depende del orden de los triggers.
+
+Sin --reconstruir el módulo solo compara la fila con los acuerdos.
+"""
+import sqlite3
+import sys
+
+# Columnas de metricas y lo que aporta cada acuerdo ({fila} es NEW, OLD o la tabla)
+APORTES = {
+    "activos": "{fila}.estatus = 'Activo'",
+    "editados": "{fila}.estatus = 'Editado'",
+    "cerrados": "{fila}.estatus = 'Cerrado'",
+    # Filas de la tabla de pendientes del menú
+    "pendientes": "{fila}.estatus != 'Cerrado' AND {fila}.compromiso_dia IS NOT NULL",
+    # Segundos entre el cierre y el compromiso (el promedio se divide al leer)
+    "segundos_cierre": "CASE WHEN {fila}.estatus = 'Cerrado'"
+                       " THEN {fila}.compromiso_dia * 86400 - {fila}.estatus_epoch END",
+    "cierres_con_fecha": "{fila}.estatus = 'Cerrado'"
+                         " AND {fila}.compromiso_dia IS NOT NULL AND {fila}.estatus_epoch IS NOT NULL",
+}
+
+
+def _ajuste(signo, fila):
+    """SET que suma (signo '+') o resta (signo '-') el aporte de fila a cada total"""
+    return ", ".join(f"{columna} = {columna} {signo} COALESCE({aporte.format(fila=fila)}, 0)"
+                     for columna, aporte in APORTES.items())
+
+
+def crear_metricas(conn):
+    """Tabla metricas (una fila), sus triggers y el cálculo inicial"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS metricas (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            {", ".join(f"{columna} INTEGER NOT NULL DEFAULT 0" for columna in APORTES)}
+        )""")
+    conn.execute("INSERT OR IGNORE INTO metricas (id) VALUES (1)")
+
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_metricas_insert AFTER INSERT ON acuerdos
+        BEGIN
+            UPDATE metricas SET {_ajuste("+", "NEW")} WHERE id = 1;
+        END""")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_metricas_update
+        AFTER UPDATE OF estatus, compromiso_dia, estatus_epoch ON acuerdos
+        BEGIN
+            UPDATE metricas SET {_ajuste("-", "OLD")} WHERE id = 1;
+            UPDATE metricas SET {_ajuste("+", "NEW")} WHERE id = 1;
+        END""")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_metricas_delete AFTER DELETE ON acuerdos
+        BEGIN
+            UPDATE metricas SET {_ajuste("-", "OLD")} WHERE id = 1;
+        END""")
+
+    recalcular_metricas(conn)
+
+
+def _calculadas(conn):
+    """Totales de metricas calculados recorriendo los acuerdos"""
+    sumas = ", ".join(f"COALESCE(SUM({aporte.format(fila='acuerdos')}), 0)" for aporte in APORTES.values())
+    fila = conn.execute(f"SELECT {sumas} FROM acuerdos").fetchone()
+    return dict(zip(APORTES, fila))
+
+
+def recalcular_metricas(conn):
+    """Rehace la fila de metricas desde los acuerdos (sin confirmar la transacción)"""
+    totales = _calculadas(conn)
+    conn.execute(f"UPDATE metricas SET {', '.join(f'{columna} = ?' for columna in totales)} WHERE id = 1",
+                 list(totales.values()))
+
+
+def verificar_metricas(conn):
+    """{columna: (guardado, calculado)} de los totales que no coinciden con los acuerdos"""
+    guardadas = dict(zip(APORTES, conn.execute(
+        f"SELECT {', '.join(APORTES)} FROM metricas WHERE id = 1").fetchone()))
+    return {columna: (guardadas[columna], calculado)
+            for columna, calculado in _calculadas(conn).items() if guardadas[columna] != calculado}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    conn = sqlite3.connect(sys.argv[1], isolation_level=None)
+    diferencias = verificar_metricas(conn)
+    for columna, (guardado, calculado) in diferencias.items():
+        print(f"{columna}: guardado {guardado}, calculado {calculado}")
+    print(f"{len(diferencias)} totales distintos")
+    if diferencias and "--reconstruir" in sys.argv:
+        conn.execute("BEGIN IMMEDIATE")
+        recalcular_metricas(conn)
+        conn.execute("COMMIT")
+        print("metricas reconstruida")
+    conn.close()
@@ -0,0 +1,533 @@
+# sql/migraciones.py
+"""Migraciones de esquema de las minutas, controladas con PRAGMA user_version.
+
+Cada migración se aplica una sola vez y en orden; al terminar se guarda su número
+en user_version dentro de la misma transacción. Para agregar una nueva basta con
+escribir la función y añadirla al final de MIGRACIONES (minutas) o de
+MIGRACIONES_MASTER (MASTER.db).
+"""
+import json
+import sqlite3
+
+from sql.carga import crear_carga
+from sql.metricas import crear_metricas
+
+
+def indices_base(conn):
+    """Índices para las búsquedas por id_acuerdo, historial y nombre de usuario"""
+    duplicados = conn.execute(
+        "SELECT 1 FROM acuerdos GROUP BY id_acuerdo HAVING COUNT(*) > 1 LIMIT 1"
+    ).fetchone()
+    if duplicados:
+        # Minutas antiguas pueden tener IDs repetidos (dos acuerdos en el mismo segundo)
+        print("Hay id_acuerdo duplicados; se crea un índice no único")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_acuerdos_id_acuerdo ON acuerdos(id_acuerdo)")
+    else:
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_acuerdos_id_acuerdo ON acuerdos(id_acuerdo)")
+
+    conn.execute("""CREATE INDEX IF NOT EXISTS idx_historial_acuerdo_fecha
+                    ON historial_acuerdos(id_acuerdo, fecha_modificacion)""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_usuarios_nombre ON usuarios(nombre)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_usuarios_nombre_lower ON usuarios(LOWER(nombre))")
+
+
+def indices_parciales(conn):
+    """Índices parciales para acuerdos abiertos y para el PDF de cierre"""
+    conn.execute("""CREATE INDEX IF NOT EXISTS idx_acuerdos_abiertos
+                    ON acuerdos(fecha_compromiso) WHERE estatus != 'Cerrado'""")
+    conn.execute("""CREATE INDEX IF NOT EXISTS idx_historial_cierres
+                    ON historial_acuerdos(id_acuerdo, fecha_modificacion) WHERE estatus = 'Cerrado'""")
+
+
+# Separa la cadena "Nombre A, Nombre B" en filas (acuerdo_id, usuario, nombre, posicion).
+# {origen} es la consulta semilla: NEW.* dentro de triggers o toda la tabla al migrar.
+PARTES_RESPONSABLES = """
+    WITH RECURSIVE partes(acuerdo_id, usuario, nombre, resto, posicion) AS (
+        {origen}
+        UNION ALL
+        SELECT acuerdo_id, usuario,
+               trim(substr(resto, 1, instr(resto, ',') - 1)),
+               substr(resto, instr(resto, ',') + 1),
+               posicion + 1
+        FROM partes WHERE resto != ''
+    )"""
+
+# Nombres que no existen en usuarios se dan de alta como 'Legado'
+ALTA_LEGADO = """
+    INSERT INTO usuarios (nombre, fecha_registro, usuario_registra, estatus)
+    {partes}
+    SELECT MIN(nombre), datetime('now'), MIN(usuario), 'Legado' FROM partes
+    WHERE nombre != ''
+      AND NOT EXISTS (SELECT 1 FROM usuarios u WHERE LOWER(u.nombre) = LOWER(partes.nombre))
+    GROUP BY LOWER(nombre)"""
+
+ALTA_RESPONSABLES = """
+    INSERT OR IGNORE INTO acuerdo_responsables (acuerdo_id, usuario_id, posicion)
+    {partes}
+    SELECT acuerdo_id,
+           (SELECT u.id FROM usuarios u WHERE LOWER(u.nombre) = LOWER(partes.nombre)
+            ORDER BY u.estatus = 'Eliminado', u.id LIMIT 1),
+           posicion
+    FROM partes WHERE nombre != ''"""
+
+
+def sentencias_responsables(origen):
+    """Sentencias que llenan acuerdo_responsables a partir de la consulta semilla"""
+    partes = PARTES_RESPONSABLES.format(origen=origen)
+    return ALTA_LEGADO.format(partes=partes) + ";" + ALTA_RESPONSABLES.format(partes=partes) + ";"
+
+
+def responsables_normalizados(conn):
+    """Tabla acuerdo_responsables (ids) mantenida por triggers desde acuerdos.responsables"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS acuerdo_responsables (
+            acuerdo_id INTEGER NOT NULL REFERENCES acuerdos(id),
+            usuario_id INTEGER NOT NULL REFERENCES usuarios(id),
+            posicion INTEGER NOT NULL,
+            PRIMARY KEY (acuerdo_id, usuario_id)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""CREATE INDEX IF NOT EXISTS idx_responsables_usuario
+                    ON acuerdo_responsables(usuario_id, acuerdo_id)""")
+
+    nuevo = "SELECT NEW.id, NEW.usuario_registra, '', NEW.responsables || ',', 0"
+    # Cada CREATE se ejecuta por separado: executescript confirmaría la transacción
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_responsables_insert
+        AFTER INSERT ON acuerdos
+        BEGIN
+            {sentencias_responsables(nuevo)}
+        END""")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_responsables_update
+        AFTER UPDATE OF responsables ON acuerdos
+        BEGIN
+            DELETE FROM acuerdo_responsables WHERE acuerdo_id = NEW.id;
+            {sentencias_responsables(nuevo)}
+        END""")
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_responsables_delete
+        BEFORE DELETE ON acuerdos
+        BEGIN
+            DELETE FROM acuerdo_responsables WHERE acuerdo_id = OLD.id;
+        END""")
+
+    # Cadena de responsables derivada de la tabla normalizada
+    conn.execute("""
+        CREATE VIEW IF NOT EXISTS v_acuerdo_responsables AS
+        SELECT a.id AS acuerdo_id,
+               a.id_acuerdo,
+               (SELECT group_concat(nombre, ', ') FROM (
+                    SELECT u.nombre FROM acuerdo_responsables ar
+                    JOIN usuarios u ON u.id = ar.usuario_id
+                    WHERE ar.acuerdo_id = a.id
+                    ORDER BY ar.posicion)) AS responsables
+        FROM acuerdos a""")
+
+    # Llenado inicial con los acuerdos existentes
+    todos = "SELECT id, usuario_registra, '', responsables || ',', 0 FROM acuerdos"
+    for sentencia in sentencias_responsables(todos).split(";"):
+        if sentencia.strip():
+            conn.execute(sentencia)
+
+
+def busqueda_texto(conn):
+    """Índice FTS5 sobre acuerdo y comentarios, sin acentos y con prefijos"""
+    try:
+        conn.execute("SAVEPOINT fts")
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS acuerdos_fts USING fts5(
+                acuerdo, comentarios, comentarios_cierre,
+                content='acuerdos', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            )""")
+        conn.execute("RELEASE fts")
+    except sqlite3.OperationalError as e:
+        # SQLite sin FTS5: la búsqueda sigue funcionando con LIKE (sql/busqueda.py)
+        conn.execute("ROLLBACK TO fts")
+        conn.execute("RELEASE fts")
+        print(f"FTS5 no disponible, se omite el índice de texto: {e}")
+        return
+
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_fts_insert AFTER INSERT ON acuerdos
+        BEGIN
+            INSERT INTO acuerdos_fts(rowid, acuerdo, comentarios, comentarios_cierre)
+            VALUES (NEW.id, NEW.acuerdo, NEW.comentarios, NEW.comentarios_cierre);
+        END""")
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_fts_delete AFTER DELETE ON acuerdos
+        BEGIN
+            INSERT INTO acuerdos_fts(acuerdos_fts, rowid, acuerdo, comentarios, comentarios_cierre)
+            VALUES ('delete', OLD.id, OLD.acuerdo, OLD.comentarios, OLD.comentarios_cierre);
+        END""")
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_fts_update
+        AFTER UPDATE OF acuerdo, comentarios, comentarios_cierre ON acuerdos
+        BEGIN
+            INSERT INTO acuerdos_fts(acuerdos_fts, rowid, acuerdo, comentarios, comentarios_cierre)
+            VALUES ('delete', OLD.id, OLD.acuerdo, OLD.comentarios, OLD.comentarios_cierre);
+            INSERT INTO acuerdos_fts(rowid, acuerdo, comentarios, comentarios_cierre)
+            VALUES (NEW.id, NEW.acuerdo, NEW.comentarios, NEW.comentarios_cierre);
+        END""")
+    conn.execute("INSERT INTO acuerdos_fts(acuerdos_fts) VALUES ('rebuild')")
+
+
+# Expresiones SQL para las columnas numéricas de fecha (NULL si el texto no es fecha)
+DIA = "CAST(julianday({0}) - 2440587.5 AS INTEGER)"   # días desde 1970-01-01
+EPOCH = "CAST(strftime('%s', {0}) AS INTEGER)"        # segundos desde 1970-01-01
+
+
+def fechas_numericas(conn):
+    """Columnas compromiso_dia, estatus_epoch y registro_epoch mantenidas por triggers"""
+    existentes = {c[1] for c in conn.execute("PRAGMA table_info(acuerdos)")}
+    for columna in ("compromiso_dia", "estatus_epoch", "registro_epoch"):
+        if columna not in existentes:
+            conn.execute(f"ALTER TABLE acuerdos ADD COLUMN {columna} INTEGER")
+
+    asignaciones = (
+        f"compromiso_dia = {DIA.format('NEW.fecha_compromiso')}, "
+        f"estatus_epoch = {EPOCH.format('NEW.fecha_estatus')}, "
+        f"registro_epoch = {EPOCH.format('NEW.fecha_registro')}"
+    )
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_fechas_insert AFTER INSERT ON acuerdos
+        BEGIN
+            UPDATE acuerdos SET {asignaciones} WHERE id = NEW.id;
+        END""")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_fechas_update
+        AFTER UPDATE OF fecha_compromiso, fecha_estatus, fecha_registro ON acuerdos
+        BEGIN
+            UPDATE acuerdos SET {asignaciones} WHERE id = NEW.id;
+        END""")
+
+    conn.execute(f"""
+        UPDATE acuerdos SET
+            compromiso_dia = {DIA.format('fecha_compromiso')},
+            estatus_epoch = {EPOCH.format('fecha_estatus')},
+            registro_epoch = {EPOCH.format('fecha_registro')}""")
+
+    # Los índices sobre el texto de fecha_compromiso quedan reemplazados por compromiso_dia
+    conn.execute("DROP INDEX IF EXISTS idx_acuerdos_abiertos")
+    conn.execute("""CREATE INDEX IF NOT EXISTS idx_acuerdos_abiertos_dia
+                    ON acuerdos(compromiso_dia) WHERE estatus != 'Cerrado'""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_acuerdos_estatus_dia ON acuerdos(estatus, compromiso_dia)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_acuerdos_estatus_epoch ON acuerdos(estatus_epoch)")
+
+
+# Prioridad de estatus en la lista de acuerdos (Editado, Activo, Cerrado, otros)
+ORDEN_ESTATUS = """
+    CASE
+        WHEN acuerdos.estatus = 'Editado' THEN 1
+        WHEN acuerdos.estatus = 'Activo' THEN 2
+        WHEN acuerdos.estatus = 'Cerrado' THEN 3
+        ELSE 4
+    END"""
+
+
+def indices_orden_lista(conn):
+    """Índices con el orden de la lista de acuerdos, para paginarla por keyset"""
+    # La expresión debe ser la misma que usa ORDER BY (sin el prefijo de tabla)
+    conn.execute(f"""CREATE INDEX IF NOT EXISTS idx_acuerdos_prioridad
+                     ON acuerdos(({ORDEN_ESTATUS.replace('acuerdos.', '')}), fecha_compromiso)""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_acuerdos_fecha_estatus ON acuerdos(fecha_estatus)")
+
+
+def version_acuerdos(conn):
+    """Columna version mantenida por triggers: cada alta o cambio toma la más alta + 1"""
+    existentes = {c[1] for c in conn.execute("PRAGMA table_info(acuerdos)")}
+    if "version" not in existentes:
+        conn.execute("ALTER TABLE acuerdos ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+    conn.execute("UPDATE acuerdos SET version = id")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_acuerdos_version ON acuerdos(version)")
+
+    siguiente = "UPDATE acuerdos SET version = (SELECT MAX(version) FROM acuerdos) + 1 WHERE id = NEW.id;"
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_version_insert AFTER INSERT ON acuerdos
+        BEGIN
+            {siguiente}
+        END""")
+    # El WHEN evita que la propia actualización de version vuelva a disparar el trigger
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_version_update AFTER UPDATE ON acuerdos
+        WHEN NEW.version IS OLD.version
+        BEGIN
+            {siguiente}
+        END""")
+
+
+# Bits de historial_acuerdos.cambios: columnas que modificó la escritura registrada en la fila
+CAMBIOS_HISTORIAL = {
+    "acuerdo": 1,
+    "responsables": 2,
+    "fecha_compromiso": 4,
+    "estatus": 8,
+    "comentarios": 16,
+    "comentarios_cierre": 32,
+}
+MAX_DELTA = 80   # Caracteres que guarda el delta de cada valor (antes y después)
+
+
+def _corto(valor):
+    texto = "" if valor is None else str(valor)
+    return texto if len(texto) <= MAX_DELTA else texto[:MAX_DELTA - 1] + "…"
+
+
+def cambios_entre(antes, despues):
+    """(máscara, delta JSON) entre dos {columna: valor}; delta = {columna: [antes, después]} recortado"""
+    mascara, delta = 0, {}
+    for columna, valor in despues.items():
+        anterior = antes.get(columna)
+        if (anterior or "") == (valor or ""):
+            continue  # NULL y '' se muestran igual
+        mascara |= CAMBIOS_HISTORIAL[columna]
+        delta[columna] = [_corto(anterior), _corto(valor)]
+    return mascara, json.dumps(delta, ensure_ascii=False) if delta else None
+
+
+def cambios_historial(conn):
+    """Columnas cambios (máscara) y delta en historial_acuerdos, calculadas al escribir.
+
+    Las filas existentes se completan una sola vez. Las de edición guardan el
+    acuerdo antes del cambio y se comparan con el estado que siguió (la fila
+    siguiente o el acuerdo vigente); las de cierre (estatus 'Cerrado' con ruta_pdf)
+    guardan el estado después, así que su estatus y comentarios_cierre se comparan
+    con los que tenía el acuerdo antes de cerrarse. comentarios no se compara:
+    antes solo se copiaba al historial cuando era el campo editado.
+    sql/verificar_historial.py comprueba el resultado contra sql/operaciones.py.
+    """
+    existentes = {c[1] for c in conn.execute("PRAGMA table_info(historial_acuerdos)")}
+    if "cambios" not in existentes:
+        conn.execute("ALTER TABLE historial_acuerdos ADD COLUMN cambios INTEGER")
+    if "delta" not in existentes:
+        conn.execute("ALTER TABLE historial_acuerdos ADD COLUMN delta TEXT")
+
+    columnas = ("acuerdo", "responsables", "fecha_compromiso", "estatus")
+    vigentes = {fila[0]: dict(zip(columnas, fila[1:])) for fila in conn.execute(
+        f"SELECT id_acuerdo, {', '.join(columnas)} FROM acuerdos")}
+    # Orden de escritura: las fechas de cierre las elige el usuario y no siguen al reloj
+    filas = conn.execute(f"""
+        SELECT id, id_acuerdo, {', '.join(columnas)}, comentarios_cierre,
+               estatus = 'Cerrado' AND ruta_pdf IS NOT NULL AS cierre
+        FROM historial_acuerdos
+        WHERE cambios IS NULL
+        ORDER BY id_acuerdo, id""").fetchall()
+
+    # Estado del acuerdo antes de cada fila, de la más antigua a la más reciente
+    antes, acuerdo_actual, anterior, cierre_previo = [], None, None, None
+    for fila in filas:
+        version = dict(zip(columnas, fila[2:6]))
+        if fila[1] != acuerdo_actual:
+            acuerdo_actual, anterior, cierre_previo = fila[1], None, None
+        if fila[7]:
+            # Antes del cierre: Activo al registrarse, Editado tras una edición (lo que
+            # dejaban todas las pantallas de edición) o Cerrado si ya estaba cerrado
+            estatus = "Activo" if anterior is None else "Cerrado" if anterior[7] else "Editado"
+            antes.append(dict(version, estatus=estatus, comentarios_cierre=cierre_previo))
+            cierre_previo = fila[6]
+        else:
+            antes.append(version)
+        anterior = fila
+
+    # Cada fila se compara con el estado que dejó: el de la fila siguiente o el vigente
+    actualizaciones = []
+    for posicion, fila in enumerate(filas):
+        if fila[7]:
+            despues = {"estatus": "Cerrado", "comentarios_cierre": fila[6]}
+            actualizaciones.append(cambios_entre(antes[posicion], despues) + (fila[0],))
+            continue
+        if posicion + 1 < len(filas) and filas[posicion + 1][1] == fila[1]:
+            siguiente = antes[posicion + 1]
+        else:
+            siguiente = vigentes.get(fila[1])
+        if siguiente is not None:
+            despues = {columna: siguiente[columna] for columna in columnas}
+            actualizaciones.append(cambios_entre(antes[posicion], despues) + (fila[0],))
+    conn.executemany("UPDATE historial_acuerdos SET cambios = ?, delta = ? WHERE id = ?", actualizaciones)
+
+
+MIGRACIONES = [
+    indices_base,               # 1
+    indices_parciales,          # 2
+    responsables_normalizados,  # 3
+    busqueda_texto,             # 4
+    fechas_numericas,           # 5
+    indices_orden_lista,        # 6
+    version_acuerdos,           # 7
+    cambios_historial,          # 8
+    crear_carga,                # 9
+    crear_metricas,             # 10
+]
+
+VERSION_ACTUAL = len(MIGRACIONES)
+
+
+# ---------------------------------------------------------------- MASTER.db
+
+# Misma definición con la que registrar_ingreso crea la tabla en masters antiguos
+TABLA_INGRESOS = """
+    CREATE TABLE IF NOT EXISTS ingresos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        db_id INTEGER NOT NULL,
+        administrador TEXT,
+        esclavo TEXT,
+        db_name TEXT,
+        direccion TEXT NOT NULL,
+        fecha_de_ultimo_acceso TEXT NOT NULL,
+        tabla_origen TEXT,
+        FOREIGN KEY(db_id) REFERENCES dbs(id)
+    )"""
+
+
+def _existe_tabla(conn, tabla):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (tabla,)
+    ).fetchone() is not None
+
+
+def _columna_indexada(conn, tabla, columna):
+    """Indica si algún índice de la tabla empieza por la columna"""
+    return any(
+        conn.execute(f"PRAGMA index_info('{idx[1]}')").fetchone()[2] == columna
+        for idx in conn.execute(f"PRAGMA index_list('{tabla}')").fetchall()
+    )
+
+
+def indices_master(conn):
+    """Índices compuestos para dbs, solicitudes_acceso e ingresos"""
+    if _existe_tabla(conn, "dbs"):
+        conn.execute("""CREATE INDEX IF NOT EXISTS idx_dbs_usuario_estatus
+                        ON dbs(usuario_windows, estatus, fecha_de_ultimo_acceso)""")
+        if not _columna_indexada(conn, "dbs", "direccion"):
+            # Masters creados antes de que direccion fuera UNIQUE
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dbs_direccion ON dbs(direccion)")
+
+    if _existe_tabla(conn, "solicitudes_acceso"):
+        conn.execute("""CREATE INDEX IF NOT EXISTS idx_solicitudes_db_usuario_estatus
+                        ON solicitudes_acceso(db_id, usuario_solicitante, estatus)""")
+    else:
+        print("MASTER.db no tiene solicitudes_acceso; se omite su índice")
+
+    # ingresos se crea al primer acceso; aquí se asegura para poder indexarla
+    conn.execute(TABLA_INGRESOS)
+    conn.execute("""CREATE INDEX IF NOT EXISTS idx_ingresos_administrador_fecha
+                    ON ingresos(administrador, fecha_de_ultimo_acceso)""")
+    conn.execute("""CREATE INDEX IF NOT EXISTS idx_ingresos_esclavo_fecha
+                    ON ingresos(esclavo, fecha_de_ultimo_acceso)""")
+    conn.execute("ANALYZE")
+
+
+def indice_solicitudes_usuario(conn):
+    """Índice para agregar de una vez las solicitudes de un usuario (catálogo Otros Host)"""
+    if _existe_tabla(conn, "solicitudes_acceso"):
+        conn.execute("""CREATE INDEX IF NOT EXISTS idx_solicitudes_usuario_db
+                        ON solicitudes_acceso(usuario_solicitante, db_id, estatus)""")
+
+
+# Último acceso de un usuario (como administrador o invitado) a una minuta.
+# Solo avanza: un ingreso con fecha anterior no reemplaza al registrado.
+ALTA_ULTIMO_INGRESO = """
+    INSERT INTO ultimo_ingreso (usuario, direccion, db_id, fecha)
+    VALUES ({usuario}, NEW.direccion, NEW.db_id, NEW.fecha_de_ultimo_acceso)
+    ON CONFLICT(usuario, direccion) DO UPDATE SET
+        db_id = excluded.db_id,
+        fecha = excluded.fecha
+    WHERE excluded.fecha > ultimo_ingreso.fecha"""
+
+
+def resumen_ingresos(conn):
+    """Tabla ultimo_ingreso mantenida por trigger e ingresos_diarios para la retención"""
+    conn.execute(TABLA_INGRESOS)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS ultimo_ingreso (
+            usuario TEXT NOT NULL,
+            direccion TEXT NOT NULL,
+            db_id INTEGER NOT NULL,
+            fecha TEXT NOT NULL,
+            PRIMARY KEY (usuario, direccion)
+        )""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_ultimo_ingreso_fecha ON ultimo_ingreso(usuario, fecha)")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_ingresos_ultimo AFTER INSERT ON ingresos
+        BEGIN
+            {ALTA_ULTIMO_INGRESO.format(usuario="NEW.administrador")};
+        END""")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_ingresos_ultimo_esclavo AFTER INSERT ON ingresos
+        WHEN NEW.esclavo IS NOT NULL
+        BEGIN
+            {ALTA_ULTIMO_INGRESO.format(usuario="NEW.esclavo")};
+        END""")
+
+    # Carga inicial desde el historial completo (MAX() elige la fila más reciente)
+    conn.execute("""
+        INSERT OR REPLACE INTO ultimo_ingreso (usuario, direccion, db_id, fecha)
+        SELECT usuario, direccion, db_id, MAX(fecha) FROM (
+            SELECT administrador AS usuario, direccion, db_id, fecha_de_ultimo_acceso AS fecha
+            FROM ingresos WHERE administrador IS NOT NULL
+            UNION ALL
+            SELECT esclavo, direccion, db_id, fecha_de_ultimo_acceso
+            FROM ingresos WHERE esclavo IS NOT NULL
+        )
+        GROUP BY usuario, direccion""")
+
+    # Ingresos anteriores al periodo de retención, resumidos por día
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS ingresos_diarios (
+            dia TEXT NOT NULL,
+            direccion TEXT NOT NULL,
+            administrador TEXT NOT NULL DEFAULT '',
+            esclavo TEXT NOT NULL DEFAULT '',
+            db_id INTEGER,
+            db_name TEXT,
+            tabla_origen TEXT,
+            ingresos INTEGER NOT NULL,
+            primer_acceso TEXT NOT NULL,
+            ultimo_acceso TEXT NOT NULL,
+            PRIMARY KEY (dia, direccion, administrador, esclavo)
+        )""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_ingresos_fecha ON ingresos(fecha_de_ultimo_acceso)")
+
+
+MIGRACIONES_MASTER = [
+    indices_master,             # 1
+    indice_solicitudes_usuario, # 2
+    resumen_ingresos,           # 3
+]
+
+
+def version_de(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrar(conn, migraciones=MIGRACIONES):
+    """Aplica las migraciones pendientes; devuelve cuántas se ejecutaron"""
+    version = version_de(conn)
+    if version >= len(migraciones):
+        return 0
+
+    aplicadas = 0
+    for numero, migracion in enumerate(migraciones, start=1):
+        if numero <= version:
+            continue
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Otro equipo pudo migrar el archivo mientras esperábamos el bloqueo
+            if version_de(conn) >= numero:
+                conn.rollback()
+                continue
+            migracion(conn)
+            conn.execute(f"PRAGMA user_version = {numero}")
+            conn.commit()
+            aplicadas += 1
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.rollback()
+            print(f"Error en la migración {numero} ({migracion.__name__}): {e}")
+            break
+
+    if aplicadas:
+        conn.execute("PRAGMA optimize")
+    return aplicadas
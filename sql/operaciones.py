@@ -0,0 +1,168 @@
+# sql/operaciones.py
+"""Capa única de escritura sobre las minutas.
+
+Cada operación recibe una conexión y parámetros serializables (JSON), de modo que
+la misma función sirve para escribir directo en la red o para repetirse desde la
+cola del modo sin conexión (sql/replica.py).
+"""
+import time
+
+from rutas import MODO_LOCAL
+from sql.carga import avanzar_corte
+from sql.conexion import conectar
+from sql.migraciones import cambios_entre
+
+# Columnas que se copian al historial antes de modificar cada campo
+COLUMNAS_HISTORIAL = "id_acuerdo, acuerdo, responsables, fecha_compromiso"
+CAMPOS_EDITABLES = ("acuerdo", "responsables", "fecha_compromiso", "comentarios")
+
+
+def ahora_utc():
+    """Fecha actual en UTC con el formato de datetime('now') de SQLite"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+
+
+def editar_acuerdo(conn, id_acuerdo, campo, valor, usuario, estatus="Editado", fecha=None):
+    """Respalda el acuerdo en el historial y actualiza uno de sus campos"""
+    if campo not in CAMPOS_EDITABLES:
+        raise ValueError(f"Campo no editable: {campo}")
+
+    # Lo que cambia (campo y estatus) se guarda en la misma fila del historial
+    mascara, delta = _cambios(conn, id_acuerdo, {campo: valor, "estatus": estatus})
+    columnas = COLUMNAS_HISTORIAL + (", comentarios" if campo == "comentarios" else "")
+    conn.execute(
+        f"""INSERT INTO historial_acuerdos
+        ({columnas}, fecha_modificacion, usuario_modifico, estatus, cambios, delta)
+        SELECT {columnas}, COALESCE(?, datetime('now')), ?, estatus, ?, ?
+        FROM acuerdos WHERE id_acuerdo = ?""",
+        (fecha, usuario, mascara, delta, id_acuerdo)
+    )
+    conn.execute(
+        f"""UPDATE acuerdos SET {campo} = ?, fecha_estatus = COALESCE(?, datetime('now')), estatus = ?
+        WHERE id_acuerdo = ?""",
+        (valor, fecha, estatus, id_acuerdo)
+    )
+
+
+def _cambios(conn, id_acuerdo, nuevos):
+    """(máscara, delta) de escribir nuevos {columna: valor} sobre el acuerdo vigente"""
+    columnas = list(nuevos)
+    fila = conn.execute(
+        f"SELECT {', '.join(columnas)} FROM acuerdos WHERE id_acuerdo = ?", (id_acuerdo,)
+    ).fetchone()
+    return cambios_entre(dict(zip(columnas, fila)) if fila else {}, nuevos)
+
+
+def registrar_acuerdo(conn, id_acuerdo, acuerdo, responsables, fecha_compromiso,
+                      fecha_registro, usuario, comentarios=None):
+    """Inserta un acuerdo nuevo con estatus Activo"""
+    conn.execute(
+        """INSERT INTO acuerdos
+        (id_acuerdo, acuerdo, responsables, fecha_compromiso,
+         fecha_registro, usuario_registra, estatus, fecha_estatus, comentarios)
+        VALUES (?, ?, ?, ?, ?, ?, 'Activo', ?, ?)""",
+        (id_acuerdo, acuerdo, responsables, fecha_compromiso,
+         fecha_registro, usuario, fecha_registro, comentarios)
+    )
+
+
+def cerrar_acuerdo(conn, id_acuerdo, fecha_cierre, usuario, comentarios, ruta_pdf):
+    """Registra el cierre en el historial y marca el acuerdo como Cerrado"""
+    mascara, delta = _cambios(conn, id_acuerdo, {"estatus": "Cerrado", "comentarios_cierre": comentarios})
+    conn.execute(
+        """INSERT INTO historial_acuerdos
+        (id_acuerdo, acuerdo, responsables, fecha_compromiso,
+         fecha_modificacion, usuario_modifico, estatus, comentarios_cierre, ruta_pdf, cambios, delta)
+        SELECT id_acuerdo, acuerdo, responsables, fecha_compromiso, ?, ?, 'Cerrado', ?, ?, ?, ?
+        FROM acuerdos WHERE id_acuerdo = ?""",
+        (fecha_cierre, usuario, comentarios, ruta_pdf, mascara, delta, id_acuerdo)
+    )
+    conn.execute(
+        """UPDATE acuerdos
+        SET estatus = 'Cerrado',
+            fecha_estatus = ?,
+            usuario_registra = ?,
+            comentarios_cierre = ?
+        WHERE id_acuerdo = ?""",
+        (fecha_cierre, usuario, comentarios, id_acuerdo)
+    )
+
+
+def registrar_usuarios(conn, nombres, usuario, fecha=None):
+    """Da de alta en usuarios los nombres que aún no existen (sin distinguir mayúsculas)"""
+    for nombre in nombres:
+        existe = conn.execute(
+            "SELECT 1 FROM usuarios WHERE LOWER(nombre) = LOWER(?) LIMIT 1", (nombre,)
+        ).fetchone()
+        if not existe:
+            conn.execute(
+                """INSERT INTO usuarios
+                (nombre, fecha_registro, usuario_registra, estatus)
+                VALUES (?, COALESCE(?, datetime('now')), ?, 'Activo')""",
+                (nombre, fecha, usuario)
+            )
+
+
+def renombrar_usuario(conn, nombre_actual, nuevo_nombre):
+    """Cambia el nombre de un usuario y lo propaga a la cadena de responsables de sus acuerdos"""
+    conn.execute("UPDATE usuarios SET nombre = ? WHERE nombre = ?", (nuevo_nombre, nombre_actual))
+    conn.execute(
+        """UPDATE acuerdos
+        SET responsables = (SELECT v.responsables FROM v_acuerdo_responsables v
+                            WHERE v.acuerdo_id = acuerdos.id)
+        WHERE id IN (SELECT ar.acuerdo_id FROM acuerdo_responsables ar
+                     JOIN usuarios u ON u.id = ar.usuario_id
+                     WHERE u.nombre = ?)""",
+        (nuevo_nombre,)
+    )
+
+
+def editar_responsables(conn, id_acuerdo, responsables, nuevos, usuario, estatus="Editado", fecha=None):
+    """Da de alta los responsables nuevos y cambia los del acuerdo en la misma transacción.
+
+    Los usuarios se registran antes que el acuerdo para que acuerdo_responsables
+    los ligue como 'Activo' y no como 'Legado'.
+    """
+    registrar_usuarios(conn, nuevos, usuario, fecha)
+    editar_acuerdo(conn, id_acuerdo, "responsables", responsables, usuario, estatus, fecha)
+
+
+def eliminar_usuario(conn, nombre):
+    """Marca un usuario como Eliminado sin borrarlo"""
+    conn.execute("UPDATE usuarios SET estatus = 'Eliminado' WHERE nombre = ?", (nombre,))
+
+
+OPERACIONES = {
+    "editar_acuerdo": editar_acuerdo,
+    "registrar_acuerdo": registrar_acuerdo,
+    "cerrar_acuerdo": cerrar_acuerdo,
+    "registrar_usuarios": registrar_usuarios,
+    "editar_responsables": editar_responsables,
+    "renombrar_usuario": renombrar_usuario,
+    "eliminar_usuario": eliminar_usuario,
+}
+
+
+def aplicar(conn, operacion, parametros):
+    """Ejecuta una operación registrada sobre la conexión (sin confirmar la transacción)"""
+    avanzar_corte(conn)  # La primera escritura del día actualiza los atrasados por responsable
+    OPERACIONES[operacion](conn, **parametros)
+
+
+def ejecutar(db_path, operacion, **parametros):
+    """Aplica una escritura en la minuta, o la encola si está activo el modo sin conexión"""
+    if operacion in ("editar_acuerdo", "editar_responsables"):
+        # La fecha se fija al momento de la edición para que la cola la repita igual
+        parametros.setdefault("fecha", ahora_utc())
+
+    if MODO_LOCAL:
+        from sql.replica import replica_de
+        replica_de(db_path).encolar(operacion, parametros)
+        return
+
+    conn = conectar(db_path)
+    try:
+        with conn:
+            aplicar(conn, operacion, parametros)
+    finally:
+        conn.close()
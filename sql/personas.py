@@ -0,0 +1,72 @@
+# sql/personas.py
+"""Índice en memoria de las personas de una minuta para los selectores de responsables.
+
+Los buscadores de responsables consultaban la base en cada tecla. El índice se
+lee una vez por minuta (AcuerdosRepository.indice_personas, en caché hasta la
+siguiente escritura) y las búsquedas se resuelven aquí: sin acentos ni
+mayúsculas, primero las coincidencias al inicio de una palabra y después las
+que contienen el texto, y dentro de cada grupo las personas con más acuerdos
+asignados primero.
+"""
+import unicodedata
+from typing import NamedTuple
+
+try:
+    from unidecode import unidecode
+except ImportError:  # Sin unidecode basta con quitar los acentos
+    def unidecode(texto):
+        return "".join(c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c))
+
+
+def normalizar(texto):
+    """Texto sin acentos, en minúsculas y con espacios simples (para comparar nombres)"""
+    return " ".join(unidecode(texto or "").casefold().split())
+
+
+class Persona(NamedTuple):
+    nombre: str
+    asignaciones: int      # Acuerdos en los que aparece como responsable
+    prioridad: bool        # Activa, o no eliminada/legada y con acuerdos (alta de acuerdos)
+    vigente: bool          # No eliminada (edición de responsables)
+    palabras: str          # ' ' + nombre normalizado: ' ' + texto encuentra inicios de palabra
+
+
+class IndicePersonas:
+    """Personas de una minuta ordenadas por asignaciones, con búsqueda sin acentos"""
+
+    def __init__(self, filas):
+        """filas: (nombre, asignaciones, prioridad, vigente); los nombres repetidos se juntan"""
+        por_nombre = {}
+        for nombre, asignaciones, prioridad, vigente in filas:
+            nombre = (nombre or "").strip()
+            if not nombre:
+                continue
+            anterior = por_nombre.get(nombre.casefold())
+            if anterior is None:
+                por_nombre[nombre.casefold()] = Persona(nombre, asignaciones, bool(prioridad), bool(vigente),
+                                                        " " + normalizar(nombre))
+            else:
+                por_nombre[nombre.casefold()] = anterior._replace(
+                    asignaciones=anterior.asignaciones + asignaciones,
+                    prioridad=anterior.prioridad or bool(prioridad),
+                    vigente=anterior.vigente or bool(vigente))
+        self.personas = sorted(por_nombre.values(), key=lambda p: (-p.asignaciones, p.nombre.casefold()))
+
+    def __len__(self):
+        return len(self.personas)
+
+    def buscar(self, texto="", excluir=(), solo_prioridad=False):
+        """Nombres que coinciden con texto, sin los de excluir, del más al menos asignado"""
+        buscado = normalizar(texto)
+        excluidos = {nombre.casefold() for nombre in excluir}
+        al_inicio, dentro = [], []
+        for persona in self.personas:
+            if not (persona.prioridad if solo_prioridad else persona.vigente):
+                continue
+            if persona.nombre.casefold() in excluidos:
+                continue
+            if " " + buscado in persona.palabras:
+                al_inicio.append(persona.nombre)
+            elif buscado in persona.palabras:
+                dentro.append(persona.nombre)
+        return al_inicio + dentro
@@ -73,53 +73,24 @@ usuarios = '''
 )
 '''
 
-usuarios_prioridad_sin_eliminados = """ WITH RECURSIVE split_responsables AS (
-    SELECT 
-        substr(responsables || ',', 0, instr(responsables || ',', ',')) AS nombre,
-        substr(responsables, instr(responsables || ',', ',') + 1) AS remaining
-    FROM acuerdos
-    WHERE responsables != '' AND responsables IS NOT NULL
-
-    UNION ALL
-
-    SELECT
-        substr(remaining, 0, instr(remaining || ',', ',')),
-        substr(remaining, instr(remaining || ',', ',') + 1)
-    FROM split_responsables
-    WHERE remaining != ''
-)
-SELECT DISTINCT trim(nombre) AS nombre
-FROM split_responsables
-WHERE nombre != ''
-AND nombre IN (
-    SELECT nombre 
-    FROM usuarios
-    WHERE estatus != 'Eliminado'
-)
-UNION
-SELECT DISTINCT nombre 
-FROM usuarios
-WHERE estatus = 'Activo'
-ORDER BY nombre COLLATE NOCASE ASC;
+# Personas de la minuta con sus acuerdos asignados (índice de los selectores de responsables)
+personas_con_asignaciones = """
+SELECT u.nombre,
+       COALESCE(c.abiertos + c.cerrados, 0) AS asignaciones,
+       u.estatus = 'Activo'
+           OR (u.estatus NOT IN ('Eliminado', 'Legado') AND c.usuario_id IS NOT NULL) AS prioridad,
+       COALESCE(u.estatus != 'Eliminado', 0) AS vigente
+FROM usuarios u
+LEFT JOIN carga_responsables c ON c.usuario_id = u.id
+WHERE u.nombre != ''
 """
 
-usuarios_frecuentes_card = """WITH RECURSIVE split_responsables AS (
-    SELECT 
-        substr(responsables || ', ', 0, instr(responsables || ', ', ', ')) AS nombre,
-        substr(responsables, instr(responsables || ', ', ', ') + 2) AS remaining
-    FROM acuerdos
-    WHERE estatus != 'Cerrado' AND LENGTH(responsables) > 3
-
-    UNION ALL
-
-    SELECT
-        substr(remaining, 0, instr(remaining || ', ', ', ')),
-        substr(remaining, instr(remaining || ', ', ', ') + 2)
-    FROM split_responsables
-    WHERE remaining != ''
-)
-SELECT trim(nombre) AS nombre
-FROM split_responsables
-WHERE nombre != ''
-ORDER BY nombre COLLATE NOCASE ASC
-"""
\ No newline at end of file
+# Nombres completos de los responsables de un acuerdo, en su orden original
+responsables_de_acuerdo = """
+SELECT u.nombre
+FROM acuerdos a
+JOIN acuerdo_responsables ar ON ar.acuerdo_id = a.id
+JOIN usuarios u ON u.id = ar.usuario_id
+WHERE a.id_acuerdo = ?
+ORDER BY ar.posicion
+"""
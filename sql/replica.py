@@ -0,0 +1,269 @@
+# sql/replica.py
+"""Réplica local de la minuta activa para el modo sin conexión (MINUTAS_OFFLINE=1).
+
+Las pantallas leen de una copia local de la minuta y las escrituras se guardan en
+una cola durable (cola.db) que un hilo de la réplica repite en orden contra el
+archivo compartido, así que guardar no espera a la red.
+Antes de aplicar cada operación se compara el número de registros del acuerdo en
+historial_acuerdos con el que había al editar: si otro usuario lo modificó mientras
+tanto, la operación se aparta como conflicto en lugar de sobrescribir su cambio.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from rutas import RUTA_REPLICAS
+from sql.conexion import conectar, es_error_de_red, BUSY_TIMEOUT_MS
+from sql.operaciones import aplicar
+
+INTERVALO_REFRESCO = 60  # Segundos entre copias/reintentos contra la red
+
+# Operaciones cuyo conflicto se detecta por el historial del acuerdo
+OPERACIONES_CON_HISTORIAL = ("editar_acuerdo", "editar_responsables", "cerrar_acuerdo")
+
+_replicas = {}
+_candado = threading.Lock()
+
+
+def replica_de(db_path):
+    """Obtiene (o crea) la réplica local de la minuta indicada"""
+    with _candado:
+        replica = _replicas.get(db_path)
+        if replica is None:
+            replica = _replicas[db_path] = ReplicaMinuta(db_path)
+        return replica
+
+
+class ReplicaMinuta:
+    """Copia local de una minuta con su cola de escrituras pendientes"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        os.makedirs(RUTA_REPLICAS, exist_ok=True)
+
+        nombre = os.path.splitext(os.path.basename(db_path))[0]
+        clave = hashlib.sha1(db_path.encode("utf-8")).hexdigest()[:12]
+        self.ruta = os.path.join(RUTA_REPLICAS, f"{nombre}_{clave}.db")
+        self.ruta_cola = os.path.join(RUTA_REPLICAS, "cola.db")
+        self.ultimo_intento = 0.0
+        # Una sola sincronización a la vez (hilo de la réplica o una llamada directa)
+        self._sincronizando = threading.Lock()
+        # Escrituras en el archivo de la réplica: las locales y el reemplazo por la copia de la red
+        self._escribiendo = threading.Lock()
+        self._aviso = threading.Event()
+        self._refresco_pedido = False
+
+        self.crear_cola()
+        if not os.path.exists(self.ruta) or not self.pendientes():
+            self.refrescar()
+        threading.Thread(target=self._trabajar, name=f"replica-{nombre}", daemon=True).start()
+
+    def crear_cola(self):
+        """Crea las tablas de la cola y de conflictos si no existen"""
+        conn = conectar(self.ruta_cola)
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pendientes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    db_path TEXT NOT NULL,
+                    operacion TEXT NOT NULL,
+                    parametros TEXT NOT NULL,
+                    base INTEGER,
+                    creado TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pendientes_db ON pendientes(db_path, id)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS conflictos (
+                    id INTEGER PRIMARY KEY,
+                    db_path TEXT NOT NULL,
+                    operacion TEXT NOT NULL,
+                    parametros TEXT NOT NULL,
+                    base INTEGER,
+                    creado TEXT NOT NULL,
+                    detectado TEXT NOT NULL,
+                    motivo TEXT,
+                    avisado INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            columnas = {c[1] for c in conn.execute("PRAGMA table_info(conflictos)")}
+            if "avisado" not in columnas:  # Colas creadas antes del aviso al usuario
+                conn.execute("ALTER TABLE conflictos ADD COLUMN avisado INTEGER NOT NULL DEFAULT 0")
+
+    def pendientes(self):
+        """Número de escrituras de esta minuta que aún no llegan a la red"""
+        conn = conectar(self.ruta_cola)
+        return conn.execute(
+            "SELECT COUNT(*) FROM pendientes WHERE db_path = ?", (self.db_path,)
+        ).fetchone()[0]
+
+    def conflictos_sin_avisar(self):
+        """Operaciones descartadas por conflicto que el usuario aún no ha visto; quedan como avisadas"""
+        conn = conectar(self.ruta_cola)
+        with conn:
+            filas = conn.execute(
+                """SELECT id, operacion, parametros, detectado, motivo FROM conflictos
+                   WHERE db_path = ? AND avisado = 0 ORDER BY id""",
+                (self.db_path,)
+            ).fetchall()
+            conn.executemany("UPDATE conflictos SET avisado = 1 WHERE id = ?", [(fila[0],) for fila in filas])
+        return [fila[1:] for fila in filas]
+
+    def refrescar(self):
+        """Copia el archivo compartido sobre la réplica (solo si la cola está vacía)"""
+        self.ultimo_intento = time.monotonic()
+        if not os.path.exists(self.db_path):
+            return False
+        # La red se lee a un archivo aparte; la réplica solo se bloquea para la copia local
+        temporal = self.ruta + ".nueva"
+        try:
+            origen = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000)
+            try:
+                copia = sqlite3.connect(temporal)
+                try:
+                    origen.backup(copia)
+                finally:
+                    copia.close()
+            finally:
+                origen.close()
+
+            with self._escribiendo:
+                if os.path.exists(self.ruta) and self.pendientes():  # Cambios locales sin subir: después
+                    return False
+                destino = conectar(self.ruta)
+                destino.close()  # Descarta transacciones abiertas antes de copiar
+                copia = sqlite3.connect(temporal)
+                try:
+                    copia.backup(destino.conexion)
+                finally:
+                    copia.close()
+            return True
+        except sqlite3.Error as e:
+            print(f"No se pudo refrescar la réplica de {self.db_path}: {e}")
+            return False
+        finally:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+
+    def ruta_lectura(self):
+        """Ruta de la réplica; si ya pasó el intervalo pide al hilo sincronizar y refrescar"""
+        if time.monotonic() - self.ultimo_intento >= INTERVALO_REFRESCO:
+            self.ultimo_intento = time.monotonic()
+            self._refresco_pedido = True
+            self._aviso.set()
+        return self.ruta
+
+    def _trabajar(self):
+        """Hilo de la réplica: sincroniza cuando hay escrituras nuevas o vence el intervalo"""
+        while True:
+            self._aviso.wait()
+            self._aviso.clear()
+            refrescar, self._refresco_pedido = self._refresco_pedido, False
+            try:
+                self.sincronizar()
+                # Las escrituras propias ya están en la réplica: solo se copia la red por intervalo
+                if refrescar and not self.pendientes():
+                    with self._sincronizando:
+                        self.refrescar()
+            except Exception as e:
+                print(f"Error al sincronizar {self.db_path}: {e}")
+
+    def base_de(self, conn, operacion, parametros):
+        """Registros de historial del acuerdo al momento de editar (referencia de conflicto)"""
+        if operacion not in OPERACIONES_CON_HISTORIAL:
+            return None
+        return conn.execute(
+            "SELECT COUNT(*) FROM historial_acuerdos WHERE id_acuerdo = ?",
+            (parametros["id_acuerdo"],)
+        ).fetchone()[0]
+
+    def encolar(self, operacion, parametros):
+        """Guarda la operación en la cola y la aplica a la réplica; la red la recibe desde el hilo"""
+        with self._escribiendo:
+            local = conectar(self.ruta)
+            base = self.base_de(local, operacion, parametros)
+
+            cola = conectar(self.ruta_cola)
+            with cola:
+                cola.execute(
+                    """INSERT INTO pendientes (db_path, operacion, parametros, base, creado)
+                       VALUES (?, ?, ?, ?, datetime('now'))""",
+                    (self.db_path, operacion, json.dumps(parametros, ensure_ascii=False), base)
+                )
+
+            with local:
+                aplicar(local, operacion, parametros)
+
+        self._aviso.set()
+
+    def conflicto(self, conn, operacion, parametros, base):
+        """Devuelve el motivo de conflicto con el archivo compartido, o None"""
+        if operacion == "registrar_acuerdo":
+            existe = conn.execute(
+                "SELECT 1 FROM acuerdos WHERE id_acuerdo = ? LIMIT 1", (parametros["id_acuerdo"],)
+            ).fetchone()
+            return "El ID de acuerdo ya existe en la minuta compartida" if existe else None
+        if base is not None:
+            actual = self.base_de(conn, operacion, parametros)
+            if actual != base:
+                return f"El acuerdo fue modificado por otro usuario (historial {base} -> {actual})"
+        return None
+
+    def apartar(self, cola, fila, motivo):
+        """Mueve una operación de la cola a la tabla de conflictos"""
+        id_pendiente, operacion, parametros, base, creado = fila
+        print(f"Conflicto al sincronizar {operacion} en {self.db_path}: {motivo}")
+        cola.execute(
+            """INSERT INTO conflictos (db_path, operacion, parametros, base, creado, detectado, motivo)
+               VALUES (?, ?, ?, ?, ?, datetime('now'), ?)""",
+            (self.db_path, operacion, parametros, base, creado, motivo)
+        )
+        cola.execute("DELETE FROM pendientes WHERE id = ?", (id_pendiente,))
+
+    def sincronizar(self):
+        """Repite en orden las operaciones pendientes contra el archivo compartido"""
+        # La cola se lee, se aplica y se vacía dentro del candado: dos hilos no repiten la misma fila
+        with self._sincronizando:
+            return self._sincronizar()
+
+    def _sincronizar(self):
+        self.ultimo_intento = time.monotonic()
+        if not os.path.exists(self.db_path):
+            return 0
+
+        cola = conectar(self.ruta_cola)
+        filas = cola.execute(
+            """SELECT id, operacion, parametros, base, creado FROM pendientes
+               WHERE db_path = ? ORDER BY id""",
+            (self.db_path,)
+        ).fetchall()
+
+        aplicadas = 0
+        for fila in filas:
+            id_pendiente, operacion, parametros, base, _ = fila
+            compartida = conectar(self.db_path)
+            try:
+                compartida.execute("BEGIN IMMEDIATE")
+                motivo = self.conflicto(compartida, operacion, json.loads(parametros), base)
+                if motivo is None:
+                    aplicar(compartida, operacion, json.loads(parametros))
+                compartida.commit()
+            except sqlite3.Error as e:
+                compartida.close()
+                if es_error_de_red(e) or "locked" in str(e).lower():
+                    print(f"Sincronización pospuesta para {self.db_path}: {e}")
+                    break
+                motivo = str(e)
+
+            # Si se cae el proceso entre el commit y este DELETE, el reintento se
+            # detecta como conflicto (el historial ya cambió) y no se duplica
+            with cola:
+                if motivo is None:
+                    cola.execute("DELETE FROM pendientes WHERE id = ?", (id_pendiente,))
+                    aplicadas += 1
+                else:
+                    self.apartar(cola, fila, motivo)
+        return aplicadas
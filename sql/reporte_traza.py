@@ -0,0 +1,140 @@
+# sql/reporte_traza.py
+"""Reporte de la traza SQL: sentencias más lentas y más frecuentes con su plan.
+
+Uso:  python -m sql.reporte_traza [archivo.jsonl] [--top N]
+
+Agrupa los registros de sql/traza.py por texto de sentencia, ordena por tiempo
+total y por número de ejecuciones y muestra el EXPLAIN QUERY PLAN de cada una
+contra la base registrada (abierta en solo lectura).
+"""
+import json
+import os
+import re
+import sqlite3
+import sys
+from collections import Counter, defaultdict
+
+from rutas import RUTA_TRAZA
+
+TOP_POR_DEFECTO = 15
+RUTA_POR_DEFECTO = os.path.join(os.path.expanduser("~"), ".minutas", "traza.jsonl")
+
+
+def leer_registros(ruta):
+    """Registros válidos del archivo de traza (las líneas dañadas se omiten)"""
+    registros = []
+    with open(ruta, encoding="utf-8") as f:
+        for linea in f:
+            try:
+                registros.append(json.loads(linea))
+            except ValueError:
+                continue
+    return registros
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+def agrupar(registros):
+    """Estadísticas por sentencia: ejecuciones, tiempos, filas, páginas y llamadores"""
+    grupos = defaultdict(list)
+    for registro in registros:
+        grupos[registro["sql"]].append(registro)
+
+    resumen = []
+    for sql, lista in grupos.items():
+        tiempos = [r.get("ms", 0) for r in lista]
+        paginas = [r["paginas"] for r in lista if "paginas" in r]
+        resumen.append({
+            "sql": sql,
+            "veces": len(lista),
+            "total_ms": sum(tiempos),
+            "prom_ms": sum(tiempos) / len(lista),
+            "p95_ms": _percentil(tiempos, 0.95),
+            "max_ms": max(tiempos),
+            "prom_filas": sum(r.get("filas", 0) for r in lista) / len(lista),
+            "prom_paginas": sum(paginas) / len(paginas) if paginas else None,
+            "errores": sum(1 for r in lista if "error" in r),
+            "llamadores": Counter(r.get("pantalla") or r.get("llamador") for r in lista).most_common(3),
+            "muestra": lista[-1],
+        })
+    return resumen
+
+
+def _parametros_vacios(forma):
+    """Parámetros None con la misma forma que los registrados (para EXPLAIN)"""
+    if isinstance(forma, dict):
+        return {clave: None for clave in forma}
+    return [None] * len(forma or ())
+
+
+def plan_de_consulta(muestra):
+    """Líneas del EXPLAIN QUERY PLAN de la sentencia contra su base de datos"""
+    sql = muestra["sql"]
+    if sql == "COMMIT" or not re.match(r"(?is)\s*(select|with|insert|update|delete|replace)\b", sql):
+        return []
+    try:
+        uri = "file:" + muestra["db"].replace("\\", "/") + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+    except sqlite3.Error as e:
+        return [f"(no se pudo abrir {muestra['db']}: {e})"]
+    try:
+        filas = conn.execute("EXPLAIN QUERY PLAN " + sql, _parametros_vacios(muestra.get("forma"))).fetchall()
+    except sqlite3.Error as e:
+        return [f"(sin plan: {e})"]
+    finally:
+        conn.close()
+
+    # Árbol por id/padre como lo imprime el shell de sqlite3
+    niveles = {0: -1}
+    lineas = []
+    for id_nodo, padre, _, detalle in filas:
+        niveles[id_nodo] = niveles.get(padre, -1) + 1
+        lineas.append("  " * niveles[id_nodo] + detalle)
+    return lineas
+
+
+def _imprimir(titulo, grupos, con_plan, planes):
+    print(f"\n=== {titulo} ===")
+    for posicion, g in enumerate(grupos, 1):
+        paginas = f"{g['prom_paginas']:.1f}" if g["prom_paginas"] is not None else "-"
+        print(f"\n{posicion}. {g['veces']}x  total {g['total_ms']:.1f} ms  prom {g['prom_ms']:.2f}  "
+              f"p95 {g['p95_ms']:.2f}  máx {g['max_ms']:.2f}  filas {g['prom_filas']:.1f}  "
+              f"páginas {paginas}" + (f"  errores {g['errores']}" if g["errores"] else ""))
+        print(f"   {g['sql'][:300]}")
+        for llamador, veces in g["llamadores"]:
+            print(f"   <- {llamador} ({veces})")
+        if con_plan:
+            if g["sql"] not in planes:
+                planes[g["sql"]] = plan_de_consulta(g["muestra"])
+            for linea in planes[g["sql"]]:
+                print(f"   | {linea}")
+
+
+def reporte(ruta, top=TOP_POR_DEFECTO):
+    """Imprime las sentencias más lentas (tiempo total) y las más frecuentes"""
+    registros = leer_registros(ruta)
+    if not registros:
+        print(f"Sin registros en {ruta}")
+        return
+    grupos = agrupar(registros)
+    total = sum(g["total_ms"] for g in grupos)
+    print(f"{len(registros)} ejecuciones, {len(grupos)} sentencias distintas, {total:.1f} ms en total")
+
+    planes = {}
+    _imprimir("Más lentas (tiempo total)",
+              sorted(grupos, key=lambda g: g["total_ms"], reverse=True)[:top], True, planes)
+    _imprimir("Más frecuentes",
+              sorted(grupos, key=lambda g: g["veces"], reverse=True)[:top], True, planes)
+
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    top = TOP_POR_DEFECTO
+    if "--top" in argumentos:
+        i = argumentos.index("--top")
+        top = int(argumentos[i + 1])
+        del argumentos[i:i + 2]
+    reporte(argumentos[0] if argumentos else (RUTA_TRAZA or RUTA_POR_DEFECTO), top)
@@ -0,0 +1,1189 @@
+# sql/repositorio.py
+"""Acceso a datos de las pantallas: una llamada por pantalla con filas tipadas.
+
+AcuerdosRepository concentra las lecturas de una minuta y delega las escrituras en
+sql/operaciones.py; MasterRepository hace lo mismo con MASTER.db (dbs, solicitudes
+de acceso e ingresos). Los módulos de Tk no ejecutan SQL: piden aquí lo que
+necesitan, de modo que optimizar, cachear o medir el acceso se hace en un solo lugar.
+"""
+import functools
+import sqlite3
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+
+from rutas import MASTER, RETENCION_INGRESOS_DIAS
+from sql.busqueda import filtro_texto
+from sql.cache import CacheTTL
+from sql.carga import atrasados_al_dia
+from sql.conexion import conectar
+from sql.fechas import filtro_rango_estatus, hoy_dia
+from sql.migraciones import CAMBIOS_HISTORIAL, ORDEN_ESTATUS, TABLA_INGRESOS
+from sql.operaciones import ejecutar
+from sql.personas import IndicePersonas
+
+RELEVANCIA = None          # Lugar de la relevancia de la búsqueda dentro de un orden
+PAGINA_ACUERDOS = 100      # Filas por página de las listas de acuerdos
+MAX_CAMBIOS = 500          # Con más filas modificadas conviene recargar la lista completa
+LOTE_HISTORIAL = 500       # Acuerdos por consulta al precargar historiales (límite de parámetros)
+TTL_HISTORIAL = 300        # Vigencia del historial precargado si nadie avisa de un cambio
+TTL_PERSONAS = 600         # Vigencia del índice de personas si nadie avisa de un cambio
+
+# Historial por (minuta, id_acuerdo); cada escritura del proceso invalida la minuta completa
+_cache_historial = CacheTTL()
+
+# IndicePersonas por minuta; lo invalidan las escrituras de usuarios y responsables
+_cache_personas = CacheTTL()
+ESCRITURAS_PERSONAS = {"registrar_usuarios", "renombrar_usuario", "eliminar_usuario", "registrar_acuerdo",
+                       "editar_responsables"}
+
+# ' (acuerdo, estatus)' con las columnas marcadas en historial_acuerdos.cambios, sin comparar versiones
+CAMPOS_CAMBIADOS = "COALESCE(' (' || NULLIF(SUBSTR({}, 3), '') || ')', '')".format(
+    " || ".join(f"(CASE WHEN h.cambios & {bit} THEN ', {columna}' ELSE '' END)"
+                for columna, bit in CAMBIOS_HISTORIAL.items()))
+
+# Órdenes de la lista de acuerdos: (expresión, dirección); acuerdos.id desempata.
+# Ninguna expresión es NULL (columnas NOT NULL), requisito de la paginación keyset.
+ORDENES_ACUERDOS = {
+    "prioridad": ((ORDEN_ESTATUS, "ASC"), RELEVANCIA, ("acuerdos.fecha_compromiso", "ASC")),
+    "recientes": (RELEVANCIA, ("acuerdos.fecha_estatus", "DESC")),
+    # Encabezados de la ventana de Historial
+    "id": (("acuerdos.id", "ASC"),),
+    "acuerdo": (("acuerdos.acuerdo", "ASC"),),
+    "responsables": (("acuerdos.responsables", "ASC"),),
+    "fecha": (("acuerdos.fecha_estatus", "DESC"),),
+    "estatus": (("acuerdos.estatus", "ASC"),),
+    "fecha_compromiso": (("acuerdos.fecha_compromiso", "DESC"),),
+}
+
+
+def invalidar_cache_historial(db_path=None):
+    """Descarta el historial precargado de la minuta (p. ej. tras un cambio de otro usuario)"""
+    _cache_historial.invalidar(db_path)
+
+
+def invalidar_indice_personas(db_path=None):
+    """Descarta el índice de personas de la minuta (p. ej. tras un cambio de otro usuario)"""
+    _cache_personas.invalidar(db_path)
+
+
+def condicion_keyset(terminos, valores):
+    """Condición "después de valores" para el orden dado por terminos [(expresión, dirección)].
+
+    La primera expresión se acota también por separado para que SQLite pueda
+    buscar en el índice en lugar de recorrerlo desde el principio.
+    """
+    mayor = lambda direccion: ">" if direccion == "ASC" else "<"
+    primera, direccion = terminos[0]
+    condicion = f"{primera} {mayor(direccion)}= ?"
+    params = [valores[0]]
+
+    if len({d for _, d in terminos}) == 1:
+        expresiones = ", ".join(e for e, _ in terminos)
+        marcas = ", ".join("?" * len(terminos))
+        return f"{condicion} AND ({expresiones}) {mayor(direccion)} ({marcas})", params + list(valores)
+
+    # Direcciones mezcladas: (a > x) OR (a = x AND b < y) OR ...
+    alternativas = []
+    for i, (expresion, direccion) in enumerate(terminos):
+        iguales = [f"{e} = ?" for e, _ in terminos[:i]]
+        alternativas.append("(" + " AND ".join(iguales + [f"{expresion} {mayor(direccion)} ?"]) + ")")
+        params.extend(valores[:i + 1])
+    return f"{condicion} AND ({' OR '.join(alternativas)})", params
+
+
+# ---------------------------------------------------------------- filas de minuta
+
+class FiltrosAcuerdos(NamedTuple):
+    """Filtros de la pantalla de acuerdos (cadenas vacías = sin filtro)"""
+    id_acuerdo: str = ""
+    texto: str = ""
+    responsable: str = ""
+    desde: str = ""
+    hasta: str = ""
+    estatus: str = "Todos"
+
+
+class Acuerdo(NamedTuple):
+    id_acuerdo: str
+    acuerdo: str
+    responsables: str
+    fecha_estatus: str
+    estatus: str
+    fecha_compromiso: str
+    comentarios: Optional[str]
+    accion: Optional[str]
+    version: Optional[int] = None
+
+
+class VersionAcuerdo(NamedTuple):
+    """Una fila del historial (o la versión vigente del acuerdo)"""
+    fecha: str
+    usuario: str
+    estatus: str
+    acuerdo: str
+    responsables: str
+    fecha_compromiso: str
+    comentarios: Optional[str]
+    cambios: Optional[int] = None   # Máscara CAMBIOS_HISTORIAL de la escritura (None en la versión vigente)
+    delta: Optional[str] = None     # JSON {columna: [antes, después]}
+
+
+class HistorialAcuerdo(NamedTuple):
+    usuario_registra: Optional[str]
+    actual: Optional[VersionAcuerdo]
+    versiones: list  # VersionAcuerdo, de la más reciente a la más antigua
+
+
+class Pagina(NamedTuple):
+    """Página de una lista paginada por keyset"""
+    filas: list
+    siguiente: Optional[tuple]  # Clave de la última fila; None si no hay más
+    total: Optional[int] = None  # Filas que cumplen los filtros (solo en la primera página)
+    claves: Optional[list] = None  # Clave de orden de cada fila; su último valor es el id
+    marca: Optional[int] = None  # Versión de la tabla al leer la primera página
+
+
+class Cambios(NamedTuple):
+    """Filas modificadas después de una marca, para parchar una lista ya mostrada"""
+    marca: int
+    filas: list           # Modificadas que cumplen los filtros
+    claves: list          # Su clave de orden (como en Pagina)
+    quitar: list          # ids de modificadas que ya no cumplen los filtros
+    direcciones: tuple    # ASC/DESC de cada término de la clave
+
+
+class AcuerdoPendiente(NamedTuple):
+    acuerdo: str
+    responsables: str
+    comentarios: Optional[str]
+    dias_restantes: int
+    id: Optional[int] = None
+    version: Optional[int] = None
+
+
+class AcuerdoAtrasado(NamedTuple):
+    acuerdo: str
+    responsables: str
+    dias_atraso: int
+
+
+class MetricasMenu(NamedTuple):
+    activos: int
+    editados: int
+    cerrados: int
+    promedio_dias: Optional[float]
+    frecuentes: list  # CargaResponsable de quienes tienen acuerdos abiertos
+    mas_atrasado: Optional[AcuerdoAtrasado]
+
+
+class DatosMenu(NamedTuple):
+    metricas: MetricasMenu
+    pendientes: Pagina  # Primera página de AcuerdoPendiente
+    usuarios_cargados: bool
+
+
+class DatosResponsables(NamedTuple):
+    personas: IndicePersonas  # índice de la minuta (búsqueda sin eliminados)
+    actuales: list  # responsables del acuerdo, en su orden
+
+
+class CargaResponsable(NamedTuple):
+    nombre: str
+    abiertos: int
+    atrasados: int
+    cerrados: int
+
+
+class FilasTablero(NamedTuple):
+    acuerdos: list      # (id, id_acuerdo, acuerdo, estatus, responsables, compromiso_dia, registro_epoch)
+    responsables: list  # (acuerdo_id, nombre) de cada responsable, en su orden
+
+
+class DatosCierre(NamedTuple):
+    acuerdo: str
+    responsables: str
+    fecha_compromiso: str
+    fecha_registro: str
+
+
+class AcuerdosRepository:
+    """Lecturas y escrituras de una minuta"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+
+    def _lectura(self):
+        return conectar(self.db_path, lectura=True)
+
+    # ------------------------------------------------------------ lecturas
+
+    def _consulta_acuerdos(self, conn, filtros, orden):
+        """(from, condiciones, params, términos de orden) de la lista de acuerdos"""
+        join_texto, orden_texto = "", None
+        condiciones, params = [], []
+
+        if filtros.id_acuerdo:
+            condiciones.append("acuerdos.id_acuerdo LIKE ?")
+            params.append(f"%{filtros.id_acuerdo}%")
+
+        if filtros.texto:
+            join_texto, condicion_texto, orden_texto, params_texto = filtro_texto(conn, filtros.texto)
+            condiciones.append(condicion_texto)
+            params.extend(params_texto)
+
+        if filtros.responsable:
+            condiciones.append("""acuerdos.id IN (SELECT ar.acuerdo_id FROM acuerdo_responsables ar
+                                                 JOIN usuarios u ON u.id = ar.usuario_id
+                                                 WHERE u.nombre LIKE ?)""")
+            params.append(f"%{filtros.responsable}%")
+
+        # Rango de fechas sobre estatus_epoch (incluye el día final completo)
+        condiciones_fecha, params_fecha = filtro_rango_estatus(filtros.desde, filtros.hasta)
+        condiciones.extend(condiciones_fecha)
+        params.extend(params_fecha)
+
+        if filtros.estatus and filtros.estatus != "Todos":
+            condiciones.append("acuerdos.estatus = ?")
+            params.append(filtros.estatus)
+
+        # La relevancia (bm25) entra en su lugar del orden solo si hay búsqueda FTS
+        terminos = [t if t is not RELEVANCIA else (orden_texto, "ASC")
+                    for t in ORDENES_ACUERDOS[orden] if t is not RELEVANCIA or orden_texto]
+        terminos.append(("acuerdos.id", terminos[-1][1]))
+        return f"acuerdos {join_texto}", condiciones, params, terminos
+
+    def _marca(self, conn):
+        """Versión más alta de acuerdos (None si la minuta aún no tiene la columna)"""
+        try:
+            return conn.execute("SELECT COALESCE(MAX(version), 0) FROM acuerdos").fetchone()[0]
+        except sqlite3.OperationalError:
+            return None
+
+    def _filas_acuerdos(self, conn, origen, condiciones, params, terminos, limite=-1):
+        """(acuerdos, claves) que cumplen las condiciones, en el orden de terminos"""
+        claves = ", ".join(expresion for expresion, _ in terminos)
+        query = f"""
+            SELECT
+                acuerdos.id_acuerdo,
+                acuerdos.acuerdo,
+                acuerdos.responsables,
+                acuerdos.fecha_estatus,
+                acuerdos.estatus,
+                acuerdos.fecha_compromiso,
+                acuerdos.comentarios,
+                acuerdos.accion,
+                acuerdos.version,
+                {claves}
+            FROM {origen}
+            WHERE {' AND '.join(condiciones) or '1=1'}
+            ORDER BY {', '.join(f'{e} {d}' for e, d in terminos)}
+            LIMIT ?
+        """
+        filas = conn.execute(query, params + [limite]).fetchall()
+        return [Acuerdo(*fila[:9]) for fila in filas], [tuple(fila[9:]) for fila in filas]
+
+    def pagina_acuerdos(self, filtros=FiltrosAcuerdos(), despues=None, limite=PAGINA_ACUERDOS,
+                        orden="prioridad"):
+        """Página de acuerdos que siguen a la clave despues (None = desde el inicio).
+
+        La clave es la que devuelve la página anterior en siguiente; la primera
+        página incluye además el total de acuerdos que cumplen los filtros y la
+        marca para pedir después solo lo modificado (cambios_acuerdos).
+        """
+        conn = self._lectura()
+        try:
+            origen, condiciones, params, terminos = self._consulta_acuerdos(conn, filtros, orden)
+
+            total = marca = None
+            if despues is None and limite > 0:  # Con limite=-1 no hace falta el total
+                # La marca se toma antes de leer: lo que cambie después se volverá a pedir
+                marca = self._marca(conn)
+                total = conn.execute(
+                    f"SELECT COUNT(*) FROM {origen} WHERE {' AND '.join(condiciones) or '1=1'}", params
+                ).fetchone()[0]
+            if despues is not None:
+                condicion, params_keyset = condicion_keyset(terminos, despues)
+                condiciones = condiciones + [condicion]
+                params = params + params_keyset
+
+            acuerdos, claves = self._filas_acuerdos(conn, origen, condiciones, params, terminos, limite)
+        finally:
+            conn.close()
+
+        siguiente = claves[-1] if acuerdos and len(acuerdos) == limite else None
+        return Pagina(acuerdos, siguiente, total, claves, marca)
+
+    def cambios_acuerdos(self, filtros, marca, orden="prioridad"):
+        """Acuerdos modificados después de la marca, o None si conviene recargar todo"""
+        conn = self._lectura()
+        try:
+            nueva_marca = self._marca(conn)
+            if nueva_marca is None or marca is None:
+                return None
+            ids = [fila[0] for fila in conn.execute(
+                "SELECT id FROM acuerdos WHERE version > ? LIMIT ?", (marca, MAX_CAMBIOS + 1))]
+
+            origen, condiciones, params, terminos = self._consulta_acuerdos(conn, filtros, orden)
+            direcciones = tuple(direccion for _, direccion in terminos)
+            if len(ids) > MAX_CAMBIOS:
+                return None
+            if not ids:
+                return Cambios(nueva_marca, [], [], [], direcciones)
+
+            condiciones.append(f"acuerdos.id IN ({','.join('?' * len(ids))})")
+            acuerdos, claves = self._filas_acuerdos(conn, origen, condiciones, params + ids, terminos)
+        finally:
+            conn.close()
+
+        vigentes = {clave[-1] for clave in claves}
+        return Cambios(nueva_marca, acuerdos, claves, [i for i in ids if i not in vigentes], direcciones)
+
+    def historial(self, id_acuerdo):
+        """Versión vigente del acuerdo y sus registros de historial (de la caché si ya se leyó)"""
+        datos = self.historial_en_cache(id_acuerdo)
+        if datos is None:
+            datos = self.historiales([id_acuerdo])[id_acuerdo]
+        return datos
+
+    def historial_en_cache(self, id_acuerdo):
+        """HistorialAcuerdo ya leído (precargado) o None; nunca consulta la base"""
+        return _cache_historial.buscar(self.db_path, str(id_acuerdo))
+
+    def historiales(self, ids_acuerdo):
+        """{id_acuerdo: HistorialAcuerdo} de varios acuerdos con dos consultas, y los guarda en caché.
+
+        El último usuario que modificó cada acuerdo sale de su versión más reciente
+        del historial, en lugar de una subconsulta correlacionada por fila.
+        """
+        ids = list(dict.fromkeys(str(i) for i in ids_acuerdo))
+        generacion = _cache_historial.generacion(self.db_path)
+        actuales, versiones = {}, {i: [] for i in ids}
+        conn = self._lectura()
+        try:
+            for inicio in range(0, len(ids), LOTE_HISTORIAL):
+                lote = ids[inicio:inicio + LOTE_HISTORIAL]
+                marcas = ",".join("?" * len(lote))
+                for fila in conn.execute(
+                        f"""SELECT id_acuerdo, usuario_registra, fecha_estatus, estatus, acuerdo,
+                                   responsables, fecha_compromiso, comentarios
+                            FROM acuerdos
+                            WHERE id_acuerdo IN ({marcas})""", lote):
+                    actuales[str(fila[0])] = fila[1:]
+                for fila in conn.execute(
+                        f"""SELECT id_acuerdo, fecha_modificacion, usuario_modifico, estatus, acuerdo,
+                                   responsables, fecha_compromiso, comentarios, cambios, delta
+                            FROM historial_acuerdos
+                            WHERE id_acuerdo IN ({marcas})
+                            ORDER BY id_acuerdo DESC, fecha_modificacion DESC, id DESC""", lote):
+                    versiones[str(fila[0])].append(VersionAcuerdo(*fila[1:]))
+        finally:
+            conn.close()
+
+        datos = {}
+        for id_acuerdo in ids:
+            fila = actuales.get(id_acuerdo)
+            if not fila:
+                datos[id_acuerdo] = HistorialAcuerdo(None, None, versiones[id_acuerdo])
+                continue
+            usuario_registra, fecha_estatus = fila[0], fila[1]
+            recientes = versiones[id_acuerdo]
+            ultimo_usuario = recientes[0].usuario if recientes and recientes[0].usuario is not None \
+                else usuario_registra
+            datos[id_acuerdo] = HistorialAcuerdo(
+                usuario_registra, VersionAcuerdo(fecha_estatus, ultimo_usuario, *fila[2:]), recientes)
+        _cache_historial.guardar(self.db_path, datos, TTL_HISTORIAL, generacion)
+        return datos
+
+    def _metricas(self, conn, hoy):
+        # Totales mantenidos por triggers (sql/metricas.py): no se recorren los acuerdos
+        totales = conn.execute("""
+            SELECT activos, editados, cerrados,
+                   segundos_cierre / 86400.0 / NULLIF(cierres_con_fecha, 0)
+            FROM metricas WHERE id = 1
+        """).fetchone()
+
+        frecuentes = self._carga(conn, hoy)
+
+        atrasado = conn.execute("""
+            SELECT a.acuerdo, a.responsables,
+                   ? - a.compromiso_dia AS dias_atraso
+            FROM acuerdos a
+            WHERE a.estatus IN ('Activo', 'Editado')
+              AND a.compromiso_dia < ?
+            ORDER BY a.compromiso_dia ASC
+            LIMIT 1
+        """, (hoy, hoy)).fetchone()
+
+        return MetricasMenu(
+            totales[0], totales[1], totales[2], totales[3],
+            frecuentes,
+            AcuerdoAtrasado(atrasado[0], atrasado[1], int(atrasado[2])) if atrasado else None
+        )
+
+    def _carga(self, conn, hoy):
+        """CargaResponsable de las personas con acuerdos abiertos, por nombre (sql/carga.py)"""
+        atrasados, params = atrasados_al_dia(conn, hoy)
+        filas = conn.execute(f"""
+            SELECT u.nombre, c.abiertos, {atrasados}, c.cerrados
+            FROM carga_responsables c
+            JOIN usuarios u ON u.id = c.usuario_id
+            WHERE c.abiertos > 0
+            ORDER BY u.nombre COLLATE NOCASE ASC
+        """, params).fetchall()
+        return [CargaResponsable(*fila) for fila in filas]
+
+    def _pendientes(self, conn, hoy, despues=None, limite=PAGINA_ACUERDOS):
+        condicion, params = "", []
+        if despues is not None:
+            condicion, params = condicion_keyset([("compromiso_dia", "ASC"), ("id", "ASC")], despues)
+            condicion = "AND " + condicion
+        filas = conn.execute(f"""
+            SELECT
+                acuerdo,
+                responsables,
+                comentarios,
+                compromiso_dia - ? AS dias_restantes,
+                id,
+                version,
+                compromiso_dia,
+                id
+            FROM acuerdos
+            WHERE estatus != 'Cerrado' AND compromiso_dia IS NOT NULL {condicion}
+            ORDER BY compromiso_dia ASC, id ASC  -- recorre idx_acuerdos_abiertos_dia
+            LIMIT ?
+        """, [hoy] + params + [limite]).fetchall()
+        total = None
+        if despues is None:
+            total = conn.execute("SELECT pendientes FROM metricas WHERE id = 1").fetchone()[0]
+        claves = [tuple(fila[6:]) for fila in filas]
+        siguiente = claves[-1] if filas and len(filas) == limite else None
+        return Pagina([AcuerdoPendiente(*fila[:6]) for fila in filas], siguiente, total, claves)
+
+    def acuerdos_pendientes(self, despues=None, limite=PAGINA_ACUERDOS):
+        """Página de acuerdos abiertos ordenados por proximidad a su fecha compromiso"""
+        conn = self._lectura()
+        try:
+            return self._pendientes(conn, hoy_dia(), despues, limite)
+        finally:
+            conn.close()
+
+    def datos_menu(self, usuarios_iniciales=()):
+        """Todo lo que muestra el menú principal, en una sola conexión"""
+        hoy = hoy_dia()
+        conn = self._lectura()
+        try:
+            cargados = False
+            if usuarios_iniciales:
+                marcas = ",".join("?" * len(usuarios_iniciales))
+                cargados = conn.execute(
+                    f"SELECT EXISTS (SELECT 1 FROM usuarios WHERE nombre IN ({marcas}))",
+                    list(usuarios_iniciales)
+                ).fetchone()[0] == 1
+            return DatosMenu(self._metricas(conn, hoy), self._pendientes(conn, hoy), cargados)
+        finally:
+            conn.close()
+
+    def nombres_usuarios(self, incluir_eliminados=False):
+        """Nombres registrados en usuarios"""
+        conn = self._lectura()
+        try:
+            if incluir_eliminados:
+                filas = conn.execute("SELECT nombre FROM usuarios").fetchall()
+            else:
+                filas = conn.execute(
+                    "SELECT DISTINCT nombre FROM usuarios WHERE nombre != '' AND estatus != 'Eliminado'"
+                ).fetchall()
+            return [fila[0] for fila in filas]
+        finally:
+            conn.close()
+
+    def indice_personas(self):
+        """IndicePersonas de la minuta: se lee una vez y se conserva hasta la siguiente escritura"""
+        from sql.querys import personas_con_asignaciones
+
+        def cargar():
+            conn = self._lectura()
+            try:
+                return IndicePersonas(conn.execute(personas_con_asignaciones).fetchall())
+            finally:
+                conn.close()
+
+        return _cache_personas.obtener(self.db_path, "personas", TTL_PERSONAS, cargar)
+
+    def datos_responsables(self, id_acuerdo):
+        """Índice de personas y responsables actuales del acuerdo (nombres completos)"""
+        from sql.querys import responsables_de_acuerdo
+
+        conn = self._lectura()
+        try:
+            actuales = conn.execute(responsables_de_acuerdo, (id_acuerdo,)).fetchall()
+        finally:
+            conn.close()
+        return DatosResponsables(self.indice_personas(), [a[0] for a in actuales])
+
+    def filas_tablero(self):
+        """Acuerdos y responsables con los que el dashboard arma su tabla en memoria"""
+        conn = self._lectura()
+        try:
+            conn.execute("BEGIN")  # Ambas lecturas ven la misma versión de la minuta
+            acuerdos = conn.execute("""
+                SELECT id, id_acuerdo, acuerdo, estatus, responsables, compromiso_dia, registro_epoch
+                FROM acuerdos ORDER BY id""").fetchall()
+            responsables = conn.execute("""
+                SELECT ar.acuerdo_id, u.nombre
+                FROM acuerdo_responsables ar
+                JOIN usuarios u ON u.id = ar.usuario_id
+                ORDER BY ar.acuerdo_id, ar.posicion""").fetchall()
+            return FilasTablero(acuerdos, responsables)
+        finally:
+            conn.close()
+
+    def ruta_pdf_cierre(self, id_acuerdo):
+        """Ruta del PDF del cierre más reciente del acuerdo, o None"""
+        conn = self._lectura()
+        try:
+            fila = conn.execute(
+                """SELECT ruta_pdf FROM historial_acuerdos
+                WHERE id_acuerdo = ? AND estatus = 'Cerrado'
+                ORDER BY fecha_modificacion DESC LIMIT 1""",
+                (id_acuerdo,)
+            ).fetchone()
+            return fila[0] if fila else None
+        finally:
+            conn.close()
+
+    def datos_cierre(self, id_acuerdo):
+        """Campos del acuerdo que van en el reporte de cierre, o None"""
+        conn = self._lectura()
+        try:
+            fila = conn.execute(
+                """SELECT acuerdo, responsables, fecha_compromiso, fecha_registro
+                   FROM acuerdos WHERE id_acuerdo = ?""",
+                (id_acuerdo,)
+            ).fetchone()
+            return DatosCierre(*fila) if fila else None
+        finally:
+            conn.close()
+
+    def exportacion(self):
+        """(columnas, filas) de los acuerdos con su historial resumido, para Excel"""
+        conn = self._lectura()
+        try:
+            cursor = conn.execute(f"""
+                SELECT
+                    a.id_acuerdo,
+                    a.acuerdo,
+                    a.responsables,
+                    a.fecha_compromiso,
+                    a.fecha_registro,
+                    a.usuario_registra,
+                    a.estatus,
+                    a.fecha_estatus,
+                    a.comentarios_cierre,
+                    GROUP_CONCAT(h.fecha_modificacion || ' - ' || h.estatus || {CAMPOS_CAMBIADOS}, '\n') AS historial,
+                    CAST((JULIANDAY(a.fecha_estatus) - JULIANDAY(a.fecha_compromiso)) AS INTEGER) AS diferencia_dias
+                FROM acuerdos a
+                LEFT JOIN historial_acuerdos h ON a.id_acuerdo = h.id_acuerdo
+                GROUP BY a.id_acuerdo
+                ORDER BY a.id_acuerdo
+            """)
+            columnas = [descripcion[0] for descripcion in cursor.description]
+            return columnas, cursor.fetchall()
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------ escrituras
+
+    def _escribir(self, operacion, **parametros):
+        ejecutar(self.db_path, operacion, **parametros)
+        invalidar_cache_historial(self.db_path)
+        if operacion in ESCRITURAS_PERSONAS or parametros.get("campo") == "responsables":
+            invalidar_indice_personas(self.db_path)
+
+    def editar_acuerdo(self, id_acuerdo, campo, valor, usuario, estatus="Editado"):
+        self._escribir("editar_acuerdo", id_acuerdo=id_acuerdo, campo=campo,
+                       valor=valor, usuario=usuario, estatus=estatus)
+
+    def editar_responsables(self, id_acuerdo, responsables, nuevos, usuario, estatus="Editado"):
+        self._escribir("editar_responsables", id_acuerdo=id_acuerdo, responsables=responsables,
+                       nuevos=list(nuevos), usuario=usuario, estatus=estatus)
+
+    def registrar_acuerdo(self, id_acuerdo, acuerdo, responsables, fecha_compromiso,
+                          fecha_registro, usuario, comentarios=None):
+        self._escribir("registrar_acuerdo", id_acuerdo=id_acuerdo, acuerdo=acuerdo,
+                       responsables=responsables, fecha_compromiso=fecha_compromiso,
+                       fecha_registro=fecha_registro, usuario=usuario, comentarios=comentarios)
+
+    def cerrar_acuerdo(self, id_acuerdo, fecha_cierre, usuario, comentarios, ruta_pdf):
+        self._escribir("cerrar_acuerdo", id_acuerdo=id_acuerdo, fecha_cierre=fecha_cierre,
+                       usuario=usuario, comentarios=comentarios, ruta_pdf=ruta_pdf)
+
+    def registrar_usuarios(self, nombres, usuario, fecha=None):
+        self._escribir("registrar_usuarios", nombres=list(nombres), usuario=usuario, fecha=fecha)
+
+    def renombrar_usuario(self, nombre_actual, nuevo_nombre):
+        self._escribir("renombrar_usuario", nombre_actual=nombre_actual, nuevo_nombre=nuevo_nombre)
+
+    def eliminar_usuario(self, nombre):
+        self._escribir("eliminar_usuario", nombre=nombre)
+
+
+# ---------------------------------------------------------------- filas de MASTER
+
+class InfoDB(NamedTuple):
+    id: int
+    db_name: str
+    usuario_windows: str
+    objetivo: Optional[str]
+    asuntos: Optional[str]
+
+
+class Solicitud(NamedTuple):
+    id: int
+    solicitante: str
+    db_name: str
+    fecha: str
+
+
+class Host(NamedTuple):
+    db_name: str
+    fecha_acceso: Optional[str]
+    objetivo: Optional[str]
+    asuntos: Optional[str]
+    direccion: str
+
+
+class HostCompartido(NamedTuple):
+    db_name: str
+    usuario: str
+    fecha_aprobacion: Optional[str]
+
+
+class OtroHost(NamedTuple):
+    db_name: str
+    usuario_windows: str
+    objetivo: Optional[str]
+    asuntos: Optional[str]
+    fecha_creacion: Optional[str]
+    direccion: str
+    id: int
+    estado: str  # pendiente, aprobado, rechazado o disponible
+
+
+class DatosHost(NamedTuple):
+    es_propietario: bool
+    solicitudes: list
+    hosts: list
+    compartidos: list
+    otros_hosts: list
+
+
+class AccesoDB(NamedTuple):
+    """Registro de dbs al que el usuario puede entrar (propio o con solicitud aprobada)"""
+    id: int
+    administrador: str
+    db_name: str
+    direccion: str
+    esclavo: Optional[str]
+    tabla_origen: str
+
+
+class InicioMaster(NamedTuple):
+    usuario_existe: bool
+    reciente: Optional[str]      # Última minuta en la que entró el usuario
+    default: Optional[str]       # Minuta 'Default'
+
+
+# Vigencia de las lecturas de MASTER.db que se repiten en cada cierre y en el menú
+TTL_DBS = 300        # Registros de dbs: solo cambian al crear/eliminar una minuta
+TTL_ACCESOS = 30     # Solicitudes y permisos: otro usuario puede cambiarlos
+
+_cache_master = CacheTTL()
+
+# Último ingreso del usuario en un rol, leído de la bitácora (MASTER sin ultimo_ingreso).
+# Cada rol por separado baja por su índice (rol, fecha) en lugar de un OR.
+INGRESO_RECIENTE = """
+    SELECT i.direccion, i.fecha_de_ultimo_acceso AS fecha
+      FROM ingresos AS i
+      JOIN dbs      AS d
+        ON i.direccion = d.direccion
+       AND d.estatus   <> 'Eliminada'
+     WHERE i.{rol} = :usuario
+     ORDER BY i.fecha_de_ultimo_acceso DESC
+     LIMIT 1"""
+
+# Última minuta (no eliminada) del usuario: desde ultimo_ingreso, mantenida por trigger,
+# o desde la bitácora completa si MASTER.db aún no tiene esa tabla
+RECIENTE_RESUMEN = """
+    SELECT u.direccion
+      FROM ultimo_ingreso AS u
+      JOIN dbs            AS d
+        ON u.direccion = d.direccion
+       AND d.estatus   <> 'Eliminada'
+     WHERE u.usuario = :usuario
+     ORDER BY u.fecha DESC
+     LIMIT 1"""
+
+RECIENTE_BITACORA = f"""
+    SELECT direccion FROM (
+        SELECT * FROM ({INGRESO_RECIENTE.format(rol="administrador")})
+        UNION ALL
+        SELECT * FROM ({INGRESO_RECIENTE.format(rol="esclavo")})
+    )
+    ORDER BY fecha DESC
+    LIMIT 1"""
+
+PAGINA_OTROS_HOSTS = 200   # Filas por página del catálogo "Otros Host"
+
+
+def _escapar_like(texto):
+    """Escapa los comodines de LIKE para buscar el texto literal"""
+    return texto.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def invalidar_cache_master(master_path=None):
+    """Descarta las lecturas en caché de MASTER.db (p. ej. tras cambios en la ventana Host)"""
+    _cache_master.invalidar(master_path)
+
+
+def _en_cache(ttl):
+    """Guarda el resultado del método por sus argumentos durante ttl segundos"""
+    def decorador(metodo):
+        @functools.wraps(metodo)
+        def envoltura(self, *args):
+            return _cache_master.obtener(
+                self.master_path, (metodo.__name__,) + args, ttl, lambda: metodo(self, *args)
+            )
+        return envoltura
+    return decorador
+
+
+class MasterRepository:
+    """Lecturas y escrituras de MASTER.db.
+
+    Las búsquedas de dbs y permisos se guardan en caché (TTL_DBS / TTL_ACCESOS) y se
+    invalidan con cada escritura hecha desde este proceso.
+    """
+
+    def __init__(self, master_path=MASTER):
+        self.master_path = master_path
+
+    def _conexion(self):
+        # MASTER.db no se replica: siempre se lee del archivo compartido
+        return conectar(self.master_path)
+
+    def _escribir(self, sql, params=()):
+        conn = self._conexion()
+        try:
+            with conn:
+                return conn.execute(sql, params).rowcount
+        finally:
+            conn.close()
+            invalidar_cache_master(self.master_path)
+
+    # ------------------------------------------------------------ minutas (dbs)
+
+    @_en_cache(TTL_DBS)
+    def info_db(self, direccion):
+        """Registro de dbs de una minuta por su dirección, o None"""
+        conn = self._conexion()
+        try:
+            fila = conn.execute(
+                """SELECT id, db_name, usuario_windows, objetivo, asuntos
+                   FROM dbs WHERE direccion = ? LIMIT 1""",
+                (direccion,)
+            ).fetchone()
+            return InfoDB(*fila) if fila else None
+        finally:
+            conn.close()
+
+    @_en_cache(TTL_DBS)
+    def dueno_de(self, direccion):
+        """(db_id, usuario_windows) de la minuta cuya dirección empieza con la indicada"""
+        conn = self._conexion()
+        try:
+            return conn.execute(
+                "SELECT id, usuario_windows FROM dbs WHERE direccion LIKE ?",
+                (direccion + '%',)
+            ).fetchone()
+        finally:
+            conn.close()
+
+    @_en_cache(TTL_DBS)
+    def usuario_tiene_dbs(self, usuario):
+        conn = self._conexion()
+        try:
+            return conn.execute(
+                "SELECT 1 FROM dbs WHERE usuario_windows = ? LIMIT 1", (usuario,)
+            ).fetchone() is not None
+        finally:
+            conn.close()
+
+    @_en_cache(TTL_DBS)
+    def db_default(self):
+        """Dirección de la minuta 'Default', o None"""
+        conn = self._conexion()
+        try:
+            fila = conn.execute("SELECT direccion FROM dbs WHERE db_name = 'Default' LIMIT 1").fetchone()
+            return fila[0] if fila else None
+        finally:
+            conn.close()
+
+    def db_mas_reciente(self, usuario):
+        """Dirección de la última minuta (no eliminada) a la que entró el usuario, o None"""
+        conn = self._conexion()
+        try:
+            try:
+                fila = conn.execute(RECIENTE_RESUMEN, {"usuario": usuario}).fetchone()
+            except sqlite3.OperationalError:
+                # MASTER.db aún sin migrar (p. ej. la migración no obtuvo el bloqueo)
+                fila = conn.execute(RECIENTE_BITACORA, {"usuario": usuario}).fetchone()
+            return fila[0] if fila else None
+        finally:
+            conn.close()
+
+    def inicio(self, usuario):
+        """Lo necesario para elegir la minuta de arranque, en una sola consulta"""
+        conn = self._conexion()
+        try:
+            for reciente in (RECIENTE_RESUMEN, RECIENTE_BITACORA):
+                try:
+                    fila = conn.execute(f"""
+                        SELECT EXISTS (SELECT 1 FROM dbs WHERE usuario_windows = :usuario),
+                               ({reciente}),
+                               (SELECT direccion FROM dbs WHERE db_name = 'Default' LIMIT 1)
+                    """, {"usuario": usuario}).fetchone()
+                    return InicioMaster(bool(fila[0]), fila[1], fila[2])
+                except sqlite3.OperationalError:
+                    if reciente is RECIENTE_BITACORA:
+                        raise
+        finally:
+            conn.close()
+
+    def registrar_db(self, usuario, db_name, objetivo, asuntos, direccion):
+        """Da de alta una minuta en dbs como Activa"""
+        self._escribir(
+            """INSERT INTO dbs (
+                usuario_windows, db_name, objetivo, asuntos,
+                fecha_creacion, estatus, direccion, fecha_de_ultimo_acceso
+            ) VALUES (?, ?, ?, ?, datetime('now'), 'Activa', ?, datetime('now'))""",
+            (usuario, db_name, objetivo, asuntos, direccion)
+        )
+
+    def tocar_db(self, direccion):
+        """Actualiza la fecha de último acceso; devuelve False si la minuta no está en dbs"""
+        return self._escribir(
+            "UPDATE dbs SET fecha_de_ultimo_acceso = datetime('now') WHERE direccion = ?",
+            (direccion,)
+        ) > 0
+
+    # ------------------------------------------------------------ solicitudes
+
+    @_en_cache(TTL_ACCESOS)
+    def solicitudes_pendientes(self, direccion, usuario):
+        """Solicitudes pendientes del dueño, solo si el usuario es dueño de la minuta indicada"""
+        conn = self._conexion()
+        try:
+            fila = conn.execute("""
+                SELECT CASE WHEN LOWER(d.usuario_windows) = LOWER(:usuario) THEN (
+                           SELECT COUNT(*)
+                           FROM solicitudes_acceso s
+                           JOIN dbs p ON s.db_id = p.id
+                           WHERE s.estatus = 'pendiente'
+                           AND p.usuario_windows = :usuario
+                       ) ELSE 0 END
+                FROM dbs d
+                WHERE d.direccion = :direccion
+            """, {"usuario": usuario, "direccion": direccion}).fetchone()
+            return fila[0] if fila else 0
+        finally:
+            conn.close()
+
+    @_en_cache(TTL_ACCESOS)
+    def pendientes_de_db(self, db_id):
+        """Número de solicitudes pendientes de una minuta"""
+        conn = self._conexion()
+        try:
+            return conn.execute(
+                "SELECT COUNT(*) FROM solicitudes_acceso WHERE db_id = ? AND estatus = 'pendiente'",
+                (db_id,)
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------ pantalla Host
+
+    def _solicitudes(self, conn, usuario):
+        return [Solicitud(*fila) for fila in conn.execute("""
+            SELECT s.id, s.usuario_solicitante, d.db_name, s.fecha_solicitud
+            FROM solicitudes_acceso s
+            JOIN dbs d ON s.db_id = d.id
+            WHERE s.estatus = 'pendiente'
+            AND d.usuario_windows = ?
+            AND s.usuario_solicitante != ?
+            ORDER BY s.fecha_solicitud DESC
+        """, (usuario, usuario)).fetchall()]
+
+    def _hosts(self, conn, usuario):
+        return [Host(*fila) for fila in conn.execute("""
+            SELECT db_name, fecha_de_ultimo_acceso, objetivo, asuntos, direccion
+            FROM dbs
+            WHERE usuario_windows = ? AND estatus = 'Activa'
+            ORDER BY fecha_de_ultimo_acceso DESC
+        """, (usuario,)).fetchall()]
+
+    def _compartidos(self, conn, usuario):
+        return [HostCompartido(*fila) for fila in conn.execute("""
+            SELECT d.db_name, s.usuario_solicitante, s.fecha_respuesta
+            FROM solicitudes_acceso s
+            JOIN dbs d ON s.db_id = d.id
+            WHERE s.estatus = 'aprobado'
+            AND d.usuario_windows = ?
+            AND d.estatus = 'Activa'
+            ORDER BY s.fecha_respuesta DESC
+        """, (usuario,)).fetchall()]
+
+    def _otros_hosts(self, conn, usuario, busqueda="", despues=None, limite=PAGINA_OTROS_HOSTS):
+        # Estado de la solicitud del usuario: una sola agregación de sus solicitudes
+        # (pendiente > aprobado > rechazado) en lugar de tres EXISTS por minuta.
+        # Se pagina por db_name (único) para no traer el catálogo completo.
+        condiciones = ""
+        params = {"usuario": usuario, "limite": limite}
+        if busqueda:
+            condiciones += """
+            AND (d.db_name LIKE :patron ESCAPE '\\'
+                 OR d.usuario_windows LIKE :patron ESCAPE '\\'
+                 OR d.objetivo LIKE :patron ESCAPE '\\')"""
+            params["patron"] = "%" + _escapar_like(busqueda) + "%"
+        if despues is not None:
+            condiciones += "\n            AND d.db_name > :despues"
+            params["despues"] = despues
+
+        return [OtroHost(*fila) for fila in conn.execute(f"""
+            SELECT
+                d.db_name,
+                d.usuario_windows,
+                d.objetivo,
+                d.asuntos,
+                d.fecha_creacion,
+                d.direccion,
+                d.id,
+                CASE s.prioridad
+                    WHEN 3 THEN 'pendiente'
+                    WHEN 2 THEN 'aprobado'
+                    WHEN 1 THEN 'rechazado'
+                    ELSE 'disponible'
+                END AS estado
+            FROM dbs d
+            LEFT JOIN (
+                SELECT db_id,
+                       MAX(CASE estatus
+                               WHEN 'pendiente' THEN 3
+                               WHEN 'aprobado' THEN 2
+                               WHEN 'rechazado' THEN 1
+                           END) AS prioridad
+                FROM solicitudes_acceso
+                WHERE usuario_solicitante = :usuario
+                GROUP BY db_id
+            ) s ON s.db_id = d.id
+            WHERE d.estatus = 'Activa'
+            AND d.usuario_windows != 'Master'
+            AND d.usuario_windows COLLATE NOCASE != :usuario{condiciones}
+            ORDER BY d.db_name
+            LIMIT :limite
+        """, params).fetchall()]
+
+    def _leer(self, consulta, *args):
+        conn = self._conexion()
+        try:
+            return consulta(conn, *args)
+        finally:
+            conn.close()
+
+    def solicitudes(self, usuario):
+        """Solicitudes pendientes sobre las minutas del usuario"""
+        return self._leer(self._solicitudes, usuario)
+
+    def hosts(self, usuario):
+        """Minutas activas del usuario, de la más a la menos usada"""
+        return self._leer(self._hosts, usuario)
+
+    def compartidos(self, usuario):
+        """Accesos aprobados a las minutas del usuario"""
+        return self._leer(self._compartidos, usuario)
+
+    def otros_hosts(self, usuario, busqueda="", despues=None, limite=PAGINA_OTROS_HOSTS):
+        """Página de minutas de otros usuarios con el estado de la solicitud del usuario.
+
+        busqueda filtra por nombre, propietario u objetivo; despues es el db_name de la
+        última fila ya mostrada (paginación por llave).
+        """
+        return self._leer(self._otros_hosts, usuario, busqueda, despues, limite)
+
+    def datos_host(self, usuario):
+        """Las cuatro pestañas de la ventana Host en una sola conexión.
+
+        Si el usuario no es dueño de ninguna minuta se muestran las de 'Master'.
+        """
+        conn = self._conexion()
+        try:
+            propietario = conn.execute(
+                "SELECT 1 FROM dbs WHERE usuario_windows = ? LIMIT 1", (usuario,)
+            ).fetchone() is not None
+            if not propietario:
+                usuario = "Master"
+            return DatosHost(
+                propietario,
+                self._solicitudes(conn, usuario),
+                self._hosts(conn, usuario),
+                self._compartidos(conn, usuario),
+                self._otros_hosts(conn, usuario),
+            )
+        finally:
+            conn.close()
+
+    def direccion_de_host(self, db_name, usuario):
+        """Dirección de una minuta propia por su nombre, o None"""
+        conn = self._conexion()
+        try:
+            fila = conn.execute(
+                "SELECT direccion FROM dbs WHERE db_name = ? AND usuario_windows = ?",
+                (db_name, usuario)
+            ).fetchone()
+            return fila[0] if fila else None
+        finally:
+            conn.close()
+
+    def responder_solicitud(self, solicitud_id, aprobar, fecha_respuesta=None):
+        """Aprueba (con fecha de respuesta) o rechaza una solicitud"""
+        if aprobar:
+            self._escribir(
+                "UPDATE solicitudes_acceso SET estatus = 'aprobado', fecha_respuesta = ? WHERE id = ?",
+                (fecha_respuesta, solicitud_id)
+            )
+        else:
+            self._escribir(
+                "UPDATE solicitudes_acceso SET estatus = 'rechazado' WHERE id = ?", (solicitud_id,)
+            )
+
+    def eliminar_host(self, db_name, usuario):
+        """Marca como Eliminada una minuta propia; devuelve las filas afectadas"""
+        return self._escribir("""
+            UPDATE dbs
+            SET estatus = 'Eliminada'
+            WHERE db_name COLLATE NOCASE = ?
+            AND usuario_windows COLLATE NOCASE = ?
+        """, (db_name, usuario))
+
+    def solicitar_acceso(self, db_id, solicitante, fecha):
+        """Crea una solicitud pendiente (sqlite3.IntegrityError si ya existe)"""
+        self._escribir("""
+            INSERT INTO solicitudes_acceso
+            (db_id, usuario_solicitante, fecha_solicitud, estatus)
+            VALUES (?, ?, ?, 'pendiente')
+        """, (db_id, solicitante, fecha))
+
+    def retirar_permiso(self, db_name, usuario):
+        """Pasa a rechazado el acceso aprobado de un usuario a la minuta"""
+        self._escribir("""
+            UPDATE solicitudes_acceso
+            SET estatus = 'rechazado'
+            WHERE id = (
+                SELECT s.id
+                FROM solicitudes_acceso s
+                JOIN dbs d ON s.db_id = d.id
+                WHERE d.db_name = ?
+                AND s.usuario_solicitante = ?
+                AND s.estatus = 'aprobado'
+            )
+        """, (db_name, usuario))
+
+    # ------------------------------------------------------------ ingresos
+
+    def registrar_ingreso(self, direccion, usuario, fecha):
+        """Registra la entrada del usuario a una minuta propia o compartida con él.
+
+        Devuelve el AccesoDB registrado, o None si la minuta no existe o no tiene permiso.
+        """
+        conn = self._conexion()
+        try:
+            with conn:
+                conn.execute(TABLA_INGRESOS)
+                fila = conn.execute("""
+                SELECT dbs.id, dbs.usuario_windows, dbs.db_name, dbs.direccion,
+                       solicitudes_acceso.usuario_solicitante,
+                       CASE
+                           WHEN dbs.usuario_windows = :usuario THEN 'dbs'
+                           WHEN solicitudes_acceso.usuario_solicitante = :usuario
+                                AND solicitudes_acceso.estatus = 'aprobado' THEN 'solicitudes_acceso'
+                       END AS tabla_origen
+                FROM dbs
+                LEFT JOIN solicitudes_acceso ON
+                    dbs.id = solicitudes_acceso.db_id AND
+                    solicitudes_acceso.usuario_solicitante = :usuario AND
+                    solicitudes_acceso.estatus = 'aprobado'
+                WHERE dbs.direccion = :direccion
+                    AND (dbs.usuario_windows = :usuario
+                         OR solicitudes_acceso.usuario_solicitante IS NOT NULL)
+                LIMIT 1
+                """, {"usuario": usuario, "direccion": direccion}).fetchone()
+                if not fila:
+                    return None
+
+                acceso = AccesoDB(*fila)
+                conn.execute("""
+                INSERT INTO ingresos
+                (db_id, administrador, esclavo, db_name, direccion, fecha_de_ultimo_acceso, tabla_origen)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (acceso.id, acceso.administrador, acceso.esclavo, acceso.db_name,
+                      acceso.direccion, fecha, acceso.tabla_origen))
+                conn.execute(
+                    "UPDATE dbs SET fecha_de_ultimo_acceso = ? WHERE id = ?", (fecha, acceso.id)
+                )
+            invalidar_cache_master(self.master_path)
+            return acceso
+        finally:
+            conn.close()
+
+    def compactar_ingresos(self, dias=RETENCION_INGRESOS_DIAS):
+        """Resume por día los ingresos con más de `dias` de antigüedad y los borra.
+
+        Devuelve cuántos ingresos se compactaron (0 si no había ninguno viejo).
+        """
+        limite = (datetime.now() - timedelta(days=dias)).strftime("%Y-%m-%d")
+        conn = self._conexion()
+        try:
+            # Consulta barata por índice: en la mayoría de los arranques no hay nada que hacer
+            if not conn.execute(
+                "SELECT 1 FROM ingresos WHERE fecha_de_ultimo_acceso < ? LIMIT 1", (limite,)
+            ).fetchone():
+                return 0
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("""
+                INSERT INTO ingresos_diarios
+                    (dia, direccion, administrador, esclavo, db_id, db_name, tabla_origen,
+                     ingresos, primer_acceso, ultimo_acceso)
+                SELECT substr(fecha_de_ultimo_acceso, 1, 10), direccion,
+                       IFNULL(administrador, ''), IFNULL(esclavo, ''),
+                       MAX(db_id), MAX(db_name), MAX(tabla_origen),
+                       COUNT(*), MIN(fecha_de_ultimo_acceso), MAX(fecha_de_ultimo_acceso)
+                FROM ingresos
+                WHERE fecha_de_ultimo_acceso < :limite
+                GROUP BY 1, 2, 3, 4
+                ON CONFLICT(dia, direccion, administrador, esclavo) DO UPDATE SET
+                    ingresos = ingresos + excluded.ingresos,
+                    primer_acceso = MIN(primer_acceso, excluded.primer_acceso),
+                    ultimo_acceso = MAX(ultimo_acceso, excluded.ultimo_acceso)
+                """, {"limite": limite})
+                compactados = conn.execute(
+                    "DELETE FROM ingresos WHERE fecha_de_ultimo_acceso < ?", (limite,)
+                ).rowcount
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+            return compactados
+        finally:
+            conn.close()
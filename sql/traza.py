@@ -0,0 +1,249 @@
+# sql/traza.py
+"""Traza opcional de sentencias SQL (MINUTAS_TRAZA=1 o MINUTAS_TRAZA=<archivo.jsonl>).
+
+Cada sentencia ejecutada por las conexiones de sql/conexion.py se mide desde el
+execute hasta leer su última fila y se agrega como una línea JSON al archivo de
+traza: texto, forma de los parámetros (tipos, sin valores), duración, filas,
+función que la pidió y lecturas de disco del proceso durante la sentencia.
+
+Python no expone los contadores de páginas de SQLite (sqlite3_stmt_status), así
+que se usan los contadores de E/S del proceso: SQLite lee cada página fuera de
+caché con una lectura propia, de modo que bytes_leidos / page_size aproxima las
+páginas leídas del recurso compartido. Otros hilos pueden sumar lecturas propias.
+
+El reporte de lentas y frecuentes está en sql/reporte_traza.py.
+"""
+import ctypes
+import json
+import os
+import sys
+import threading
+import time
+
+from rutas import RUTA_TRAZA
+
+ACTIVA = RUTA_TRAZA is not None
+
+# Archivos cuyas funciones no cuentan como "quién pidió la consulta"
+_INTERNOS = tuple(
+    os.path.join("sql", nombre) for nombre in ("conexion.py", "traza.py")
+)
+
+_candado = threading.Lock()
+_archivo = None
+
+
+# ---------------------------------------------------------------- contadores de E/S
+
+if sys.platform == "win32":
+    class _IO_COUNTERS(ctypes.Structure):
+        _fields_ = [(nombre, ctypes.c_ulonglong) for nombre in (
+            "ReadOperationCount", "WriteOperationCount", "OtherOperationCount",
+            "ReadTransferCount", "WriteTransferCount", "OtherTransferCount",
+        )]
+
+    def contadores_io():
+        """(bytes leídos, operaciones de lectura) acumulados por el proceso"""
+        contadores = _IO_COUNTERS()
+        kernel32 = ctypes.windll.kernel32
+        if not kernel32.GetProcessIoCounters(kernel32.GetCurrentProcess(), ctypes.byref(contadores)):
+            return None
+        return contadores.ReadTransferCount, contadores.ReadOperationCount
+else:
+    def contadores_io():
+        """(bytes leídos, operaciones de lectura) acumulados por el proceso"""
+        try:
+            with open("/proc/self/io") as f:
+                valores = dict(linea.split(":", 1) for linea in f)
+            return int(valores["rchar"]), int(valores["syscr"])
+        except (OSError, KeyError, ValueError):
+            return None
+
+
+# ---------------------------------------------------------------- registro
+
+def forma_parametros(params):
+    """Tipos de los parámetros sin sus valores: ['str', 'int'] o {'usuario': 'str'}"""
+    if isinstance(params, dict):
+        return {clave: type(valor).__name__ for clave, valor in params.items()}
+    return [type(valor).__name__ for valor in params or ()]
+
+
+def _relativa(archivo):
+    try:
+        return os.path.relpath(archivo)
+    except ValueError:
+        return archivo  # Otra unidad en Windows
+
+
+def llamadores():
+    """(función que ejecutó la sentencia, primera función fuera del paquete sql)"""
+    directo = pantalla = None
+    marco = sys._getframe(1)
+    while marco is not None:
+        archivo = marco.f_code.co_filename
+        if not archivo.endswith(_INTERNOS):
+            ubicacion = f"{_relativa(archivo)}:{marco.f_lineno}:{marco.f_code.co_name}"
+            if directo is None:
+                directo = ubicacion
+            if os.path.dirname(os.path.abspath(archivo)) != os.path.dirname(os.path.abspath(__file__)):
+                pantalla = ubicacion
+                break
+        marco = marco.f_back
+    return directo, pantalla
+
+
+def escribir(registro):
+    """Agrega un registro al archivo de traza (una línea JSON)"""
+    global _archivo
+    linea = json.dumps(registro, ensure_ascii=False, default=str)
+    with _candado:
+        try:
+            if _archivo is None:
+                directorio = os.path.dirname(RUTA_TRAZA)
+                if directorio:
+                    os.makedirs(directorio, exist_ok=True)
+                _archivo = open(RUTA_TRAZA, "a", encoding="utf-8")
+            _archivo.write(linea + "\n")
+            _archivo.flush()
+        except OSError as e:
+            print(f"No se pudo escribir la traza SQL: {e}")
+
+
+class Medicion:
+    """Tiempo, filas y lecturas de una sentencia hasta que se consume"""
+
+    def __init__(self, db_path, sql, params, page_size):
+        self.registro = {
+            "ts": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
+            "db": db_path,
+            "sql": " ".join(sql.split()),
+            "forma": forma_parametros(params),
+            "hilo": threading.current_thread().name,
+        }
+        self.registro["llamador"], self.registro["pantalla"] = llamadores()
+        self.page_size = page_size
+        self.duracion = 0.0
+        self.filas = 0
+        self.io_inicial = contadores_io()
+
+    def terminar(self, error=None):
+        io_final = contadores_io()
+        if self.io_inicial and io_final:
+            leidos = io_final[0] - self.io_inicial[0]
+            self.registro["bytes_leidos"] = leidos
+            self.registro["lecturas"] = io_final[1] - self.io_inicial[1]
+            if self.page_size:
+                self.registro["paginas"] = leidos // self.page_size
+        self.registro["ms"] = round(self.duracion * 1000, 3)
+        self.registro["filas"] = self.filas
+        if error is not None:
+            self.registro["error"] = str(error)
+        escribir(self.registro)
+
+
+class CursorTrazado:
+    """Cursor de sqlite3 que registra cada sentencia al leer su última fila"""
+
+    def __init__(self, cursor, db_path, page_size=None):
+        self._cursor = cursor
+        self._db_path = db_path
+        self._page_size = page_size
+        self._medicion = None
+
+    def _terminar(self, error=None):
+        if self._medicion is not None:
+            medicion, self._medicion = self._medicion, None
+            medicion.terminar(error)
+
+    def _medir(self, funcion, *args):
+        inicio = time.perf_counter()
+        try:
+            return funcion(*args)
+        except Exception as e:
+            self._medicion.duracion += time.perf_counter() - inicio
+            self._terminar(e)
+            raise
+        finally:
+            if self._medicion is not None:
+                self._medicion.duracion += time.perf_counter() - inicio
+
+    def _ejecutar(self, metodo, sql, params):
+        self._terminar()
+        self._medicion = Medicion(self._db_path, sql, params, self._page_size)
+        self._medir(metodo, sql, params)
+        if self._cursor.description is None:
+            # Sin filas que leer (INSERT/UPDATE/DDL): se registra de inmediato
+            self._medicion.filas = max(self._cursor.rowcount, 0)
+            self._terminar()
+        return self
+
+    def execute(self, sql, params=()):
+        return self._ejecutar(self._cursor.execute, sql, params)
+
+    def executemany(self, sql, params):
+        params = list(params)
+        self._ejecutar(self._cursor.executemany, sql, params)
+        return self
+
+    def fetchone(self):
+        if self._medicion is None:
+            return self._cursor.fetchone()
+        fila = self._medir(self._cursor.fetchone)
+        if fila is None:
+            self._terminar()
+        else:
+            self._medicion.filas += 1
+        return fila
+
+    def fetchmany(self, size=None):
+        if self._medicion is None:
+            return self._cursor.fetchmany(size or self._cursor.arraysize)
+        tamano = size or self._cursor.arraysize
+        filas = self._medir(self._cursor.fetchmany, tamano)
+        self._medicion.filas += len(filas)
+        if len(filas) < tamano:
+            self._terminar()
+        return filas
+
+    def fetchall(self):
+        if self._medicion is None:
+            return self._cursor.fetchall()
+        filas = self._medir(self._cursor.fetchall)
+        self._medicion.filas += len(filas)
+        self._terminar()
+        return filas
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        fila = self.fetchone()
+        if fila is None:
+            raise StopIteration
+        return fila
+
+    def close(self):
+        self._terminar()
+        self._cursor.close()
+
+    def __del__(self):
+        # Sentencias que no se leyeron hasta el final también quedan registradas
+        try:
+            self._terminar()
+        except Exception:
+            pass
+
+    def __getattr__(self, nombre):
+        return getattr(self._cursor, nombre)
+
+
+def medir_commit(db_path, confirmar):
+    """Registra el tiempo de un COMMIT (escritura y sincronización del archivo)"""
+    medicion = Medicion(db_path, "COMMIT", (), None)
+    inicio = time.perf_counter()
+    try:
+        return confirmar()
+    finally:
+        medicion.duracion = time.perf_counter() - inicio
+        medicion.terminar()
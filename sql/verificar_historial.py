@@ -0,0 +1,96 @@
+# sql/verificar_historial.py
+"""Comprueba que el historial anterior a la migración 8 quede marcado como el nuevo.
+
+Uso:  python -m sql.verificar_historial
+
+Escribe la misma historia (alta, edición, cierre y reapertura) en dos minutas en
+memoria: una con las sentencias de las pantallas anteriores, que no guardaban
+cambios ni delta y se completan con cambios_historial al migrar, y otra migrada
+que escribe con sql/operaciones.py. Las filas del historial deben coincidir.
+"""
+import sqlite3
+import sys
+
+from sql.migraciones import migrar
+from sql.operaciones import aplicar
+from sql.querys import historial_acuerdos, tabla_acuerdos, usuarios
+
+ID = "AC-1"
+ALTA = dict(id_acuerdo=ID, acuerdo="Revisar producción", responsables="Ana Lopez",
+            fecha_compromiso="2024-03-01", fecha_registro="2024-01-10 09:00:00", usuario="u")
+# (operación, parámetros) en orden: edición, cierre y reapertura con otra fecha
+HISTORIA = [
+    ("editar_acuerdo", dict(id_acuerdo=ID, campo="responsables", valor="Ana Lopez, Beto Ruiz",
+                            usuario="u", fecha="2024-01-15 10:00:00")),
+    ("cerrar_acuerdo", dict(id_acuerdo=ID, fecha_cierre="2024-02-20 12:00:00", usuario="u",
+                            comentarios="listo", ruta_pdf="C:/minutas/AC-1.pdf")),
+    ("editar_acuerdo", dict(id_acuerdo=ID, campo="fecha_compromiso", valor="2024-04-01",
+                            usuario="u", fecha="2024-02-25 08:00:00")),
+]
+
+
+def _minuta():
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    for tabla in (tabla_acuerdos, historial_acuerdos, usuarios):
+        conn.execute(tabla)
+    conn.executemany("INSERT INTO usuarios (nombre, fecha_registro, usuario_registra, estatus)"
+                     " VALUES (?, '2024-01-01 00:00:00', 'u', 'Activo')", [("Ana Lopez",), ("Beto Ruiz",)])
+    return conn
+
+
+def _escribir_como_antes(conn, operacion, p):
+    """Sentencias de las pantallas anteriores a sql/operaciones.py (sin cambios ni delta)"""
+    if operacion == "editar_acuerdo":
+        conn.execute("""INSERT INTO historial_acuerdos
+            (id_acuerdo, acuerdo, responsables, fecha_compromiso, fecha_modificacion, usuario_modifico, estatus)
+            SELECT id_acuerdo, acuerdo, responsables, fecha_compromiso, ?, ?, estatus
+            FROM acuerdos WHERE id_acuerdo = ?""", (p["fecha"], p["usuario"], p["id_acuerdo"]))
+        conn.execute(f"UPDATE acuerdos SET {p['campo']} = ?, fecha_estatus = ?, estatus = 'Editado'"
+                     " WHERE id_acuerdo = ?", (p["valor"], p["fecha"], p["id_acuerdo"]))
+    else:
+        conn.execute("""INSERT INTO historial_acuerdos
+            (id_acuerdo, acuerdo, responsables, fecha_compromiso,
+             fecha_modificacion, usuario_modifico, estatus, comentarios_cierre, ruta_pdf)
+            SELECT id_acuerdo, acuerdo, responsables, fecha_compromiso, ?, ?, 'Cerrado', ?, ?
+            FROM acuerdos WHERE id_acuerdo = ?""",
+                     (p["fecha_cierre"], p["usuario"], p["comentarios"], p["ruta_pdf"], p["id_acuerdo"]))
+        conn.execute("""UPDATE acuerdos SET estatus = 'Cerrado', fecha_estatus = ?, usuario_registra = ?,
+            comentarios_cierre = ? WHERE id_acuerdo = ?""",
+                     (p["fecha_cierre"], p["usuario"], p["comentarios"], p["id_acuerdo"]))
+
+
+def _historial(conn):
+    return conn.execute("SELECT estatus, cambios, delta FROM historial_acuerdos ORDER BY id").fetchall()
+
+
+def verificar():
+    """[(fila, migrada, escrita)] de las filas del historial que no coinciden"""
+    anterior = _minuta()
+    anterior.execute(
+        """INSERT INTO acuerdos (id_acuerdo, acuerdo, responsables, fecha_compromiso,
+           fecha_registro, usuario_registra, estatus, fecha_estatus)
+           VALUES (:id_acuerdo, :acuerdo, :responsables, :fecha_compromiso,
+                   :fecha_registro, :usuario, 'Activo', :fecha_registro)""", ALTA)
+    for operacion, parametros in HISTORIA:
+        _escribir_como_antes(anterior, operacion, parametros)
+    migrar(anterior)
+
+    actual = _minuta()
+    migrar(actual)
+    for operacion, parametros in [("registrar_acuerdo", ALTA)] + HISTORIA:
+        actual.execute("BEGIN IMMEDIATE")
+        aplicar(actual, operacion, parametros)
+        actual.execute("COMMIT")
+
+    migradas, escritas = _historial(anterior), _historial(actual)
+    return [(numero, migrada, escrita)
+            for numero, (migrada, escrita) in enumerate(zip(migradas, escritas), start=1)
+            if migrada != escrita] + [(None, migradas, escritas)] * (len(migradas) != len(escritas))
+
+
+if __name__ == "__main__":
+    diferencias = verificar()
+    for fila, migrada, escrita in diferencias:
+        print(f"fila {fila}: migrada {migrada}, escrita {escrita}")
+    print(f"{len(diferencias)} filas distintas")
+    sys.exit(1 if diferencias else 0)
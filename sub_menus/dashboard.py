@@ -1,15 +1,15 @@
 # mostrar_dashboard.py
 import tkinter as tk
 from tkinter import ttk, font, messagebox
-import sqlite3
-from datetime import datetime, timedelta
-from collections import defaultdict
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pandas as pd
 import calendar
 from PIL import Image, ImageTk
 
+from sql.cambios import suscribir
+from sql.fechas import hoy_dia
+from sub_menus.datos_dashboard import tablero, invalidar_tablero
+
 
 def mostrar_dashboard(parent, db_path):
     """Ventana principal del Dashboard con gráficos interactivos y filtros"""
@@ -30,56 +30,20 @@ def mostrar_dashboard(parent, db_path):
 
     # --- Funciones de Datos ---
     def cargar_datos(filtro_estatus=None, filtro_mes=None, filtro_responsable=None):
-        """Carga datos desde SQLite con filtros aplicables"""
-        conn = sqlite3.connect(db_path)
-
-        # Consulta base con todas las columnas necesarias
-        query = """SELECT id_acuerdo, acuerdo, estatus, responsables, 
-                  fecha_compromiso, fecha_registro FROM acuerdos"""
-        conditions = []
-
-        # Manejo de filtros
-        if filtro_estatus and filtro_estatus != "Todos":
-            conditions.append(f"estatus = '{filtro_estatus}'")
-
+        """Resumen de los filtros sobre la tabla de la minuta en memoria (sin consultar la base)"""
+        mes = None
         if filtro_mes and filtro_mes != "Todos":
             try:
-                month_num = list(calendar.month_name).index(filtro_mes)
-                conditions.append(f"strftime('%m', fecha_compromiso) = '{month_num:02d}'")
+                mes = list(calendar.month_name).index(filtro_mes)
             except ValueError:
                 print(f"Mes no válido: {filtro_mes}")
 
-        if filtro_responsable and filtro_responsable.strip():
-            conditions.append(f"responsables LIKE '%{filtro_responsable}%'")
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        # Debug: imprimir la consulta SQL
-        print("Ejecutando consulta:", query)
-
-        try:
-            df = pd.read_sql_query(query, conn)
-
-            # Debug: verificar datos obtenidos
-            print(f"Datos obtenidos: {len(df)} registros")
-            if not df.empty:
-                print("Primer registro:", df.iloc[0].to_dict())
-
-            # Procesamiento adicional
-            if not df.empty:
-                now = pd.Timestamp.now()
-                df['fecha_compromiso'] = pd.to_datetime(df['fecha_compromiso'], errors='coerce')
-                df['dias_atraso'] = (now - df['fecha_compromiso']).dt.days
-                df['dias_atraso'] = df['dias_atraso'].apply(lambda x: x if x > 0 and pd.notna(x) else 0)
-
-            return df
-
-        except Exception as e:
-            print(f"Error al cargar datos: {e}")
-            return pd.DataFrame()
-        finally:
-            conn.close()
+        return tablero(db_path).resumen(
+            hoy_dia(),
+            estatus=filtro_estatus if filtro_estatus != "Todos" else None,
+            mes=mes,
+            responsable=filtro_responsable
+        )
 
     # --- Componentes del Dashboard ---
     def crear_tarjeta_metrica(contenedor, titulo, valor, color):
@@ -97,34 +61,31 @@ def mostrar_dashboard(parent, db_path):
     def actualizar_graficos():
         """Actualiza todos los componentes del dashboard"""
         try:
-            df = cargar_datos(
+            resumen = cargar_datos(
                 filtro_estatus=combo_estatus.get(),
                 filtro_mes=combo_mes.get(),
                 filtro_responsable=entry_responsable.get()
             )
 
-            # Debug: Mostrar consulta y cantidad de datos
-            print(f"Datos cargados: {len(df)} registros")
-
             # Actualizar componentes visuales
-            actualizar_tarjetas(df)
-            actualizar_grafico_barras(df)
-            actualizar_grafico_torta(df)
-            actualizar_grafico_evolucion(df)
-            actualizar_tabla(df)
+            actualizar_tarjetas(resumen)
+            actualizar_grafico_barras(resumen)
+            actualizar_grafico_torta(resumen)
+            actualizar_grafico_evolucion(resumen)
+            actualizar_tabla(resumen)
 
         except Exception as e:
             messagebox.showerror("Error", f"Ocurrió un error, no hay registros...")
             print(f"Error completo: {e}")
 
-    def actualizar_tarjetas(df):
+    def actualizar_tarjetas(resumen):
         """Actualiza las tarjetas de métricas"""
         for widget in frame_tarjetas.winfo_children():
             widget.destroy()
 
-        total_acuerdos = len(df)
-        atrasados = len(df[df['dias_atraso'] > 0])
-        cerrados = len(df[df['estatus'] == 'Cerrado'])
+        total_acuerdos = resumen.total
+        atrasados = resumen.atrasados
+        cerrados = resumen.cerrados
         cumplimiento = f"{(cerrados / total_acuerdos * 100):.1f}%" if total_acuerdos > 0 else "0%"
 
         crear_tarjeta_metrica(frame_tarjetas, "📋 Total Acuerdos", total_acuerdos, "#3498db")
@@ -132,10 +93,10 @@ def mostrar_dashboard(parent, db_path):
         crear_tarjeta_metrica(frame_tarjetas, "✅ Cerrados", cerrados, "#2ecc71")
         crear_tarjeta_metrica(frame_tarjetas, "📈 % Cumplimiento", cumplimiento, "#9b59b6")
 
-    def actualizar_grafico_barras(df):
+    def actualizar_grafico_barras(resumen):
         """Gráfico de barras por estatus"""
         fig, ax = plt.subplots(figsize=(6, 3))
-        counts = df['estatus'].value_counts()
+        counts = resumen.por_estatus
 
         if not counts.empty:
             counts.plot(kind='bar', ax=ax, color=['#3498db', '#2ecc71', '#e74c3c'])
@@ -152,11 +113,10 @@ def mostrar_dashboard(parent, db_path):
         canvas.get_tk_widget().pack(fill="both", expand=True)
         plt.close(fig)
 
-    def actualizar_grafico_torta(df):
+    def actualizar_grafico_torta(resumen):
         """Gráfico de torta de responsables"""
         fig, ax = plt.subplots(figsize=(6, 3))
-        responsables = df['responsables'].str.split(',').explode().str.strip()
-        counts = responsables.value_counts().head(5)
+        counts = resumen.top_responsables
 
         if not counts.empty:
             counts.plot(kind='pie', ax=ax, autopct='%1.1f%%')
@@ -173,11 +133,10 @@ def mostrar_dashboard(parent, db_path):
         canvas.get_tk_widget().pack(fill="both", expand=True)
         plt.close(fig)
 
-    def actualizar_grafico_evolucion(df):
+    def actualizar_grafico_evolucion(resumen):
         """Gráfico de evolución temporal"""
         fig, ax = plt.subplots(figsize=(8, 3))
-        df['fecha_registro'] = pd.to_datetime(df['fecha_registro'])
-        df_resumen = df.groupby(df['fecha_registro'].dt.to_period('M')).size()
+        df_resumen = resumen.por_mes
 
         if not df_resumen.empty:
             df_resumen.plot(ax=ax, marker='o', color='#9b59b6')
@@ -194,45 +153,19 @@ def mostrar_dashboard(parent, db_path):
         canvas.get_tk_widget().pack(fill="both", expand=True)
         plt.close(fig)
 
-    def actualizar_tabla(df):
+    def actualizar_tabla(resumen):
         """Actualiza la tabla con los acuerdos"""
         for row in tabla.get_children():
             tabla.delete(row)
 
-        if df.empty:
+        if not resumen.tabla:
             # Mostrar mensaje cuando no hay datos
             tabla.insert("", "end", values=("No hay datos con los filtros actuales", "", "", "", "", ""))
             return
 
-        try:
-            # Ordenar por días de atraso (mayor primero)
-            df_sorted = df.sort_values('dias_atraso', ascending=False)
-
-            # Insertar datos en la tabla
-            for _, row in df_sorted.head(20).iterrows():  # Mostrar solo los primeros 20
-                estado = "⚠️ Atrasado" if row['dias_atraso'] > 0 else "✅ Al día"
-                acuerdo = str(row['acuerdo'])[:50] + "..." if len(str(row['acuerdo'])) > 50 else row['acuerdo']
-
-                # Manejar posibles valores nulos en fecha_compromiso
-                fecha_comp = row['fecha_compromiso']
-                if pd.isna(fecha_comp):
-                    fecha_str = ""
-                elif isinstance(fecha_comp, str):
-                    fecha_str = fecha_comp
-                else:
-                    fecha_str = fecha_comp.strftime('%Y-%m-%d')
-
-                tabla.insert("", "end", values=(
-                    row.get('id_acuerdo', ''),
-                    acuerdo,
-                    row.get('responsables', ''),
-                    fecha_str,
-                    estado,
-                    f"{row['dias_atraso']} días" if row['dias_atraso'] > 0 else "-"
-                ))
-        except Exception as e:
-            print(f"Error al actualizar tabla: {e}")
-            tabla.insert("", "end", values=("Error al cargar datos", "", "", "", "", ""))
+        # Filas ya ordenadas por días de atraso (mayor primero) y formateadas
+        for valores in resumen.tabla:
+            tabla.insert("", "end", values=valores)
 
     frame_filtros = ttk.Frame(dashboard, padding=10)
     frame_filtros.pack(fill="x", pady=5)
@@ -260,6 +193,10 @@ def mostrar_dashboard(parent, db_path):
     btn_aplicar = ttk.Button(frame_filtros, text="Aplicar Filtros", command=actualizar_graficos)
     btn_aplicar.grid(row=0, column=7, padx=10)
 
+    # Filtrar ya no consulta la base: los combos se aplican al elegir
+    combo_estatus.bind("<<ComboboxSelected>>", lambda event: actualizar_graficos())
+    combo_mes.bind("<<ComboboxSelected>>", lambda event: actualizar_graficos())
+
     # Frame de Tarjetas
     frame_tarjetas = ttk.Frame(dashboard)
     frame_tarjetas.pack(fill="x", pady=10)
@@ -315,6 +252,9 @@ def mostrar_dashboard(parent, db_path):
     style.configure("Treeview", font=('Helvetica', 9), rowheight=25)
     style.map("Treeview", background=[('selected', '#347083')])
 
+    # Si la minuta cambia se vuelve a leer y se redibuja con los filtros actuales
+    suscribir(dashboard, db_path, lambda: [invalidar_tablero(db_path), actualizar_graficos()])
+
     # Carga inicial
     actualizar_graficos()
 
@@ -0,0 +1,145 @@
+# sub_menus/datos_dashboard.py
+"""Datos del dashboard: una tabla base por minuta en memoria y resúmenes por filtro.
+
+El dashboard leía la tabla completa con una consulta armada con f-strings en cada
+cambio de filtro y calculaba los días de atraso fila por fila. Ahora la minuta se
+lee una vez (AcuerdosRepository.filas_tablero, sin valores del usuario en el SQL)
+a columnas NumPy y categóricas; cada filtro es una máscara booleana y los conteos
+salen de np.bincount sobre los códigos de las categorías. El resumen de cada
+combinación de filtros se conserva hasta que la minuta cambia.
+"""
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from sql.cache import CacheTTL
+from sql.repositorio import AcuerdosRepository
+
+TTL_TABLERO = 300       # Vigencia de la tabla base si nadie avisa de un cambio
+FILAS_TABLA = 20        # Acuerdos más atrasados que se muestran en la tabla
+TOP_RESPONSABLES = 5
+
+# Tabla base por minuta; la invalida el aviso de cambios de la ventana (sql/cambios.py)
+_cache_tablero = CacheTTL()
+
+
+def invalidar_tablero(db_path=None):
+    """Descarta la tabla base de la minuta (se vuelve a leer en el siguiente resumen)"""
+    _cache_tablero.invalidar(db_path)
+
+
+class ResumenTablero(NamedTuple):
+    total: int
+    atrasados: int
+    cerrados: int
+    por_estatus: pd.Series        # acuerdos por estatus, de mayor a menor
+    top_responsables: pd.Series   # acuerdos por responsable (los TOP_RESPONSABLES primeros)
+    por_mes: pd.Series            # acuerdos registrados por mes (PeriodIndex)
+    tabla: list                   # filas (id, acuerdo, responsables, fecha, estado, días) más atrasadas
+
+
+class Tablero:
+    """Acuerdos de una minuta en columnas NumPy, con resúmenes por filtro"""
+
+    def __init__(self, filas):
+        acuerdos = list(zip(*filas.acuerdos)) or [()] * 7
+        ids, self.id_acuerdo, self.acuerdo, estatus, responsables, compromiso, registro = acuerdos
+        ids = np.asarray(ids, dtype=np.int64)
+        self.id_acuerdo = np.asarray(self.id_acuerdo, dtype=object)
+        self.acuerdo = np.asarray(self.acuerdo, dtype=object)
+        self.estatus = pd.Categorical(estatus)
+        self.responsables = pd.Categorical(responsables)
+
+        # Días desde 1970 del compromiso (NaN si no es fecha) y su mes (0 si no hay)
+        self.compromiso_dia = np.array([np.nan if d is None else d for d in compromiso], dtype=np.float64)
+        validas = ~np.isnan(self.compromiso_dia)
+        self.mes_compromiso = np.zeros(len(ids), dtype=np.int8)
+        self.mes_compromiso[validas] = (
+            self.compromiso_dia[validas].astype("datetime64[D]").astype("datetime64[M]").astype(np.int64) % 12 + 1)
+
+        # Mes de registro (NaT si no es fecha)
+        registro = np.array([np.iinfo(np.int64).min if s is None else s for s in registro], dtype=np.int64)
+        self.mes_registro = registro.astype("datetime64[s]").astype("datetime64[M]")
+
+        # Pares (fila, responsable) para contar acuerdos por persona sin separar cadenas
+        pares = list(zip(*filas.responsables)) or [(), ()]
+        self.pares_fila = np.searchsorted(ids, np.asarray(pares[0], dtype=np.int64))
+        personas = pd.Categorical(pares[1])
+        self.personas, self.pares_persona = personas.categories, personas.codes
+
+        self._resumenes = {}
+
+    def __len__(self):
+        return len(self.id_acuerdo)
+
+    def mascara(self, estatus=None, mes=None, responsable=None):
+        """Filas que cumplen los filtros (None o vacío: sin filtro)"""
+        mascara = np.ones(len(self), dtype=bool)
+        if estatus:
+            categorias = self.estatus.categories
+            if estatus not in categorias:
+                return mascara & False
+            mascara &= self.estatus.codes == categorias.get_loc(estatus)
+        if mes:
+            mascara &= self.mes_compromiso == mes
+        if responsable and responsable.strip():
+            # Se busca en las cadenas distintas de responsables, no en cada fila
+            coinciden = np.asarray(self.responsables.categories.str.contains(responsable, case=False, regex=False),
+                                   dtype=bool)
+            mascara &= np.append(coinciden, False)[self.responsables.codes]  # Código -1 (NULL): no coincide
+        return mascara
+
+    def dias_atraso(self, hoy):
+        """Días de atraso de cada fila al día hoy (0 si está al día o no tiene fecha)"""
+        return np.nan_to_num(np.maximum(hoy - self.compromiso_dia, 0)).astype(np.int64)
+
+    def resumen(self, hoy, estatus=None, mes=None, responsable=None):
+        """ResumenTablero de los filtros al día hoy (calculado una vez por combinación)"""
+        clave = (hoy, estatus or None, mes or None, responsable if responsable and responsable.strip() else None)
+        if clave not in self._resumenes:
+            self._resumenes[clave] = self._resumir(self.mascara(estatus, mes, responsable), hoy)
+        return self._resumenes[clave]
+
+    @staticmethod
+    def _conteo(codigos, categorias):
+        """Filas por categoría (sin ceros), de mayor a menor"""
+        conteo = pd.Series(np.bincount(codigos[codigos >= 0], minlength=len(categorias)), index=categorias)
+        return conteo[conteo > 0].sort_values(ascending=False, kind="stable")
+
+    def _resumir(self, mascara, hoy):
+        filas = np.flatnonzero(mascara)
+        dias = self.dias_atraso(hoy)[filas]
+        codigos_estatus = self.estatus.codes[filas]
+
+        por_estatus = self._conteo(codigos_estatus, self.estatus.categories)
+        cerrados = int(por_estatus.get("Cerrado", 0))
+        top = self._conteo(self.pares_persona[mascara[self.pares_fila]], self.personas).head(TOP_RESPONSABLES)
+
+        meses = self.mes_registro[filas]
+        meses, cuentas = np.unique(meses[~np.isnat(meses)], return_counts=True)
+        por_mes = pd.Series(cuentas, index=pd.DatetimeIndex(meses).to_period("M"))
+
+        # Los más atrasados primero (orden estable, como sort_values)
+        tabla = []
+        for posicion in np.argsort(-dias, kind="stable")[:FILAS_TABLA]:
+            fila, atraso = filas[posicion], int(dias[posicion])
+            acuerdo = str(self.acuerdo[fila])
+            dia = self.compromiso_dia[fila]
+            tabla.append((
+                self.id_acuerdo[fila],
+                acuerdo[:50] + "..." if len(acuerdo) > 50 else acuerdo,
+                self.responsables[fila] if self.responsables.codes[fila] >= 0 else "",
+                "" if np.isnan(dia) else str(np.datetime64(int(dia), "D")),
+                "⚠️ Atrasado" if atraso > 0 else "✅ Al día",
+                f"{atraso} días" if atraso > 0 else "-",
+            ))
+
+        return ResumenTablero(len(filas), int(np.count_nonzero(dias > 0)), cerrados,
+                              por_estatus, top, por_mes, tabla)
+
+
+def tablero(db_path):
+    """Tablero de la minuta: se lee una vez y se conserva hasta que la minuta cambia"""
+    return _cache_tablero.obtener(db_path, "tablero", TTL_TABLERO,
+                                  lambda: Tablero(AcuerdosRepository(db_path).filas_tablero()))
@@ -1,9 +1,17 @@
 # sub_menus/historial.py
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
-import sqlite3
-from difflib import SequenceMatcher
+from acuerdos.ventana_names import move_to_largest_monitor
+from sql.repositorio import AcuerdosRepository, FiltrosAcuerdos, invalidar_cache_historial
+from sql.ejecutor import en_segundo_plano
+from sql.cambios import suscribir
+from acuerdos.lista_virtual import ListaVirtual, formateada, actualizar_lista
+from acuerdos.formato_fechas import fecha_corta, fecha_hora_corta
+from acuerdos.diff_historial import MODIFICADO, cambios_desde_mascara, comparar_versiones, diferencia_texto
+
+COLUMNAS_DIFF = (3, 4)  # acuerdo y responsables: se muestran con [-borrado][+agregado]
+# Columna de la base que muestra cada columna del historial_tree (para la máscara de cambios)
+CAMPOS_HISTORIAL = (None, None, "estatus", "acuerdo", "responsables", "fecha_compromiso")
 
 
 class HistorialAcuerdos:
@@ -18,9 +26,15 @@ class HistorialAcuerdos:
 
         self.current_version = None
         self.previous_versions = []
+        self.versiones = []  # (values, tags) del historial mostrado, de la más reciente a la más antigua
+        self.mascaras = []   # (cambios, delta) de cada versión; None en la vigente
+        self.orden = "recientes"  # Orden de la lista (ver ORDENES_ACUERDOS)
         self.create_ui()
         self.load_acuerdos()
         self.center_window()
+        # Los cambios de otros usuarios se parchan en la lista sin recargarla
+        suscribir(self.acuerdos_tree, self.db_path, lambda: [invalidar_cache_historial(self.db_path),
+                                                             actualizar_lista(self.acuerdos_tree)])
 
         self.setup_bindings()
 
@@ -29,10 +43,8 @@ class HistorialAcuerdos:
         """Configura los eventos del Treeview"""
         self.acuerdos_tree.bind("<Double-1>", self.on_double_click)
 
-from acuerdos.ventana_names import move_to_largest_monitor
-
     def center_window(self):
-        move_to_largest_monitor(self)
+        move_to_largest_monitor(self.window)
 
     def create_ui(self):
         # Crear ventana principal con estilo consistente
@@ -176,132 +188,54 @@ from acuerdos.ventana_names import move_to_largest_monitor
             pass
 
     def highlight_changes(self, selected_index):
-        """Resalta los cambios entre la versión seleccionada y la anterior"""
-        # Limpiar tags anteriores
-        for item in self.historial_tree.get_children():
-            for col in self.historial_tree["columns"]:
-                self.historial_tree.set(item, col, self.historial_tree.set(item, col))
+        """Resalta los cambios entre la versión seleccionada y la anterior.
 
-        # No hay nada que comparar si solo hay un item
-        if len(self.historial_tree.get_children()) <= 1:
-            return
-
-        # Obtener items a comparar
+        Lo que cambió sale de la máscara guardada al escribir (o, en filas
+        antiguas sin ella, de comparar las filas leídas) y se aplica al Treeview
+        en una sola pasada, restaurando el resto de las versiones.
+        """
         items = self.historial_tree.get_children()
-        current_item = items[selected_index]
-        previous_item = items[selected_index + 1] if selected_index + 1 < len(items) else None
-
-        if not previous_item:
+        if len(items) != len(self.versiones):
             return
 
-        # Comparar cada campo
-        for col in self.historial_tree["columns"]:
-            current_val = self.historial_tree.set(current_item, col)
-            previous_val = self.historial_tree.set(previous_item, col)
-
-            if current_val != previous_val:
-                # Determinar tipo de cambio
-                if not previous_val and current_val:
-                    # Nuevo valor (adición)
-                    self.historial_tree.set(current_item, col, current_val)
-                    self.historial_tree.item(current_item, tags=('added',))
-                elif previous_val and not current_val:
-                    # Valor eliminado
-                    self.historial_tree.set(current_item, col, current_val)
-                    self.historial_tree.item(current_item, tags=('removed',))
+        for index, (item, (values, tags)) in enumerate(zip(items, self.versiones)):
+            if index == selected_index and index + 1 < len(self.versiones):
+                anterior = self.versiones[index + 1][0]
+                mascara = self.mascaras[index + 1]
+                if mascara is not None and mascara[0] is not None:
+                    tag, cambios = cambios_desde_mascara(*mascara, CAMPOS_HISTORIAL)  # Sin comparar
                 else:
-                    # Valor modificado
-                    self.historial_tree.set(current_item, col, current_val)
-                    self.historial_tree.item(current_item, tags=('changed',))
-
-                    # Opcional: Mostrar diferencias de texto para acuerdo y responsables
-                    if col in ("acuerdo", "responsables"):
-                        diff_text = self.get_text_diff(previous_val, current_val)
-                        self.historial_tree.set(current_item, col, diff_text)
+                    tag, cambios = comparar_versiones(values, anterior)
+                if tag is not None:
+                    values, tags = list(values), (tag,)
+                    # Diferencias por palabras en acuerdo y responsables
+                    for columna in COLUMNAS_DIFF:
+                        if cambios.get(columna) == MODIFICADO:
+                            values[columna] = self.get_text_diff(str(anterior[columna]), str(values[columna]))
+            self.historial_tree.item(item, values=values, tags=tags)
 
     def get_text_diff(self, old_text, new_text):
-        """Genera una representación de las diferencias entre dos textos"""
-        matcher = SequenceMatcher(None, old_text, new_text)
-        diff_text = ""
-
-        for opcode in matcher.get_opcodes():
-            op, i1, i2, j1, j2 = opcode
-            if op == 'equal':
-                diff_text += new_text[j1:j2]
-            elif op == 'insert':
-                diff_text += f'[+{new_text[j1:j2]}]'
-            elif op == 'delete':
-                diff_text += f'[-{old_text[i1:i2]}]'
-            elif op == 'replace':
-                diff_text += f'[-{old_text[i1:i2]}][+{new_text[j1:j2]}]'
-
-        return diff_text
+        """Genera una representación de las diferencias entre dos textos (por palabras)"""
+        return diferencia_texto(old_text, new_text)
 
     def load_acuerdos(self):
-        """Carga los acuerdos principales según los filtros"""
-        # Limpiar treeview
-        for item in self.acuerdos_tree.get_children():
-            self.acuerdos_tree.delete(item)
-
-        # Construir consulta SQL con filtros
-        query = """SELECT 
-                    id_acuerdo, 
-                    acuerdo, 
-                    responsables, 
-                    fecha_estatus, 
-                    estatus,
-                    fecha_compromiso
-                   FROM acuerdos 
-                   WHERE 1=1"""
-        params = []
-
-        # Aplicar filtros
-        id_filter = self.id_filter.get()
-        if id_filter:
-            query += " AND id_acuerdo LIKE ?"
-            params.append(f"%{id_filter}%")
-
-        text_filter = self.text_filter.get()
-        if text_filter:
-            query += " AND acuerdo LIKE ?"
-            params.append(f"%{text_filter}%")
-
-        resp_filter = self.resp_filter.get()
-        if resp_filter:
-            query += " AND responsables LIKE ?"
-            params.append(f"%{resp_filter}%")
-
-        date_from = self.date_from.get()
-        date_to = self.date_to.get()
-        if date_from:
-            query += " AND fecha_estatus >= ?"
-            params.append(date_from)
-        if date_to:
-            query += " AND fecha_estatus <= ?"
-            params.append(date_to)
-
-        status = self.status_filter.get()
-        if status != "Todos":
-            query += " AND estatus = ?"
-            params.append(status)
-
-        query += " ORDER BY fecha_estatus DESC"
-
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-
-            for row in cursor.fetchall():
-                # Formatear fecha compromiso para mejor visualización
-                formatted_row = list(row)
-                if formatted_row[5]:  # Si hay fecha_compromiso
-                    formatted_row[5] = datetime.strptime(formatted_row[5], "%Y-%m-%d").strftime("%d/%m/%Y")
-                self.acuerdos_tree.insert("", "end", values=formatted_row)
-
-            conn.close()
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudieron cargar los acuerdos: {e}")
+        """Carga los acuerdos principales según los filtros (lista virtual paginada)"""
+        filtros = FiltrosAcuerdos(self.id_filter.get(), self.text_filter.get(), self.resp_filter.get(),
+                                  self.date_from.get(), self.date_to.get(), self.status_filter.get())
+        repositorio = AcuerdosRepository(self.db_path)
+
+        def formatear(acuerdo):
+            # Formatear fecha compromiso para mejor visualización
+            formatted_row = list(acuerdo[:6])
+            formatted_row[5] = fecha_corta(formatted_row[5])
+            return formatted_row, ()
+
+        orden = self.orden
+        ListaVirtual.de(self.acuerdos_tree).mostrar(
+            formateada(lambda despues, limite: repositorio.pagina_acuerdos(filtros, despues, limite, orden),
+                       formatear),
+            al_fallar=lambda e: messagebox.showerror("Error", f"No se pudieron cargar los acuerdos: {e}"),
+            cambios=formateada(lambda marca: repositorio.cambios_acuerdos(filtros, marca, orden), formatear))
 
     def load_historial(self, event):
         """Carga el historial del acuerdo seleccionado"""
@@ -318,65 +252,36 @@ from acuerdos.ventana_names import move_to_largest_monitor
         # Limpiar treeview de historial
         for item in self.historial_tree.get_children():
             self.historial_tree.delete(item)
-
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Obtener versión actual
-            cursor.execute(
-                """SELECT 
-                    fecha_estatus, 
-                    usuario_registra, 
-                    estatus,
-                    acuerdo,
-                    responsables,
-                    fecha_compromiso
-                   FROM acuerdos 
-                   WHERE id_acuerdo = ?""",
-                (id_acuerdo,)
-            )
-            current = cursor.fetchone()
-            if current:
-                # Formatear fecha compromiso
-                formatted_current = list(current)
-                if formatted_current[5]:
-                    formatted_current[5] = datetime.strptime(formatted_current[5], "%Y-%m-%d").strftime("%d/%m/%Y")
-                self.historial_tree.insert("", "end", values=formatted_current, tags=('current',))
-
-            # Obtener historial
-            cursor.execute(
-                """SELECT 
-                    fecha_modificacion, 
-                    usuario_modifico, 
-                    estatus,
-                    acuerdo,
-                    responsables,
-                    fecha_compromiso
-                   FROM historial_acuerdos 
-                   WHERE id_acuerdo = ? 
-                   ORDER BY fecha_modificacion DESC""",
-                (id_acuerdo,)
-            )
-
-            for row in cursor.fetchall():
+        self.versiones = []
+        self.mascaras = []
+
+        def mostrar(datos):
+            # Versión actual (con el usuario que la registró)
+            if datos.actual:
+                formatted_current = [datos.actual.fecha, datos.usuario_registra] + list(datos.actual[2:6])
+                formatted_current[5] = fecha_corta(formatted_current[5])
+                self.versiones.append((formatted_current, ('current',)))
+                self.mascaras.append(None)
+
+            for version in datos.versiones:
                 # Formatear fechas para mejor visualización
-                formatted_row = list(row)
-                # Formatear fecha de modificación
-                formatted_row[0] = datetime.strptime(formatted_row[0], "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y %H:%M")
-                # Formatear fecha compromiso si existe
-                if formatted_row[5]:
-                    formatted_row[5] = datetime.strptime(formatted_row[5], "%Y-%m-%d").strftime("%d/%m/%Y")
-                self.historial_tree.insert("", "end", values=formatted_row)
+                formatted_row = list(version[:6])
+                formatted_row[0] = fecha_hora_corta(formatted_row[0])
+                formatted_row[5] = fecha_corta(formatted_row[5])
+                self.versiones.append((formatted_row, ()))
+                self.mascaras.append((version.cambios, version.delta))
 
-            conn.close()
+            for values, tags in self.versiones:
+                self.historial_tree.insert("", "end", values=values, tags=tags)
 
             # Resaltar diferencias automáticamente para la primera versión
             if self.historial_tree.get_children():
                 self.highlight_changes(0)
 
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo cargar el historial: {e}")
+        en_segundo_plano(
+            self.historial_tree, AcuerdosRepository(self.db_path).historial, id_acuerdo,
+            clave=("historial_versiones", str(self.historial_tree)), al_terminar=mostrar,
+            al_fallar=lambda e: messagebox.showerror("Error", f"No se pudo cargar el historial: {e}"))
 
     def apply_filters(self):
         """Aplica los filtros y recarga los acuerdos"""
@@ -393,23 +298,9 @@ from acuerdos.ventana_names import move_to_largest_monitor
         self.load_acuerdos()
 
     def sort_tree(self, column):
-        """Ordena el treeview por la columna seleccionada"""
-        items = [(self.acuerdos_tree.set(child, column), child)
-                 for child in self.acuerdos_tree.get_children("")]
-
-        try:
-            # Intentar ordenar como fecha si la columna es fecha
-            if column in ("fecha", "fecha_compromiso"):
-                items.sort(key=lambda x: datetime.strptime(x[0], "%d/%m/%Y") if x[0] else "", reverse=True)
-            elif column == "id":
-                items.sort(key=lambda x: int(x[0]) if x[0].isdigit() else 0)
-            else:
-                items.sort()
-        except:
-            items.sort()
-
-        for index, (val, child) in enumerate(items):
-            self.acuerdos_tree.move(child, "", index)
+        """Ordena la lista por la columna seleccionada (en la consulta, no solo lo visible)"""
+        self.orden = column
+        self.load_acuerdos()
 
 
 
@@ -1,7 +1,10 @@
 from common import *
+from sql.repositorio import AcuerdosRepository
+from acuerdos.lista_virtual import ListaVirtual, formateada
+from acuerdos.cache_formato import en_cache
 
 
-def mostrar_tabla_acuerdos(parent, db_path):
+def mostrar_tabla_acuerdos(parent, db_path, acuerdos=None):
     """Muestra una tabla con los acuerdos activos ordenados por fecha compromiso"""
     try:
         # Frame para contener la tabla y su título
@@ -107,9 +110,8 @@ def mostrar_tabla_acuerdos(parent, db_path):
         tree.column("responsables", width=200, minwidth=150, stretch=tk.YES)
         tree.column("comentarios", width=250, minwidth=150, stretch=tk.YES)
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(frame_tabla, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar (la conecta la lista virtual: su posición es sobre el total de acuerdos)
+        scrollbar = ttk.Scrollbar(frame_tabla, orient="vertical")
         scrollbar.pack(side="right", fill="y")
         tree.pack(side="left", fill="both", expand=True)
 
@@ -130,28 +132,17 @@ def mostrar_tabla_acuerdos(parent, db_path):
 
             return "\n".join(responsables)
 
-        # Obtener datos
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                acuerdo,
-                responsables,
-                comentarios,
-                julianday(fecha_compromiso) - julianday('now') as dias_restantes
-            FROM acuerdos
-            WHERE estatus != 'Cerrado' AND fecha_compromiso IS NOT NULL
-            ORDER BY dias_restantes ASC
-        """)
-        acuerdos = cursor.fetchall()
-        conn.close()
+        # Primera página (el menú ya la trae en su misma consulta); el resto se lee al desplazarse
+        repositorio = AcuerdosRepository(db_path)
+        if acuerdos is None:
+            acuerdos = repositorio.acuerdos_pendientes()
 
         # Calcular el ancho máximo necesario para responsables
         max_responsables_width = 150  # Valor mínimo inicial
 
-        for acuerdo in acuerdos:
-            if acuerdo[1]:  # Si hay responsables
-                formatted = formatear_responsables(acuerdo[1])
+        for acuerdo in acuerdos.filas:
+            if acuerdo.responsables:  # Si hay responsables
+                formatted = formatear_responsables(acuerdo.responsables)
                 # Calcular ancho aproximado (8px por carácter)
                 current_width = len(max(formatted.split("\n"), key=len)) * 8 + 20
                 max_responsables_width = max(max_responsables_width, current_width)
@@ -160,12 +151,13 @@ def mostrar_tabla_acuerdos(parent, db_path):
         max_responsables_width = min(max_responsables_width, 400)
         tree.column("responsables", width=max_responsables_width)
 
-        # Insertar datos con formato y colores
-        for acuerdo in acuerdos:
-            texto_acuerdo = acuerdo[0] if len(acuerdo[0]) <= 100 else acuerdo[0][:97] + "..."
-            dias_restantes = int(acuerdo[3]) if acuerdo[3] is not None else 0
-            responsables = formatear_responsables(acuerdo[1])
-            comentarios = acuerdo[2] if acuerdo[2] else "-"
+        # Formato y colores de cada fila (guardado por id y versión; los días restantes se comparan al reutilizar)
+        @en_cache(lambda acuerdo: (acuerdo.id, acuerdo.version))
+        def formatear_pendiente(acuerdo):
+            texto_acuerdo = acuerdo.acuerdo if len(acuerdo.acuerdo) <= 100 else acuerdo.acuerdo[:97] + "..."
+            dias_restantes = int(acuerdo.dias_restantes) if acuerdo.dias_restantes is not None else 0
+            responsables = formatear_responsables(acuerdo.responsables)
+            comentarios = acuerdo.comentarios if acuerdo.comentarios else "-"
 
             # Determinar etiqueta de estilo
             tags = []
@@ -174,9 +166,17 @@ def mostrar_tabla_acuerdos(parent, db_path):
             elif dias_restantes <= 3:
                 tags.append("PorVencer")
 
-            tree.insert("", "end",
-                        values=(texto_acuerdo, dias_restantes, responsables, comentarios),
-                        tags=tags)
+            return (texto_acuerdo, dias_restantes, responsables, comentarios), tags
+
+        cargar = formateada(repositorio.acuerdos_pendientes, formatear_pendiente)
+        lista = ListaVirtual.de(tree, scrollbar=scrollbar)
+
+        def refrescar(pendientes=None):
+            """Vuelve a mostrar la tabla desde el inicio (con la primera página ya leída, si se da)"""
+            primera = formateada(lambda: pendientes, formatear_pendiente)() if pendientes else None
+            lista.mostrar(cargar, primera=primera)
+
+        refrescar(acuerdos)
 
         # Función para ajustar columnas al redimensionar
         def ajustar_columnas(event):
@@ -189,6 +189,7 @@ def mostrar_tabla_acuerdos(parent, db_path):
             tree.column("comentarios", width=int(remaining_width * 0.4))
 
         tree.bind("<Configure>", ajustar_columnas)
+        return refrescar
 
     except Exception as e:
         messagebox.showerror("Error", f"No se pudo cargar la tabla de acuerdos: {str(e)}")
\ No newline at end of file
@@ -2,13 +2,14 @@ import sqlite3
 from datetime import datetime
 from time import sleep
 from rutas import MASTER
+from sql.repositorio import MasterRepository
 
 def registrar_ingreso(direccion_filtrada, path_master=MASTER, usuario_actual_windows="", max_intentos=3):
     """
     Registra el ingreso a una base de datos en el sistema maestro.
     Crea la estructura si no existe e identifica si el acceso es desde 'dbs' o 'solicitudes_acceso'.
     """
-    conn = None
+    conectado = False
     intentos = 0
     espera_base = 1
 
@@ -17,59 +18,17 @@ def registrar_ingreso(direccion_filtrada, path_master=MASTER, usuario_actual_win
             print(f"\nIntento {intentos + 1}/{max_intentos}")
             print("Conectando a MASTER.db...")
 
-            conn = sqlite3.connect(
-                path_master,
-                timeout=10,
-                check_same_thread=False
-            )
-            conn.execute("PRAGMA foreign_keys = ON")
-            cursor = conn.cursor()
-            print(" Conexión exitosa")
-
-            # Crear tabla ingresos si no existe
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS ingresos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                db_id INTEGER NOT NULL,
-                administrador TEXT,
-                esclavo TEXT,
-                db_name TEXT,
-                direccion TEXT NOT NULL,
-                fecha_de_ultimo_acceso TEXT NOT NULL,
-                tabla_origen TEXT,
-                FOREIGN KEY(db_id) REFERENCES dbs(id)
-            )
-            """)
-            print("Estructura de base de datos verificada")
+            fecha_actual = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-            # Buscar registro
+            # Buscar registro, insertar el ingreso y actualizar el último acceso
             print(f"\nBuscando dirección: {direccion_filtrada}")
-            query = """
-            SELECT dbs.id, dbs.usuario_windows, dbs.db_name, dbs.direccion,
-                   dbs.fecha_de_ultimo_acceso, solicitudes_acceso.usuario_solicitante,
-                   CASE 
-                       WHEN dbs.usuario_windows = ? THEN 'dbs'
-                       WHEN solicitudes_acceso.usuario_solicitante = ? AND solicitudes_acceso.estatus = 'aprobado' THEN 'solicitudes_acceso'
-                   END AS tabla_origen
-            FROM dbs
-            LEFT JOIN solicitudes_acceso ON 
-                dbs.id = solicitudes_acceso.db_id AND
-                solicitudes_acceso.usuario_solicitante = ? AND
-                solicitudes_acceso.estatus = 'aprobado'
-            WHERE dbs.direccion = ? 
-                AND (dbs.usuario_windows = ? 
-                     OR solicitudes_acceso.usuario_solicitante IS NOT NULL)
-            LIMIT 1;
-            """
-
-            cursor.execute(query, (
-                usuario_actual_windows, usuario_actual_windows,
-                usuario_actual_windows, direccion_filtrada,
-                usuario_actual_windows
-            ))
-            registro = cursor.fetchone()
+            acceso = MasterRepository(path_master).registrar_ingreso(
+                direccion_filtrada, usuario_actual_windows, fecha_actual
+            )
+            conectado = True
+            print(" Conexión exitosa")
 
-            if not registro:
+            if not acceso:
                 print(f"× La dirección no existe o no tiene permisos")
                 print("  Posibles causas:")
                 print("  - La dirección no está registrada en MASTER.db")
@@ -77,26 +36,7 @@ def registrar_ingreso(direccion_filtrada, path_master=MASTER, usuario_actual_win
                 print("  - El registro está marcado como 'Eliminado'")
                 return False
 
-            id_db, admin, db_name, direccion, ult_acceso, esclavo, tabla_origen = registro
-            fecha_actual = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-            # Insertar registro de ingreso
-            print("\nRegistrando acceso:")
-            cursor.execute("""
-            INSERT INTO ingresos 
-            (db_id, administrador, esclavo, db_name, direccion, fecha_de_ultimo_acceso, tabla_origen)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (id_db, admin, esclavo, db_name, direccion, fecha_actual, tabla_origen))
-
-            # Actualizar último acceso
-            cursor.execute("""
-            UPDATE dbs 
-            SET fecha_de_ultimo_acceso = ?
-            WHERE id = ?
-            """, (fecha_actual, id_db))
-
-            conn.commit()
-
+            db_name, direccion, tabla_origen = acceso.db_name, acceso.direccion, acceso.tabla_origen
             print(f"  Acceso registrado a: {db_name}")
             print(f"   - Dirección: {direccion}")
             print(f"   - Tipo de usuario: {'Administrador' if tabla_origen == 'dbs' else 'Invitado'}")
@@ -116,12 +56,10 @@ def registrar_ingreso(direccion_filtrada, path_master=MASTER, usuario_actual_win
 
         except sqlite3.Error as e:
             print(f"\n× Error de base de datos: {str(e)}")
-            if conn: conn.rollback()
             return False
 
         finally:
-            if conn:
-                conn.close()
+            if conectado:
                 print("Conexión cerrada\n" + "-" * 50)
                 from reinicio import reinicio_conexion
                 reinicio_conexion()